@@ -1,8 +1,15 @@
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 
+from django.conf import settings
+from django.db import models
+from django.db.models.functions import Substr
 from rest_framework.fields import Field, ReadOnlyField
 
-from wagtail.api.v2.serializers import PageSerializer, get_serializer_class
+from wagtail.api.v2.serializers import (
+    PageSerializer,
+    get_serializer_class,
+    set_site_root_paths,
+)
 from wagtail.api.v2.utils import get_full_url
 from wagtail.models import Page
 
@@ -14,6 +21,43 @@ def get_model_listing_url(context, model):
         return get_full_url(context["request"], url_path)
 
 
+def count_descendants(queryset, pages, depth_offset=None):
+    """
+    Counts the pages in the queryset below each of the given pages, in one query for
+    each depth that the given pages are at. If depth_offset is given, only pages that
+    many levels below are counted.
+
+    Returns a dictionary mapping each page's path to the count.
+    """
+    counts = {}
+    pages_by_depth = defaultdict(list)
+    for page in pages:
+        pages_by_depth[page.depth].append(page)
+
+    for depth, pages_at_depth in pages_by_depth.items():
+        # Filter on the path prefixes, so that the path index can be used, and only
+        # group the matching pages by the part of their path that they have in common
+        # with the given page
+        path_filter = models.Q()
+        for page in pages_at_depth:
+            path_filter |= models.Q(path__startswith=page.path)
+
+        descendants = queryset.filter(path_filter, depth__gt=depth).annotate(
+            ancestor_path=Substr("path", 1, depth * Page.steplen)
+        )
+        if depth_offset is not None:
+            descendants = descendants.filter(depth=depth + depth_offset)
+
+        counts.update(
+            descendants.order_by()
+            .values("ancestor_path")
+            .annotate(count=models.Count("pk"))
+            .values_list("ancestor_path", "count")
+        )
+
+    return counts
+
+
 class PageStatusField(Field):
     """
     Serializes the "status" field.
@@ -29,6 +73,23 @@ class PageStatusField(Field):
     def get_attribute(self, instance):
         return instance
 
+    def prepare_for_listing(self, instances):
+        # Look up the values that status_string would otherwise query for each page,
+        # using the same queryset helpers as the page explorer
+        pages = Page.objects.filter(pk__in=[page.pk for page in instances]).only("pk")
+        pages = pages.annotate_approved_schedule()
+        if getattr(settings, "WAGTAIL_WORKFLOW_ENABLED", True):
+            pages = pages.prefetch_workflow_states()
+        pages_by_pk = {page.pk: page for page in pages}
+
+        for page in instances:
+            status_page = pages_by_pk.get(page.pk)
+            if status_page is None:
+                continue
+            page._approved_schedule = status_page._approved_schedule
+            if hasattr(status_page, "_current_workflow_states"):
+                page._current_workflow_states = status_page._current_workflow_states
+
     def to_representation(self, page):
         return OrderedDict(
             [
@@ -53,10 +114,20 @@ class PageChildrenField(Field):
     def get_attribute(self, instance):
         return instance
 
+    def prepare_for_listing(self, instances):
+        self._counts = count_descendants(
+            self.context["base_queryset"], instances, depth_offset=1
+        )
+
     def to_representation(self, page):
+        if hasattr(self, "_counts"):
+            count = self._counts.get(page.path, 0)
+        else:
+            count = self.context["base_queryset"].child_of(page).count()
+
         return OrderedDict(
             [
-                ("count", self.context["base_queryset"].child_of(page).count()),
+                ("count", count),
                 (
                     "listing_url",
                     get_model_listing_url(self.context, Page)
@@ -81,10 +152,18 @@ class PageDescendantsField(Field):
     def get_attribute(self, instance):
         return instance
 
+    def prepare_for_listing(self, instances):
+        self._counts = count_descendants(self.context["base_queryset"], instances)
+
     def to_representation(self, page):
+        if hasattr(self, "_counts"):
+            count = self._counts.get(page.path, 0)
+        else:
+            count = self.context["base_queryset"].descendant_of(page).count()
+
         return OrderedDict(
             [
-                ("count", self.context["base_queryset"].descendant_of(page).count()),
+                ("count", count),
                 (
                     "listing_url",
                     get_model_listing_url(self.context, Page)
@@ -123,6 +202,28 @@ class PageAncestorsField(Field):
     def get_attribute(self, instance):
         return instance
 
+    def prepare_for_listing(self, instances):
+        # Fetch the ancestors of all of the pages at once
+        ancestor_paths = {
+            page.path[:length]
+            for page in instances
+            for length in range(Page.steplen, len(page.path), Page.steplen)
+        }
+        ancestors = {
+            ancestor.path: ancestor
+            for ancestor in Page.objects.filter(path__in=ancestor_paths)
+        }
+        set_site_root_paths(ancestors.values())
+
+        self._ancestors = {
+            page.pk: [
+                ancestors[page.path[:length]]
+                for length in range(Page.steplen, len(page.path), Page.steplen)
+                if page.path[:length] in ancestors
+            ]
+            for page in instances
+        }
+
     def to_representation(self, page):
         serializer_class = get_serializer_class(
             Page,
@@ -131,6 +232,10 @@ class PageAncestorsField(Field):
             base=AdminPageSerializer,
         )
         serializer = serializer_class(context=self.context, many=True)
+
+        if hasattr(self, "_ancestors"):
+            return serializer.to_representation(self._ancestors[page.pk])
+
         return serializer.to_representation(page.get_ancestors())
 
 
@@ -164,6 +269,19 @@ class PageTranslationsField(Field):
     def get_attribute(self, instance):
         return instance
 
+    def prepare_for_listing(self, instances):
+        # Fetch the translations of all of the pages at once
+        translations = list(
+            Page.objects.filter(
+                translation_key__in={page.translation_key for page in instances}
+            ).select_related("locale")
+        )
+        set_site_root_paths(translations)
+
+        self._translations = defaultdict(list)
+        for translation in translations:
+            self._translations[translation.translation_key].append(translation)
+
     def to_representation(self, page):
         serializer_class = get_serializer_class(
             Page,
@@ -180,6 +298,16 @@ class PageTranslationsField(Field):
             base=AdminPageSerializer,
         )
         serializer = serializer_class(context=self.context, many=True)
+
+        if hasattr(self, "_translations"):
+            return serializer.to_representation(
+                [
+                    translation
+                    for translation in self._translations[page.translation_key]
+                    if translation.pk != page.pk
+                ]
+            )
+
         return serializer.to_representation(page.get_translations())
 
 
@@ -26,6 +26,10 @@ class PagesAdminAPIViewSet(PagesAPIViewSet):
     base_serializer_class = AdminPageSerializer
     authentication_classes = [SessionAuthentication]
 
+    # Responses depend on the user's permissions
+    conditional_requests = False
+    cache_responses = False
+
     actions = {
         "convert_alias": ConvertAliasPageAPIAction,
         "copy": CopyPageAPIAction,
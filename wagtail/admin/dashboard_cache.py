@@ -0,0 +1,114 @@
+"""
+An optional cache of the rendered dashboard panels, enabled by setting
+``WAGTAILADMIN_DASHBOARD_CACHE`` to the name of one of the project's caches.
+
+Panels are cached for each user for a short time (``WAGTAILADMIN_DASHBOARD_CACHE_TIMEOUT``
+seconds). The cache keys also include a generation value, which is changed whenever a
+revision is saved, a workflow or task changes state, or a page is locked, unlocked,
+published, unpublished, moved or deleted, so that no panel is shown out of date for
+longer than it takes to render it again.
+"""
+import hashlib
+import uuid
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils import translation
+
+from wagtail.signals import (
+    page_published,
+    page_unpublished,
+    post_page_move,
+    task_approved,
+    task_cancelled,
+    task_rejected,
+    task_submitted,
+    workflow_approved,
+    workflow_cancelled,
+    workflow_rejected,
+    workflow_submitted,
+)
+
+GENERATION_CACHE_KEY = "wagtailadmin:dashboard:generation"
+DEFAULT_TIMEOUT = 60
+
+
+def get_dashboard_cache():
+    alias = getattr(settings, "WAGTAILADMIN_DASHBOARD_CACHE", None)
+    if alias:
+        return caches[alias]
+
+
+def get_dashboard_cache_timeout():
+    return getattr(settings, "WAGTAILADMIN_DASHBOARD_CACHE_TIMEOUT", DEFAULT_TIMEOUT)
+
+
+def get_cache_key(cache, panel_name, request):
+    generation = cache.get(GENERATION_CACHE_KEY)
+    if generation is None:
+        generation = uuid.uuid4().hex
+        cache.set(GENERATION_CACHE_KEY, generation, None)
+
+    # Panels include forms, so they are also cached per CSRF cookie to keep their
+    # CSRF tokens valid
+    signature = (
+        generation,
+        panel_name,
+        request.user.pk,
+        request.META.get("CSRF_COOKIE"),
+        translation.get_language(),
+    )
+    return (
+        "wagtailadmin:dashboard:"
+        + hashlib.sha1(repr(signature).encode("utf-8")).hexdigest()
+    )
+
+
+def _bump_generation():
+    cache = get_dashboard_cache()
+    if cache is not None:
+        cache.set(GENERATION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def invalidate_dashboard_cache():
+    if get_dashboard_cache() is not None:
+        transaction.on_commit(_bump_generation)
+
+
+def dashboard_changed_signal_handler(**kwargs):
+    invalidate_dashboard_cache()
+
+
+def page_saved_signal_handler(update_fields=None, **kwargs):
+    # Pages are locked and unlocked by saving just the lock fields
+    if update_fields is not None and "locked" in update_fields:
+        invalidate_dashboard_cache()
+
+
+def register_signal_handlers():
+    from wagtail.models import Page, Revision
+
+    post_save.connect(dashboard_changed_signal_handler, sender=Revision)
+
+    for model in apps.get_models():
+        if issubclass(model, Page):
+            post_save.connect(page_saved_signal_handler, sender=model)
+            post_delete.connect(dashboard_changed_signal_handler, sender=model)
+
+    for signal in [
+        page_published,
+        page_unpublished,
+        post_page_move,
+        workflow_submitted,
+        workflow_approved,
+        workflow_rejected,
+        workflow_cancelled,
+        task_submitted,
+        task_approved,
+        task_rejected,
+        task_cancelled,
+    ]:
+        signal.connect(dashboard_changed_signal_handler)
@@ -0,0 +1,206 @@
+"""
+Background spreadsheet exports, used by ``SpreadsheetExportMixin`` for exports of more
+than ``WAGTAILADMIN_EXPORT_JOB_THRESHOLD`` items.
+
+An ``ExportJob`` records the URL of the export request. The process_export_jobs
+management command repeats the request on behalf of the user who made it, so that it
+goes through the same permission checks and filters, then saves the response to
+storage and emails the user a link to download it.
+"""
+import logging
+import tempfile
+from datetime import timedelta
+from importlib import import_module
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.messages.storage import default_storage as default_message_storage
+from django.core.files import File
+from django.db.models import F, Q
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+from django.utils import timezone
+
+from wagtail.admin.mail import send_mail
+from wagtail.admin.utils import get_admin_base_url
+
+logger = logging.getLogger("wagtail.admin")
+
+# The number of days to keep export jobs, and their files, for
+DEFAULT_MAX_AGE = 7
+
+# The number of minutes after which a running job is assumed to have been abandoned
+# (for example, because the process running it was killed), and is run again
+DEFAULT_RUNNING_TIMEOUT = 60
+
+# The number of times to start a job before giving up on it
+MAX_ATTEMPTS = 3
+
+
+def get_export_request(job):
+    """
+    Return a request for the job's export URL, made by the job's user.
+    """
+    url = urlsplit(job.url)
+    request = RequestFactory().get(
+        url.path + ("?" + url.query if url.query else ""),
+        secure=url.scheme == "https",
+        HTTP_HOST=url.netloc,
+    )
+    request.user = job.user
+    request.session = import_module(settings.SESSION_ENGINE).SessionStore()
+    request._messages = default_message_storage(request)
+    # Tells SpreadsheetExportMixin to write the file rather than queue another job
+    request.export_job = job
+    return request
+
+
+def get_download_url(job):
+    base_url = get_admin_base_url()
+    if not base_url:
+        url = urlsplit(job.url)
+        base_url = url.scheme + "://" + url.netloc
+
+    return base_url + reverse("wagtailadmin_export_job_download", args=(job.pk,))
+
+
+def send_export_job_notification(job):
+    if not job.user.email:
+        return
+
+    context = {
+        "job": job,
+        "user": job.user,
+        "download_url": get_download_url(job),
+    }
+    subject = render_to_string(
+        "wagtailadmin/notifications/export_job_subject.txt", context
+    )
+    message = render_to_string("wagtailadmin/notifications/export_job.txt", context)
+    send_mail(subject.strip(), message, [job.user.email])
+
+
+def run_export_job(job):
+    """
+    Write the file for an export job, and notify its user.
+    """
+    from wagtail.admin.models import ExportJob
+
+    request = get_export_request(job)
+    try:
+        match = resolve(request.path_info)
+        response = match.func(request, *match.args, **match.kwargs)
+        if response.status_code != 200:
+            raise ValueError(
+                "Export request returned a %d response" % response.status_code
+            )
+
+        with tempfile.TemporaryFile() as output:
+            if response.streaming:
+                for chunk in response.streaming_content:
+                    output.write(chunk)
+            else:
+                output.write(response.content)
+            response.close()
+
+            output.seek(0)
+            job.file.save(job.filename, File(output), save=False)
+    except Exception:
+        logger.exception("Export job %d (%s) failed", job.pk, job.url)
+        job.status = ExportJob.STATUS_FAILED
+    else:
+        job.status = ExportJob.STATUS_COMPLETED
+
+    job.completed_at = timezone.now()
+    job.save(update_fields=["file", "status", "completed_at"])
+    send_export_job_notification(job)
+
+
+def delete_export_job(job):
+    if job.file:
+        job.file.delete(save=False)
+    job.delete()
+
+
+def reclaim_abandoned_jobs(running_timeout=DEFAULT_RUNNING_TIMEOUT):
+    """
+    Return the jobs that have been running for more than running_timeout minutes to
+    the queue, or mark them as failed if they have been started MAX_ATTEMPTS times.
+
+    Returns the number of jobs that failed.
+    """
+    from wagtail.admin.models import ExportJob
+
+    abandoned_jobs = ExportJob.objects.filter(
+        Q(started_at__lt=timezone.now() - timedelta(minutes=running_timeout))
+        | Q(started_at__isnull=True),
+        status=ExportJob.STATUS_RUNNING,
+    )
+
+    abandoned_jobs.filter(attempts__lt=MAX_ATTEMPTS).update(
+        status=ExportJob.STATUS_PENDING
+    )
+
+    failed = 0
+    for job in abandoned_jobs.select_related("user"):
+        # Only mark the job as failed if no other process has done so first
+        if ExportJob.objects.filter(pk=job.pk, status=ExportJob.STATUS_RUNNING).update(
+            status=ExportJob.STATUS_FAILED, completed_at=timezone.now()
+        ):
+            logger.error(
+                "Export job %d (%s) failed after %d attempts",
+                job.pk,
+                job.url,
+                job.attempts,
+            )
+            job.status = ExportJob.STATUS_FAILED
+            send_export_job_notification(job)
+            failed += 1
+
+    return failed
+
+
+def process_export_jobs(
+    max_age=DEFAULT_MAX_AGE, running_timeout=DEFAULT_RUNNING_TIMEOUT
+):
+    """
+    Run all pending export jobs, and delete the jobs (and files) that are older than
+    max_age days. Jobs that have been running for more than running_timeout minutes
+    are run again, or fail after MAX_ATTEMPTS attempts.
+
+    Returns a dict of statistics: the numbers of jobs ``completed``, ``failed`` and
+    ``deleted``.
+    """
+    from wagtail.admin.models import ExportJob
+
+    stats = {"completed": 0, "failed": 0, "deleted": 0}
+    stats["failed"] += reclaim_abandoned_jobs(running_timeout)
+
+    for job in ExportJob.objects.filter(
+        created_at__lt=timezone.now() - timedelta(days=max_age)
+    ).exclude(status=ExportJob.STATUS_RUNNING):
+        delete_export_job(job)
+        stats["deleted"] += 1
+
+    pending_job_ids = list(
+        ExportJob.objects.filter(status=ExportJob.STATUS_PENDING)
+        .order_by("created_at", "pk")
+        .values_list("pk", flat=True)
+    )
+    for job_id in pending_job_ids:
+        # Claim the job first, in case another process is running jobs at the same time
+        if not ExportJob.objects.filter(
+            pk=job_id, status=ExportJob.STATUS_PENDING
+        ).update(
+            status=ExportJob.STATUS_RUNNING,
+            started_at=timezone.now(),
+            attempts=F("attempts") + 1,
+        ):
+            continue
+
+        job = ExportJob.objects.select_related("user").get(pk=job_id)
+        run_export_job(job)
+        stats[job.status] += 1
+
+    return stats
@@ -0,0 +1,46 @@
+from wagtail.admin.export_jobs import (
+    DEFAULT_MAX_AGE,
+    DEFAULT_RUNNING_TIMEOUT,
+    logger,
+    process_export_jobs,
+)
+from wagtail.management.base import QueueProcessingCommand
+
+
+class Command(QueueProcessingCommand):
+    help = "Write the spreadsheet exports queued with WAGTAILADMIN_EXPORT_JOB_THRESHOLD, and delete old exports."
+
+    queued_items_name = "export jobs"
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--max-age",
+            type=int,
+            default=DEFAULT_MAX_AGE,
+            help="Number of days to keep exported files for (default: %d)"
+            % DEFAULT_MAX_AGE,
+        )
+        parser.add_argument(
+            "--running-timeout",
+            type=int,
+            default=DEFAULT_RUNNING_TIMEOUT,
+            help="Number of minutes after which a running export is assumed to have been abandoned, and is run again (default: %d)"
+            % DEFAULT_RUNNING_TIMEOUT,
+        )
+
+    def process_batch(self, max_age, running_timeout, **options):
+        stats = process_export_jobs(max_age=max_age, running_timeout=running_timeout)
+        stats["entries"] = stats["completed"] + stats["failed"]
+        if stats["entries"]:
+            logger.info(
+                "Processed export jobs: %(completed)d completed, %(failed)d failed",
+                stats,
+            )
+        return stats
+
+    def get_summary(self, totals):
+        return (
+            "%(completed)d export job(s) completed, %(failed)d failed, "
+            "%(deleted)d deleted" % totals
+        )
@@ -0,0 +1,118 @@
+# Generated by Django 4.0.10 on 2026-10-16 11:42
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def populate_recent_edits(apps, schema_editor):
+    Revision = apps.get_model("wagtailcore.Revision")
+    RecentEdit = apps.get_model("wagtailadmin.RecentEdit")
+
+    # Revisions are created in order, so the latest revision of each object by each
+    # user is the one with the highest id
+    latest_revision_ids = (
+        Revision.objects.filter(user__isnull=False)
+        .values("user_id", "base_content_type_id", "object_id")
+        .annotate(latest_id=models.Max("id"))
+        .values_list("latest_id", flat=True)
+        .order_by()
+    )
+
+    def create_recent_edits(revision_ids):
+        RecentEdit.objects.bulk_create(
+            [
+                RecentEdit(
+                    user_id=revision.user_id,
+                    base_content_type_id=revision.base_content_type_id,
+                    object_id=revision.object_id,
+                    revision_id=revision.pk,
+                    created_at=revision.created_at,
+                )
+                for revision in Revision.objects.filter(pk__in=revision_ids).only(
+                    "user_id", "base_content_type_id", "object_id", "created_at"
+                )
+            ]
+        )
+
+    batch = []
+    for revision_id in latest_revision_ids.iterator():
+        batch.append(revision_id)
+        if len(batch) >= BATCH_SIZE:
+            create_recent_edits(batch)
+            batch = []
+    if batch:
+        create_recent_edits(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("wagtailcore", "0084_pendingreferenceindexupdate"),
+        ("wagtailadmin", "0004_exportjob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RecentEdit",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "object_id",
+                    models.CharField(max_length=255, verbose_name="object id"),
+                ),
+                ("created_at", models.DateTimeField(verbose_name="created at")),
+                (
+                    "base_content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+                (
+                    "revision",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="wagtailcore.revision",
+                        verbose_name="revision",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="user",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "recent edit",
+                "verbose_name_plural": "recent edits",
+                "unique_together": {("user", "base_content_type", "object_id")},
+            },
+        ),
+        migrations.AddIndex(
+            model_name="recentedit",
+            index=models.Index(
+                fields=["user", "base_content_type", "-created_at"],
+                name="recent_edit_user_idx",
+            ),
+        ),
+        migrations.RunPython(populate_recent_edits, migrations.RunPython.noop),
+    ]
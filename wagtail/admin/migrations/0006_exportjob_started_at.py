@@ -0,0 +1,25 @@
+# Generated by Django 4.0.10 on 2026-10-17 00:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wagtailadmin", "0005_recentedit"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exportjob",
+            name="attempts",
+            field=models.PositiveIntegerField(default=0, verbose_name="attempts"),
+        ),
+        migrations.AddField(
+            model_name="exportjob",
+            name="started_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="started at"
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.0.10 on 2026-10-17 01:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wagtailcore", "0084_pendingreferenceindexupdate"),
+        ("wagtailadmin", "0006_exportjob_started_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="recentedit",
+            name="revision",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="wagtailcore.revision",
+                verbose_name="revision",
+            ),
+        ),
+    ]
@@ -1,5 +1,8 @@
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.db import models
 from django.db.models import Count, Model
+from django.utils.translation import gettext_lazy as _
 from modelcluster.fields import ParentalKey
 from taggit.models import Tag
 
@@ -8,7 +11,7 @@ from taggit.models import Tag
 # wagtail.admin.models ensures that this happens in advance of running wagtail.admin's
 # system checks.
 from wagtail.admin import panels  # NOQA
-from wagtail.models import Page
+from wagtail.models import Page, Revision
 
 
 # A dummy model that exists purely to attach the access_admin permission type to, so that it
@@ -24,6 +27,149 @@ class Admin(Model):
         ]
 
 
+class ExportJob(Model):
+    """
+    A spreadsheet export that is too large to be written while the user waits (see
+    ``WAGTAILADMIN_EXPORT_JOB_THRESHOLD``). The export request is repeated on behalf of
+    the user by the process_export_jobs management command, which saves the file and
+    emails the user a link to download it.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, _("Pending")),
+        (STATUS_RUNNING, _("Running")),
+        (STATUS_COMPLETED, _("Completed")),
+        (STATUS_FAILED, _("Failed")),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("user"),
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    # The full URL of the export request, including the query string
+    url = models.TextField(verbose_name=_("URL"))
+    filename = models.CharField(verbose_name=_("filename"), max_length=255)
+    status = models.CharField(
+        verbose_name=_("status"),
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        db_index=True,
+    )
+    file = models.FileField(
+        verbose_name=_("file"), upload_to="wagtail_exports", blank=True
+    )
+    created_at = models.DateTimeField(verbose_name=_("created at"), auto_now_add=True)
+    # When the job was last claimed to be run, so that jobs left running by a process
+    # that was killed can be run again
+    started_at = models.DateTimeField(
+        verbose_name=_("started at"), null=True, blank=True
+    )
+    attempts = models.PositiveIntegerField(verbose_name=_("attempts"), default=0)
+    completed_at = models.DateTimeField(
+        verbose_name=_("completed at"), null=True, blank=True
+    )
+
+    class Meta:
+        verbose_name = _("export job")
+        verbose_name_plural = _("export jobs")
+
+    def __str__(self):
+        return self.filename
+
+
+class RecentEdit(Model):
+    """
+    The latest revision that each user has saved of each object, so that the dashboard
+    can list a user's most recent edits without grouping the whole revisions table.
+    Updated by a signal handler whenever a revision is saved. Records of deleted
+    revisions are repaired when the dashboard next reads them, so that revisions can
+    still be deleted in bulk.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("user"),
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    base_content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, related_name="+"
+    )
+    object_id = models.CharField(max_length=255, verbose_name=_("object id"))
+    # Null once the revision has been deleted, until repair_deleted_revisions replaces
+    # it with the user's previous revision of the object
+    revision = models.ForeignKey(
+        "wagtailcore.Revision",
+        verbose_name=_("revision"),
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    created_at = models.DateTimeField(verbose_name=_("created at"))
+
+    class Meta:
+        verbose_name = _("recent edit")
+        verbose_name_plural = _("recent edits")
+        unique_together = [("user", "base_content_type", "object_id")]
+        indexes = [
+            models.Index(
+                fields=["user", "base_content_type", "-created_at"],
+                name="recent_edit_user_idx",
+            ),
+        ]
+
+    @classmethod
+    def update_for_revision(cls, revision):
+        if revision.user_id is None:
+            return
+
+        cls.objects.update_or_create(
+            user_id=revision.user_id,
+            base_content_type_id=revision.base_content_type_id,
+            object_id=revision.object_id,
+            defaults={"revision": revision, "created_at": revision.created_at},
+        )
+
+    @classmethod
+    def repair_deleted_revisions(cls, user, base_content_type):
+        """
+        Point the user's recent edits of objects of the given base content type whose
+        revision has been deleted at their latest remaining revision of the object, or
+        remove them if there is none. Returns the number of recent edits repaired.
+        """
+        recent_edits = list(
+            cls.objects.filter(
+                user=user,
+                base_content_type=base_content_type,
+                revision__isnull=True,
+            )
+        )
+        for recent_edit in recent_edits:
+            previous_revision = (
+                Revision.objects.filter(
+                    user_id=recent_edit.user_id,
+                    base_content_type_id=recent_edit.base_content_type_id,
+                    object_id=recent_edit.object_id,
+                )
+                .order_by("-created_at", "-id")
+                .first()
+            )
+            if previous_revision is None:
+                recent_edit.delete()
+            else:
+                recent_edit.revision = previous_revision
+                recent_edit.created_at = previous_revision.created_at
+                recent_edit.save(update_fields=["revision", "created_at"])
+        return len(recent_edits)
+
+
 def get_object_usage(obj):
     """Returns a queryset of pages that link to a particular object"""
 
@@ -1,10 +1,14 @@
+from django.db.models.signals import post_save
+
+from wagtail.admin import dashboard_cache
 from wagtail.admin.mail import (
     GroupApprovalTaskStateSubmissionEmailNotifier,
     WorkflowStateApprovalEmailNotifier,
     WorkflowStateRejectionEmailNotifier,
     WorkflowStateSubmissionEmailNotifier,
 )
-from wagtail.models import TaskState, WorkflowState
+from wagtail.admin.models import RecentEdit
+from wagtail.models import Revision, TaskState, WorkflowState
 from wagtail.signals import (
     task_submitted,
     workflow_approved,
@@ -18,7 +22,18 @@ workflow_approval_email_notifier = WorkflowStateApprovalEmailNotifier()
 workflow_rejection_email_notifier = WorkflowStateRejectionEmailNotifier()
 
 
+def revision_saved_signal_handler(instance, created, raw=False, **kwargs):
+    if created and not raw:
+        RecentEdit.update_for_revision(instance)
+
+
 def register_signal_handlers():
+    post_save.connect(
+        revision_saved_signal_handler,
+        sender=Revision,
+        dispatch_uid="recent_edit_revision_saved",
+    )
+
     task_submitted.connect(
         task_submission_email_notifier,
         sender=TaskState,
@@ -40,3 +55,5 @@ def register_signal_handlers():
         sender=WorkflowState,
         dispatch_uid="workflow_state_approved_email_notification",
     )
+
+    dashboard_cache.register_signal_handlers()
@@ -41,6 +41,10 @@ class TestAdminPageListing(AdminAPITestCase, TestPageListing):
     def get_homepage(self):
         return Page.objects.get(slug="home-page")
 
+    def get_listed_pages(self):
+        # The admin API lists draft and private pages too, but not the root page
+        return Page.objects.exclude(depth=1)
+
     # BASIC TESTS
 
     def test_basic(self):
@@ -281,6 +285,26 @@ class TestAdminPageListing(AdminAPITestCase, TestPageListing):
                 },
             )
 
+    def test_listing_meta_fields_match_detail(self):
+        # These fields are fetched in bulk for listings, and one page at a time
+        # for the detail view
+        meta_fields = ["status", "children", "descendants", "ancestors", "translations"]
+        fields = ",".join(meta_fields)
+        response = self.get_response(
+            descendant_of=self.get_homepage().id, fields=fields, limit=20
+        )
+        content = json.loads(response.content.decode("UTF-8"))
+
+        for page in content["items"]:
+            response = self.client.get(
+                reverse("wagtailadmin_api:pages:detail", args=(page["id"],)),
+                {"fields": fields},
+            )
+            detail = json.loads(response.content.decode("UTF-8"))
+            for field in meta_fields:
+                with self.subTest(page=page["id"], field=field):
+                    self.assertEqual(page["meta"][field], detail["meta"][field])
+
     def test_all_fields_then_remove_something(self):
         response = self.get_response(
             type="demosite.BlogEntryPage",
@@ -394,6 +418,34 @@ class TestAdminPageListing(AdminAPITestCase, TestPageListing):
                 "http://localhost/admin/api/main/pages/?descendant_of=%d" % page["id"],
             )
 
+    def test_fields_descendants_counts(self):
+        response = self.get_response(fields="children,descendants")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        for item in content["items"]:
+            page = Page.objects.get(id=item["id"])
+            self.assertEqual(
+                item["meta"]["children"]["count"], page.get_children().count()
+            )
+            self.assertEqual(
+                item["meta"]["descendants"]["count"], page.get_descendants().count()
+            )
+
+    def test_fields_status_scheduled(self):
+        Page.objects.get(id=16).unpublish()
+        tomorrow = timezone.now() + datetime.timedelta(days=1)
+        Page.objects.get(id=16).specific.save_revision(approved_go_live_at=tomorrow)
+
+        response = self.get_response(fields="status")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        statuses = {item["id"]: item["meta"]["status"] for item in content["items"]}
+        self.assertEqual(
+            statuses[16],
+            {"status": "scheduled", "live": False, "has_unpublished_changes": True},
+        )
+        self.assertEqual(statuses[2]["status"], "live")
+
     def test_fields_child_relation(self):
         response = self.get_response(
             type="demosite.BlogEntryPage", fields="title,related_links"
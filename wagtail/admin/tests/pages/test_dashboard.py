@@ -1,10 +1,12 @@
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import caches
+from django.test import TestCase, override_settings
 from django.urls import reverse
 
+from wagtail.admin.models import RecentEdit
 from wagtail.admin.views.home import RecentEditsPanel
 from wagtail.coreutils import get_dummy_request
-from wagtail.models import Page
+from wagtail.models import Page, get_default_page_content_type
 from wagtail.test.testapp.models import SimplePage
 from wagtail.test.utils import WagtailTestUtils
 
@@ -98,6 +100,52 @@ class TestRecentEditsPanel(WagtailTestUtils, TestCase):
         response = self.client.get(reverse("wagtailadmin_home"))
         self.assertEqual(response.status_code, 200)
 
+    def test_recent_edits_are_recorded(self):
+        self.child_page.save_revision(user=self.user_alice)
+        revision = self.child_page.save_revision(user=self.user_alice)
+
+        # Only the latest revision by each user is kept
+        recent_edit = RecentEdit.objects.get(user=self.user_alice)
+        self.assertEqual(recent_edit.revision, revision)
+        self.assertEqual(recent_edit.object_id, str(self.child_page.id))
+        self.assertEqual(recent_edit.created_at, revision.created_at)
+
+    def test_deleting_revision_falls_back_to_previous_revision(self):
+        previous_revision = self.child_page.save_revision(user=self.user_alice)
+        revision = self.child_page.save_revision(user=self.user_alice)
+        content_type = get_default_page_content_type()
+
+        # Recent edits of deleted revisions are repaired when they are next read
+        revision.delete()
+        recent_edit = RecentEdit.objects.get(user=self.user_alice)
+        self.assertIsNone(recent_edit.revision)
+
+        RecentEdit.repair_deleted_revisions(self.user_alice, content_type)
+        recent_edit = RecentEdit.objects.get(user=self.user_alice)
+        self.assertEqual(recent_edit.revision, previous_revision)
+        self.assertEqual(recent_edit.created_at, previous_revision.created_at)
+
+        previous_revision.delete()
+        RecentEdit.repair_deleted_revisions(self.user_alice, content_type)
+        self.assertFalse(RecentEdit.objects.filter(user=self.user_alice).exists())
+
+    def test_panel_repairs_deleted_revisions(self):
+        request = get_dummy_request()
+        request.user = self.user_alice
+        previous_revision = self.child_page.save_revision(user=self.user_alice)
+        revision = self.child_page.save_revision(user=self.user_alice)
+        revision.delete()
+
+        panel = RecentEditsPanel()
+        context = panel.get_context_data({"request": request})
+
+        self.assertEqual(
+            context["last_edits"], [[previous_revision, self.child_page.specific]]
+        )
+        self.assertEqual(
+            RecentEdit.objects.get(user=self.user_alice).revision, previous_revision
+        )
+
     def test_panel(self):
         """Test if the panel actually returns expected pages"""
         self.login(username="bob", password="password")
@@ -143,3 +191,71 @@ class TestRecentEditsQueryCount(WagtailTestUtils, TestCase):
         # check that the panel is still actually returning results
         html = panel.render_html(parent_context)
         self.assertIn("Ameristralia Day", html)
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "dashboard": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "wagtailadmin-dashboard-tests",
+        },
+    },
+    WAGTAILADMIN_DASHBOARD_CACHE="dashboard",
+)
+class TestDashboardCache(WagtailTestUtils, TestCase):
+    def setUp(self):
+        caches["dashboard"].clear()
+        self.user = self.login()
+
+        self.page = SimplePage(title="Hello world!", slug="hello-world", content="hi")
+        Page.objects.get(id=2).add_child(instance=self.page)
+
+    def get(self):
+        response = self.client.get(reverse("wagtailadmin_home"))
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_panels_are_cached(self):
+        self.assertNotContains(self.get(), "Your locked pages")
+
+        # Changes that don't send any signals aren't shown until the cache expires
+        Page.objects.filter(id=self.page.id).update(locked=True, locked_by=self.user)
+        self.assertNotContains(self.get(), "Your locked pages")
+
+    def test_locking_page_invalidates_cache(self):
+        self.assertNotContains(self.get(), "Your locked pages")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse("wagtailadmin_pages:lock", args=(self.page.id,)))
+        self.assertContains(self.get(), "Your locked pages")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse("wagtailadmin_pages:unlock", args=(self.page.id,)))
+        self.assertNotContains(self.get(), "Your locked pages")
+
+    def test_saving_revision_invalidates_cache(self):
+        self.assertNotContains(self.get(), "Your most recent edits")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.page.save_revision(user=self.user)
+        self.assertContains(self.get(), "Your most recent edits")
+
+    def test_deleting_page_invalidates_cache(self):
+        self.page.save_revision(user=self.user)
+        self.assertContains(self.get(), "Your most recent edits")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.page.delete()
+        self.assertNotContains(self.get(), "Your most recent edits")
+
+    def test_panels_are_cached_per_user(self):
+        self.assertNotContains(self.get(), "Your most recent edits")
+
+        other_user = self.create_superuser("other", password="password")
+        self.page.save_revision(user=other_user)
+
+        # The other user's edits are shown on their own dashboard, even though the
+        # cache hasn't been invalidated
+        self.login(other_user)
+        self.assertContains(self.get(), "Your most recent edits")
@@ -153,8 +153,9 @@ class TestPageExplorer(WagtailTestUtils, TestCase):
             page_ids, [self.child_page.id, self.old_page.id, self.new_page.id]
         )
 
-        # Pages must not be paginated
-        self.assertNotIsInstance(response.context["pages"], paginator.Page)
+        # Pages are paginated, so that sections with many children can be reordered
+        self.assertIsInstance(response.context["pages"], paginator.Page)
+        self.assertContains(response, "Item 1 of 3")
 
     def test_construct_explorer_page_queryset_hook(self):
         # testapp implements a construct_explorer_page_queryset hook
@@ -222,6 +223,24 @@ class TestPageExplorer(WagtailTestUtils, TestCase):
         # Check that we got the correct page
         self.assertEqual(response.context["pages"].number, 2)
 
+    def test_reordering_pagination(self):
+        self.make_pages()
+
+        response = self.client.get(
+            reverse("wagtailadmin_explore", args=(self.root_page.id,)),
+            {"ordering": "ord", "p": 2},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["pages"].number, 2)
+
+        # The second page of results follows on from the first in tree order
+        page_ids = [page.id for page in response.context["pages"]]
+        child_ids = self.root_page.get_children().values_list("id", flat=True)
+        self.assertEqual(page_ids, list(child_ids[50:100]))
+        self.assertContains(response, "Item 51 of 153")
+        self.assertContains(response, "var positionOffset = Math.max(51 - 1, 0);")
+
     def test_pagination_invalid(self):
         self.make_pages()
 
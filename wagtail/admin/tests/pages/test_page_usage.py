@@ -1,7 +1,9 @@
-from django.test import TestCase
+from unittest import mock
+
+from django.test import TestCase, override_settings
 from django.urls import reverse
 
-from wagtail.models import Page
+from wagtail.models import Page, ReferenceIndex
 from wagtail.test.testapp.models import (
     FormPageWithRedirect,
     PageChooserModel,
@@ -72,3 +74,25 @@ class TestPageUsage(WagtailTestUtils, TestCase):
         )
         self.assertContains(response, "Thank you redirect page")
         self.assertContains(response, "<td>Form page with redirect</td>", html=True)
+
+    def test_pending_updates_notice(self):
+        PageChooserModel.objects.create(page=self.page)
+        with override_settings(WAGTAIL_REFERENCE_INDEX_UPDATE_MODE="queue"):
+            with self.captureOnCommitCallbacks(execute=True):
+                PageChooserModel.objects.create(page=self.page)
+            usage_url = reverse("wagtailadmin_pages:usage", args=(self.page.id,))
+            response = self.client.get(usage_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Some recent changes are still being processed")
+
+    def test_pending_updates_not_checked_in_immediate_mode(self):
+        usage_url = reverse("wagtailadmin_pages:usage", args=(self.page.id,))
+        with mock.patch.object(ReferenceIndex, "has_pending_updates") as has_pending:
+            response = self.client.get(usage_url)
+
+        self.assertEqual(response.status_code, 200)
+        has_pending.assert_not_called()
+        self.assertNotContains(
+            response, "Some recent changes are still being processed"
+        )
@@ -110,6 +110,44 @@ class TestPageReorder(WagtailTestUtils, TestCase):
         child_slugs = self.index_page.get_children().values_list("slug", flat=True)
         self.assertListEqual(list(child_slugs), ["child-1", "child-2", "child-3"])
 
+    def test_page_move_page_before_page(self):
+        response = self.client.post(
+            reverse("wagtailadmin_pages:set_page_position", args=(self.child_3.id,))
+            + "?before=%d" % self.child_2.id
+        )
+        self.assertEqual(response.status_code, 200)
+        child_slugs = self.index_page.get_children().values_list("slug", flat=True)
+        self.assertListEqual(list(child_slugs), ["child-1", "child-3", "child-2"])
+
+    def test_page_move_page_before_later_page(self):
+        response = self.client.post(
+            reverse("wagtailadmin_pages:set_page_position", args=(self.child_1.id,))
+            + "?before=%d" % self.child_3.id
+        )
+        self.assertEqual(response.status_code, 200)
+        child_slugs = self.index_page.get_children().values_list("slug", flat=True)
+        self.assertListEqual(list(child_slugs), ["child-2", "child-1", "child-3"])
+
+    def test_page_move_page_before_itself(self):
+        response = self.client.post(
+            reverse("wagtailadmin_pages:set_page_position", args=(self.child_2.id,))
+            + "?before=%d" % self.child_2.id
+        )
+        self.assertEqual(response.status_code, 200)
+        child_slugs = self.index_page.get_children().values_list("slug", flat=True)
+        self.assertListEqual(list(child_slugs), ["child-1", "child-2", "child-3"])
+
+    def test_page_move_page_before_page_with_another_parent(self):
+        response = self.client.post(
+            reverse("wagtailadmin_pages:set_page_position", args=(self.child_1.id,))
+            + "?before=%d" % self.index_page.id
+        )
+        self.assertEqual(response.status_code, 404)
+
+        # Ensure page order does not change:
+        child_slugs = self.index_page.get_children().values_list("slug", flat=True)
+        self.assertListEqual(list(child_slugs), ["child-1", "child-2", "child-3"])
+
 
 class TestPageReorderWithParentPageRestrictions(TestPageReorder):
     """
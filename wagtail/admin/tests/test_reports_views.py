@@ -1,17 +1,21 @@
 import datetime
 from io import BytesIO
+from unittest import mock
 
 from django.conf import settings
 from django.conf.locale import LANG_INFO
 from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
+from django.core import mail
+from django.core.management import call_command
 from django.test import TestCase
 from django.test.utils import override_settings
 from django.urls import reverse
 from django.utils import timezone, translation
 from openpyxl import load_workbook
 
-from wagtail.admin.views.mixins import ExcelDateFormatter
+from wagtail.admin.models import ExportJob
+from wagtail.admin.views.mixins import ExcelDateFormatter, SpreadsheetExportMixin
 from wagtail.models import ModelLogEntry, Page, PageLogEntry
 from wagtail.test.utils import WagtailTestUtils
 
@@ -147,6 +151,179 @@ class TestLockedPagesView(WagtailTestUtils, TestCase):
         self.assertEqual(worksheet["E2"].number_format, ExcelDateFormatter().get())
 
 
+class TestExportJobs(WagtailTestUtils, TestCase):
+    def setUp(self):
+        self.user = self.login()
+
+        page = Page.objects.get(depth=2)
+        page.locked = True
+        page.locked_by = self.user
+        page.save()
+
+    def get(self, params={}):
+        return self.client.get(reverse("wagtailadmin_reports:locked_pages"), params)
+
+    def process_export_jobs(self):
+        call_command("process_export_jobs", verbosity=0)
+        for job in ExportJob.objects.all():
+            if job.file:
+                self.addCleanup(job.file.delete, save=False)
+
+    @override_settings(WAGTAILADMIN_EXPORT_JOB_THRESHOLD=10)
+    def test_export_under_threshold(self):
+        response = self.get(params={"export": "csv"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(ExportJob.objects.exists())
+
+    @override_settings(WAGTAILADMIN_EXPORT_JOB_THRESHOLD=0)
+    def test_export_over_threshold_creates_job(self):
+        response = self.get(params={"export": "xlsx", "locked_by": self.user.pk})
+
+        self.assertRedirects(
+            response,
+            reverse("wagtailadmin_reports:locked_pages")
+            + "?locked_by=%s" % self.user.pk,
+        )
+        job = ExportJob.objects.get()
+        self.assertEqual(job.user, self.user)
+        self.assertEqual(job.status, ExportJob.STATUS_PENDING)
+        self.assertTrue(job.filename.startswith("locked-pages-report-"))
+        self.assertTrue(job.filename.endswith(".xlsx"))
+
+    @override_settings(WAGTAILADMIN_EXPORT_JOB_THRESHOLD=0)
+    def test_process_export_jobs(self):
+        self.get(params={"export": "xlsx"})
+        self.process_export_jobs()
+
+        job = ExportJob.objects.get()
+        self.assertEqual(job.status, ExportJob.STATUS_COMPLETED)
+        self.assertIsNotNone(job.completed_at)
+
+        download_url = reverse("wagtailadmin_export_job_download", args=(job.pk,))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [self.user.email])
+        self.assertIn("http://testserver" + download_url, mail.outbox[0].body)
+
+        response = self.client.get(download_url)
+        self.assertEqual(response.status_code, 200)
+        worksheet = load_workbook(filename=BytesIO(response.getvalue()))["Sheet1"]
+        cell_array = [[cell.value for cell in row] for row in worksheet.rows]
+        self.assertEqual(
+            cell_array[0],
+            ["Title", "Updated", "Status", "Type", "Locked At", "Locked By"],
+        )
+        self.assertEqual(len(cell_array), 2)
+
+        # Other users can't download the export
+        self.login(self.create_superuser("other", password="password"))
+        response = self.client.get(download_url)
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(WAGTAILADMIN_EXPORT_JOB_THRESHOLD=0)
+    def test_failed_export_job(self):
+        self.get(params={"export": "csv"})
+
+        # The user can no longer access the report
+        self.user.is_superuser = False
+        self.user.save()
+
+        with self.assertLogs("wagtail.admin", level="ERROR"):
+            self.process_export_jobs()
+
+        job = ExportJob.objects.get()
+        self.assertEqual(job.status, ExportJob.STATUS_FAILED)
+        self.assertFalse(job.file)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn("could not be completed", mail.outbox[0].body)
+
+    @override_settings(WAGTAILADMIN_EXPORT_JOB_THRESHOLD=0)
+    def test_abandoned_export_job_is_run_again(self):
+        self.get(params={"export": "csv"})
+        ExportJob.objects.update(
+            status=ExportJob.STATUS_RUNNING,
+            started_at=timezone.now() - datetime.timedelta(hours=2),
+            attempts=1,
+        )
+
+        self.process_export_jobs()
+
+        job = ExportJob.objects.get()
+        self.assertEqual(job.status, ExportJob.STATUS_COMPLETED)
+        self.assertEqual(job.attempts, 2)
+
+    @override_settings(WAGTAILADMIN_EXPORT_JOB_THRESHOLD=0)
+    def test_running_export_job_is_not_run_again(self):
+        self.get(params={"export": "csv"})
+        ExportJob.objects.update(
+            status=ExportJob.STATUS_RUNNING, started_at=timezone.now(), attempts=1
+        )
+
+        self.process_export_jobs()
+
+        self.assertEqual(ExportJob.objects.get().status, ExportJob.STATUS_RUNNING)
+
+    @override_settings(WAGTAILADMIN_EXPORT_JOB_THRESHOLD=0)
+    def test_abandoned_export_job_fails_after_max_attempts(self):
+        self.get(params={"export": "csv"})
+        ExportJob.objects.update(
+            status=ExportJob.STATUS_RUNNING,
+            started_at=timezone.now() - datetime.timedelta(hours=2),
+            attempts=3,
+        )
+
+        with self.assertLogs("wagtail.admin", level="ERROR"):
+            self.process_export_jobs()
+
+        job = ExportJob.objects.get()
+        self.assertEqual(job.status, ExportJob.STATUS_FAILED)
+        self.assertIsNotNone(job.completed_at)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn("could not be completed", mail.outbox[0].body)
+
+    def test_old_export_jobs_are_deleted(self):
+        job = ExportJob.objects.create(
+            user=self.user,
+            url="http://testserver/admin/reports/locked/?export=csv",
+            filename="export.csv",
+            status=ExportJob.STATUS_COMPLETED,
+        )
+        ExportJob.objects.filter(pk=job.pk).update(
+            created_at=timezone.now() - datetime.timedelta(days=8)
+        )
+
+        self.process_export_jobs()
+
+        self.assertFalse(ExportJob.objects.exists())
+
+
+class TestIterExportItems(TestCase):
+    def setUp(self):
+        self.view = SpreadsheetExportMixin()
+        self.view.export_chunk_size = 1
+
+    def test_iterator(self):
+        queryset = Page.objects.order_by("-title")
+        self.assertEqual(
+            list(self.view.iter_export_items(queryset)), list(queryset.all())
+        )
+
+    def test_prefetch_related_before_django_4_1(self):
+        queryset = Page.objects.order_by("-title", "pk").prefetch_related(
+            "sites_rooted_here"
+        )
+        expected = list(queryset.all())
+
+        with mock.patch("wagtail.admin.views.mixins.DJANGO_VERSION", (4, 0)):
+            # One query for the primary keys, then two for each chunk
+            with self.assertNumQueries(1 + 2 * len(expected)):
+                items = list(self.view.iter_export_items(queryset))
+
+        self.assertEqual(items, expected)
+        for item in items:
+            self.assertIn("sites_rooted_here", item._prefetched_objects_cache)
+
+
 class TestFilteredLockedPagesView(WagtailTestUtils, TestCase):
     fixtures = ["test.json"]
 
@@ -17,7 +17,15 @@ from wagtail.admin.urls import pages as wagtailadmin_pages_urls
 from wagtail.admin.urls import password_reset as wagtailadmin_password_reset_urls
 from wagtail.admin.urls import reports as wagtailadmin_reports_urls
 from wagtail.admin.urls import workflows as wagtailadmin_workflows_urls
-from wagtail.admin.views import account, chooser, dismissibles, home, tags, userbar
+from wagtail.admin.views import (
+    account,
+    chooser,
+    dismissibles,
+    export_jobs,
+    home,
+    tags,
+    userbar,
+)
 from wagtail.admin.views.bulk_action import index as bulk_actions
 from wagtail.admin.views.pages import listing
 from wagtail.utils.urlpatterns import decorate_urlpatterns
@@ -98,6 +106,11 @@ urlpatterns = [
         dismissibles.DismissiblesView.as_view(),
         name="wagtailadmin_dismissibles",
     ),
+    path(
+        "exports/<int:job_id>/",
+        export_jobs.download,
+        name="wagtailadmin_export_job_download",
+    ),
 ]
 
 
@@ -0,0 +1,11 @@
+from django.http import FileResponse
+from django.shortcuts import get_object_or_404
+
+from wagtail.admin.models import ExportJob
+
+
+def download(request, job_id):
+    job = get_object_or_404(
+        ExportJob, pk=job_id, user=request.user, status=ExportJob.STATUS_COMPLETED
+    )
+    return FileResponse(job.file.open("rb"), as_attachment=True, filename=job.filename)
@@ -8,6 +8,7 @@ from wagtail.admin.ui import tables
 from wagtail.admin.utils import get_latest_str
 from wagtail.admin.views.generic import BaseObjectMixin, IndexView
 from wagtail.models import DraftStateMixin, ReferenceIndex
+from wagtail.models.reference_index import get_reference_index_update_mode
 
 
 class TitleColumn(tables.TitleColumn):
@@ -16,6 +17,7 @@ class TitleColumn(tables.TitleColumn):
 
 
 class UsageView(BaseObjectMixin, IndexView):
+    template_name = "wagtailadmin/generic/usage.html"
     paginate_by = 20
     is_searchable = False
     page_title = gettext_lazy("Usage of")
@@ -83,6 +85,16 @@ class UsageView(BaseObjectMixin, IndexView):
         return super().get_table(results, **kwargs)
 
     def get_context_data(self, *args, object_list=None, **kwargs):
+        # Changes queued with WAGTAIL_REFERENCE_INDEX_UPDATE_MODE = "queue" may not be
+        # reflected in the listing yet. Nothing is queued in the immediate mode
+        reference_index_is_stale = (
+            get_reference_index_update_mode() == "queue"
+            and ReferenceIndex.has_pending_updates(self.object)
+        )
         return super().get_context_data(
-            *args, object_list=object_list, object=self.object, **kwargs
+            *args,
+            object_list=object_list,
+            object=self.object,
+            reference_index_is_stale=reference_index_is_stale,
+            **kwargs,
         )
@@ -2,34 +2,35 @@ import itertools
 from typing import Any, Mapping, Union
 
 from django.conf import settings
-from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import permission_required
-from django.db import connection
-from django.db.models import Exists, IntegerField, Max, OuterRef, Q
+from django.db.models import Exists, IntegerField, OuterRef, Q
 from django.db.models.functions import Cast
 from django.forms import Media
 from django.http import Http404, HttpResponse
 from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy
 from django.views.generic.base import TemplateView
 
 from wagtail import hooks
+from wagtail.admin.dashboard_cache import (
+    get_cache_key,
+    get_dashboard_cache,
+    get_dashboard_cache_timeout,
+)
+from wagtail.admin.models import RecentEdit
 from wagtail.admin.navigation import get_site_for_user
 from wagtail.admin.site_summary import SiteSummaryPanel
 from wagtail.admin.ui.components import Component
 from wagtail.admin.views.generic import WagtailAdminTemplateMixin
 from wagtail.models import (
     Page,
-    Revision,
     TaskState,
     UserPagePermissionsProxy,
     WorkflowState,
     get_default_page_content_type,
 )
 
-User = get_user_model()
-
-
 # Panels for the homepage
 
 
@@ -91,7 +92,26 @@ class WhatsNewInWagtailVersionPanel(Component):
         return super().render_html(parent_context)
 
 
-class PagesForModerationPanel(Component):
+class CachedPanelMixin:
+    """
+    Caches the panel's HTML for the current user, when ``WAGTAILADMIN_DASHBOARD_CACHE``
+    is set.
+    """
+
+    def render_html(self, parent_context: Mapping[str, Any] = None) -> str:
+        cache = get_dashboard_cache()
+        if cache is None or parent_context is None:
+            return super().render_html(parent_context)
+
+        cache_key = get_cache_key(cache, self.name, parent_context["request"])
+        html = cache.get(cache_key)
+        if html is None:
+            html = super().render_html(parent_context)
+            cache.set(cache_key, html, get_dashboard_cache_timeout())
+        return mark_safe(html)
+
+
+class PagesForModerationPanel(CachedPanelMixin, Component):
     name = "pages_for_moderation"
     template_name = "wagtailadmin/home/pages_for_moderation.html"
     order = 200
@@ -110,7 +130,7 @@ class PagesForModerationPanel(Component):
         return context
 
 
-class UserObjectsInWorkflowModerationPanel(Component):
+class UserObjectsInWorkflowModerationPanel(CachedPanelMixin, Component):
     name = "user_objects_in_workflow_moderation"
     template_name = "wagtailadmin/home/user_objects_in_workflow_moderation.html"
     order = 210
@@ -154,7 +174,7 @@ class UserObjectsInWorkflowModerationPanel(Component):
         return context
 
 
-class WorkflowObjectsToModeratePanel(Component):
+class WorkflowObjectsToModeratePanel(CachedPanelMixin, Component):
     name = "workflow_objects_to_moderate"
     template_name = "wagtailadmin/home/workflow_objects_to_moderate.html"
     order = 220
@@ -206,7 +226,7 @@ class WorkflowObjectsToModeratePanel(Component):
         return context
 
 
-class LockedPagesPanel(Component):
+class LockedPagesPanel(CachedPanelMixin, Component):
     name = "locked_pages"
     template_name = "wagtailadmin/home/locked_pages.html"
     order = 300
@@ -230,7 +250,7 @@ class LockedPagesPanel(Component):
         return context
 
 
-class RecentEditsPanel(Component):
+class RecentEditsPanel(CachedPanelMixin, Component):
     name = "recent_edits"
     template_name = "wagtailadmin/home/recent_edits.html"
     order = 250
@@ -239,36 +259,23 @@ class RecentEditsPanel(Component):
         request = parent_context["request"]
         context = super().get_context_data(parent_context)
 
-        # Last n edited pages
+        # Last n edited pages, from the latest revision of each page by this user
         edit_count = getattr(settings, "WAGTAILADMIN_RECENT_EDITS_LIMIT", 5)
-        if connection.vendor == "mysql":
-            # MySQL can't handle the subselect created by the ORM version -
-            # it fails with "This version of MySQL doesn't yet support 'LIMIT & IN/ALL/ANY/SOME subquery'"
-            last_edits = Revision.objects.raw(
-                """
-                SELECT wr.* FROM
-                    wagtailcore_revision wr JOIN (
-                        SELECT max(created_at) AS max_created_at, object_id FROM
-                            wagtailcore_revision WHERE user_id = %s AND base_content_type_id = %s GROUP BY object_id ORDER BY max_created_at DESC LIMIT %s
-                    ) AS max_rev ON max_rev.max_created_at = wr.created_at ORDER BY wr.created_at DESC
-                 """,
-                [
-                    User._meta.pk.get_db_prep_value(request.user.pk, connection),
-                    get_default_page_content_type().id,
-                    edit_count,
-                ],
+        recent_edits = (
+            RecentEdit.objects.filter(
+                user=request.user, base_content_type=get_default_page_content_type()
             )
-        else:
-            last_edits_dates = (
-                Revision.page_revisions.filter(user=request.user)
-                .values("object_id")
-                .annotate(latest_date=Max("created_at"))
-                .order_by("-latest_date")
-                .values("latest_date")[:edit_count]
+            .select_related("revision")
+            .order_by("-created_at")
+        )
+        last_edits = list(recent_edits[:edit_count])
+        if any(recent_edit.revision is None for recent_edit in last_edits):
+            # Some of the revisions have been deleted since
+            RecentEdit.repair_deleted_revisions(
+                request.user, get_default_page_content_type()
             )
-            last_edits = Revision.page_revisions.filter(
-                created_at__in=last_edits_dates
-            ).order_by("-created_at")
+            last_edits = list(recent_edits[:edit_count])
+        last_edits = [recent_edit.revision for recent_edit in last_edits]
 
         # The revision's object_id is a string, so cast it to int first.
         page_keys = [int(pr.object_id) for pr in last_edits]
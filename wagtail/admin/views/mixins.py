@@ -1,14 +1,20 @@
 import csv
 import datetime
+import tempfile
 from collections import OrderedDict
-from io import BytesIO
 
+from django import VERSION as DJANGO_VERSION
+from django.conf import settings
+from django.contrib import messages
 from django.core.exceptions import FieldDoesNotExist
+from django.db.models import QuerySet
 from django.http import FileResponse, StreamingHttpResponse
+from django.shortcuts import redirect
 from django.utils import timezone
 from django.utils.dateformat import Formatter
 from django.utils.encoding import force_str
 from django.utils.formats import get_format
+from django.utils.translation import gettext as _
 from openpyxl import Workbook
 from openpyxl.cell import WriteOnlyCell
 
@@ -151,6 +157,8 @@ class SpreadsheetExportMixin:
     }
     # A dictionary of column heading overrides in the format {field: heading}
     export_headings = {}
+    # The number of items to fetch from the database at a time when exporting a queryset
+    export_chunk_size = 2000
 
     def get_filename(self):
         """Gets the base filename for the exported spreadsheet, without extensions"""
@@ -215,6 +223,30 @@ class SpreadsheetExportMixin:
         except (AttributeError, FieldDoesNotExist):
             return force_str(field)
 
+    def iter_export_items(self, queryset):
+        """
+        Iterate over the items to export, fetching them from the database in chunks of
+        export_chunk_size items rather than all at once
+        """
+        if not isinstance(queryset, QuerySet) or queryset._result_cache is not None:
+            # Not a queryset, or one that has already been fetched (and possibly
+            # decorated with extra data)
+            yield from queryset
+        elif queryset._prefetch_related_lookups and DJANGO_VERSION < (4, 1):
+            # iterator() only supports prefetch_related from Django 4.1. Fetch the
+            # primary keys in the queryset's order up front instead, and then the items
+            # in chunks of those keys, so that each chunk is a cheap lookup and items
+            # can't be skipped or repeated between chunks
+            pks = list(queryset.values_list("pk", flat=True))
+            for start in range(0, len(pks), self.export_chunk_size):
+                chunk_pks = pks[start : start + self.export_chunk_size]
+                items = queryset.in_bulk(chunk_pks)
+                for pk in chunk_pks:
+                    if pk in items:
+                        yield items[pk]
+        else:
+            yield from queryset.iterator(chunk_size=self.export_chunk_size)
+
     def stream_csv(self, queryset):
         """Generate a csv file line by line from queryset, to be used in a StreamingHTTPResponse"""
         writer = csv.DictWriter(Echo(), fieldnames=self.list_export)
@@ -222,7 +254,7 @@ class SpreadsheetExportMixin:
             {field: self.get_heading(queryset, field) for field in self.list_export}
         )
 
-        for item in queryset:
+        for item in self.iter_export_items(queryset):
             yield self.write_csv_row(writer, self.to_row_dict(item))
 
     def write_xlsx(self, queryset, output):
@@ -235,7 +267,7 @@ class SpreadsheetExportMixin:
         )
 
         date_format = ExcelDateFormatter().get()
-        for item in queryset:
+        for item in self.iter_export_items(queryset):
             worksheet.append(
                 self.generate_xlsx_row(
                     worksheet, self.to_row_dict(item), date_format=date_format
@@ -246,7 +278,9 @@ class SpreadsheetExportMixin:
 
     def write_xlsx_response(self, queryset):
         """Write an xlsx file from a queryset and return a FileResponse"""
-        output = BytesIO()
+        # Write-only workbooks keep the rows on disk until they are saved, so write
+        # the file there too rather than holding it in memory
+        output = tempfile.TemporaryFile()
         self.write_xlsx(queryset, output)
         output.seek(0)
 
@@ -266,8 +300,53 @@ class SpreadsheetExportMixin:
         )
         return response
 
+    def should_create_export_job(self, queryset):
+        """
+        Return True if the export should be written by a background export job, which
+        is the case when WAGTAILADMIN_EXPORT_JOB_THRESHOLD is set and there are more
+        items than that to export
+        """
+        threshold = getattr(settings, "WAGTAILADMIN_EXPORT_JOB_THRESHOLD", None)
+        if threshold is None or getattr(self.request, "export_job", None):
+            return False
+
+        if isinstance(queryset, QuerySet) and queryset._result_cache is None:
+            count = queryset.count()
+        else:
+            count = len(queryset)
+        return count > threshold
+
+    def create_export_job(self, spreadsheet_format):
+        """
+        Queue an export job for this request, to be run by the process_export_jobs
+        management command, and redirect back to the listing
+        """
+        from wagtail.admin.models import ExportJob
+
+        ExportJob.objects.create(
+            user=self.request.user,
+            url=self.request.build_absolute_uri(),
+            filename=f"{self.get_filename()}.{spreadsheet_format}",
+        )
+        messages.success(
+            self.request,
+            _(
+                "Your export is being prepared. "
+                "You will receive an email with a link to download it when it is ready."
+            ),
+        )
+
+        params = self.request.GET.copy()
+        params.pop("export", None)
+        return redirect(self.request.path + "?" + params.urlencode())
+
     def as_spreadsheet(self, queryset, spreadsheet_format):
         """Return a response with a spreadsheet representing the exported data from queryset, in the format specified"""
+        if spreadsheet_format in self.FORMATS and self.should_create_export_job(
+            queryset
+        ):
+            return self.create_export_job(spreadsheet_format)
+
         if spreadsheet_format == self.FORMAT_CSV:
             return self.write_csv_response(queryset)
         elif spreadsheet_format == self.FORMAT_XLSX:
@@ -70,10 +70,6 @@ def index(request, parent_page_id=None):
     else:
         pages = pages.order_by(ordering)
 
-    # Don't paginate if sorting by page order - all pages must be shown to
-    # allow drag-and-drop reordering
-    do_paginate = ordering != "ord"
-
     # We want specific page instances, but do not need streamfield values here
     pages = pages.defer_streamfields().specific()
 
@@ -87,10 +83,10 @@ def index(request, parent_page_id=None):
 
     pages = pages.annotate_site_root_state().annotate_approved_schedule()
 
-    # Pagination
-    if do_paginate:
-        paginator = Paginator(pages, per_page=50)
-        pages = paginator.get_page(request.GET.get("p"))
+    # Pagination. When sorting by page order, pages are reordered within the current
+    # page of results, and their positions are offset by the pages before it
+    paginator = Paginator(pages, per_page=50)
+    pages = paginator.get_page(request.GET.get("p"))
 
     show_ordering_column = request.GET.get("ordering") == "ord"
 
@@ -110,7 +106,6 @@ def index(request, parent_page_id=None):
         "ordering": ordering,
         "side_panels": side_panels,
         "pages": pages,
-        "do_paginate": do_paginate,
         "locale": None,
         "translations": [],
         "show_ordering_column": show_ordering_column,
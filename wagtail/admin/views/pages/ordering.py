@@ -1,5 +1,5 @@
 from django.core.exceptions import PermissionDenied
-from django.http import HttpResponse
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404
 
 from wagtail.models import Page
@@ -13,12 +13,17 @@ def set_page_position(request, page_to_move_id):
         raise PermissionDenied
 
     if request.method == "POST":
-        # Get position parameter
+        # Get position parameter, or the id of the page to move this page in front of
         position = request.GET.get("position", None)
+        before = request.GET.get("before", None)
 
         # Find page that's already in this position
         position_page = None
-        if position is not None:
+        if before is not None:
+            if not before.isdigit():
+                raise Http404
+            position_page = get_object_or_404(parent_page.get_children(), id=before)
+        elif position is not None:
             try:
                 position_page = parent_page.get_children()[int(position)]
             except IndexError:
@@ -29,13 +34,16 @@ def set_page_position(request, page_to_move_id):
         # any invalid moves *should* be caught by the permission check above,
         # so don't bother to catch InvalidMoveToDescendant
 
-        if position_page:
+        if before is not None:
+            if position_page.pk != page_to_move.pk:
+                page_to_move.move(position_page, pos="left", user=request.user)
+        elif position_page:
             # If the page has been moved to the right, insert it to the
-            # right. If left, then left.
-            old_position = list(parent_page.get_children()).index(page_to_move)
-            if int(position) < old_position:
+            # right. If left, then left. Siblings are ordered by path, so this
+            # doesn't need to find the page's current position
+            if position_page.path < page_to_move.path:
                 page_to_move.move(position_page, pos="left", user=request.user)
-            elif int(position) > old_position:
+            elif position_page.path > page_to_move.path:
                 page_to_move.move(position_page, pos="right", user=request.user)
         else:
             # Move page to end
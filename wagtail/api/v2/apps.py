@@ -10,12 +10,19 @@ class WagtailAPIV2AppConfig(AppConfig):
     verbose_name = _("Wagtail API v2")
 
     def ready(self):
+        from wagtail.api.v2.cache import register_signal_handlers
+
+        # Invalidate the response cache when pages change
+        register_signal_handlers()
+
         # Install cache purging signal handlers
         if getattr(settings, "WAGTAILAPI_USE_FRONTENDCACHE", False):
             if apps.is_installed("wagtail.contrib.frontend_cache"):
-                from wagtail.api.v2.signal_handlers import register_signal_handlers
+                from wagtail.api.v2.signal_handlers import (
+                    register_signal_handlers as register_frontend_cache_handlers,
+                )
 
-                register_signal_handlers()
+                register_frontend_cache_handlers()
             else:
                 raise ImproperlyConfigured(
                     "The setting 'WAGTAILAPI_USE_FRONTENDCACHE' is True but 'wagtail.contrib.frontend_cache' is not in INSTALLED_APPS."
@@ -0,0 +1,122 @@
+"""
+An optional server-side cache of API responses, enabled by setting
+``WAGTAILAPI_RESPONSE_CACHE`` to the name of one of the project's caches.
+
+Responses are cached by the request's host, path, query parameters (in a normalised
+order) and format. The cache keys also include a generation value, which is changed
+whenever a page is published, unpublished, moved or deleted, so that all of the cached
+responses are replaced at once.
+
+This module also keeps a version number for page URLs in the default cache, which is
+changed whenever a page is moved or its slug is changed. It is included in the ETags of
+page listings, as those changes update the URLs of pages without publishing them.
+"""
+import hashlib
+import uuid
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache as default_cache
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_delete
+
+from wagtail.signals import (
+    page_published,
+    page_slug_changed,
+    page_unpublished,
+    post_page_move,
+)
+
+GENERATION_CACHE_KEY = "wagtailapi:generation"
+PAGE_URLS_VERSION_CACHE_KEY = "wagtailapi:page-urls-version"
+DEFAULT_TIMEOUT = 300
+
+
+def get_response_cache():
+    alias = getattr(settings, "WAGTAILAPI_RESPONSE_CACHE", None)
+    if alias:
+        return caches[alias]
+
+
+def get_response_cache_timeout():
+    return getattr(settings, "WAGTAILAPI_RESPONSE_CACHE_TIMEOUT", DEFAULT_TIMEOUT)
+
+
+def get_request_signature(request):
+    """
+    Return a tuple that identifies the response to the given request, for use in
+    cache keys and ETags.
+    """
+    accepted_renderer = getattr(request, "accepted_renderer", None)
+    return (
+        request.get_host(),
+        request.path,
+        tuple(sorted(request.GET.lists())),
+        accepted_renderer.format if accepted_renderer else None,
+    )
+
+
+def make_hash(*parts):
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+
+
+def get_cache_key(cache, request):
+    generation = cache.get(GENERATION_CACHE_KEY)
+    if generation is None:
+        generation = uuid.uuid4().hex
+        cache.set(GENERATION_CACHE_KEY, generation, None)
+
+    return "wagtailapi:response:" + make_hash(
+        generation, get_request_signature(request)
+    )
+
+
+def _bump_generation():
+    cache = get_response_cache()
+    if cache is not None:
+        cache.set(GENERATION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def invalidate_response_cache():
+    """
+    Replace all of the cached responses once the current transaction is committed, so
+    that responses built from the data before the commit aren't cached under the new
+    generation.
+    """
+    if get_response_cache() is not None:
+        transaction.on_commit(_bump_generation)
+
+
+def get_page_urls_version():
+    version = default_cache.get(PAGE_URLS_VERSION_CACHE_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        default_cache.set(PAGE_URLS_VERSION_CACHE_KEY, version, None)
+    return version
+
+
+def _bump_page_urls_version():
+    default_cache.set(PAGE_URLS_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def page_changed_signal_handler(**kwargs):
+    invalidate_response_cache()
+
+
+def page_urls_changed_signal_handler(**kwargs):
+    transaction.on_commit(_bump_page_urls_version)
+
+
+def register_signal_handlers():
+    from wagtail.models import Page
+
+    page_published.connect(page_changed_signal_handler)
+    page_unpublished.connect(page_changed_signal_handler)
+    post_page_move.connect(page_changed_signal_handler)
+    for model in apps.get_models():
+        if issubclass(model, Page):
+            post_delete.connect(page_changed_signal_handler, sender=model)
+
+    post_page_move.connect(page_urls_changed_signal_handler)
+    page_slug_changed.connect(page_urls_changed_signal_handler)
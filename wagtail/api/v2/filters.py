@@ -72,6 +72,11 @@ class OrderingFilter(BaseFilterBackend):
         And random ordering
         Eg: ?order=random
         """
+        if "cursor" in request.GET:
+            # The ordering is applied by WagtailCursorPagination, which also allows
+            # ordering by some fields that aren't in the API
+            return queryset
+
         if "order" in request.GET:
             order_by = request.GET["order"]
 
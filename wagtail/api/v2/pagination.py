@@ -1,16 +1,36 @@
+import base64
+import binascii
+import json
 from collections import OrderedDict
 
 from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q, QuerySet
 from rest_framework.pagination import BasePagination
 from rest_framework.response import Response
 
 from .utils import BadRequestError
 
 
+def get_limit(request):
+    limit_max = getattr(settings, "WAGTAILAPI_LIMIT_MAX", 20)
+
+    try:
+        limit_default = 20 if not limit_max else min(20, limit_max)
+        limit = int(request.GET.get("limit", limit_default))
+        if limit < 0:
+            raise ValueError()
+    except ValueError:
+        raise BadRequestError("limit must be a positive integer")
+
+    if limit_max and limit > limit_max:
+        raise BadRequestError("limit cannot be higher than %d" % limit_max)
+
+    return limit
+
+
 class WagtailPagination(BasePagination):
     def paginate_queryset(self, queryset, request, view=None):
-        limit_max = getattr(settings, "WAGTAILAPI_LIMIT_MAX", 20)
-
         try:
             offset = int(request.GET.get("offset", 0))
             if offset < 0:
@@ -18,16 +38,7 @@ class WagtailPagination(BasePagination):
         except ValueError:
             raise BadRequestError("offset must be a positive integer")
 
-        try:
-            limit_default = 20 if not limit_max else min(20, limit_max)
-            limit = int(request.GET.get("limit", limit_default))
-            if limit < 0:
-                raise ValueError()
-        except ValueError:
-            raise BadRequestError("limit must be a positive integer")
-
-        if limit_max and limit > limit_max:
-            raise BadRequestError("limit cannot be higher than %d" % limit_max)
+        limit = get_limit(request)
 
         start = offset
         stop = offset + limit
@@ -51,3 +62,133 @@ class WagtailPagination(BasePagination):
             ]
         )
         return Response(data)
+
+
+class WagtailCursorPagination(BasePagination):
+    """
+    Paginates listings with the ``cursor`` parameter, which is given the ``next``
+    value from the previous page of results (or an empty string for the first page).
+
+    Rather than skipping over the items on previous pages with an offset, each page is
+    fetched by filtering on the position of the last item on the previous page, so that
+    the database can seek to it using the index on the ordering field. Items are
+    ordered by one of the view's ``cursor_pagination_fields`` (``id`` by default), then
+    by primary key, so that the position of every item is unique.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if "offset" in request.GET:
+            raise BadRequestError("offset cannot be used with cursor")
+
+        if not isinstance(queryset, QuerySet):
+            raise BadRequestError("cursor cannot be used with search")
+
+        limit = get_limit(request)
+
+        order = request.GET.get("order", "id")
+        field_name = order[1:] if order.startswith("-") else order
+        if field_name not in view.cursor_pagination_fields:
+            raise BadRequestError(
+                "cannot order by '%s' with cursor (must be one of: %s)"
+                % (order, ", ".join(view.cursor_pagination_fields))
+            )
+
+        self.view = view
+        self.order = order
+        self.reverse_order = order.startswith("-")
+        self.field = queryset.model._meta.get_field(field_name)
+        self.pk_field = queryset.model._meta.pk
+
+        if request.GET["cursor"]:
+            value, pk = self.decode_cursor(request.GET["cursor"])
+            queryset = queryset.filter(self.get_position_filter(value, pk))
+
+        # Fetch one more item than needed, to find out whether there is another page
+        items = list(queryset.order_by(*self.get_ordering())[: limit + 1])
+
+        if len(items) <= limit:
+            self.next_cursor = None
+        elif limit:
+            self.next_cursor = self.encode_cursor(items[limit - 1])
+        else:
+            self.next_cursor = request.GET["cursor"]
+
+        return items[:limit]
+
+    def get_ordering(self):
+        if self.field.primary_key:
+            return ["-pk" if self.reverse_order else "pk"]
+
+        # Keep null values at the end, so that they can be paginated through in the
+        # same way on every database
+        field = F(self.field.name)
+        if self.reverse_order:
+            field = field.desc(nulls_last=True) if self.field.null else field.desc()
+            return [field, "-pk"]
+        else:
+            field = field.asc(nulls_last=True) if self.field.null else field.asc()
+            return [field, "pk"]
+
+    def get_position_filter(self, value, pk):
+        """
+        Return a Q object that matches the items after the item with the given ordering
+        field value and primary key.
+        """
+        op = "lt" if self.reverse_order else "gt"
+        after_pk = Q(**{"pk__" + op: pk})
+
+        if self.field.primary_key:
+            return after_pk
+
+        if value is None:
+            return Q(**{self.field.name + "__isnull": True}) & after_pk
+
+        position_filter = Q(**{self.field.name + "__" + op: value}) | (
+            Q(**{self.field.name: value}) & after_pk
+        )
+        if self.field.null:
+            position_filter |= Q(**{self.field.name + "__isnull": True})
+        return position_filter
+
+    def encode_cursor(self, instance):
+        value = self.field.value_from_object(instance)
+        if value is not None:
+            value = self.field.value_to_string(instance)
+
+        data = json.dumps([self.order, value, self.pk_field.value_to_string(instance)])
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor):
+        try:
+            data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            order, value, pk = json.loads(data)
+            if order != self.order:
+                raise BadRequestError("cursor was given for a different order")
+
+            if value is not None:
+                value = self.field.to_python(value)
+            return value, self.pk_field.to_python(pk)
+        except (
+            binascii.Error,
+            UnicodeDecodeError,
+            ValueError,
+            TypeError,
+            ValidationError,
+        ):
+            raise BadRequestError("cursor is not valid")
+
+    def get_paginated_response(self, data):
+        data = OrderedDict(
+            [
+                (
+                    "meta",
+                    OrderedDict(
+                        [
+                            ("next", self.next_cursor),
+                        ]
+                    ),
+                ),
+                ("items", data),
+            ]
+        )
+        return Response(data)
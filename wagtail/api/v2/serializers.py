@@ -1,5 +1,6 @@
 from collections import OrderedDict
 
+from django.db import models
 from django.urls.exceptions import NoReverseMatch
 from modelcluster.models import get_all_child_relations
 from rest_framework import relations, serializers
@@ -7,6 +8,7 @@ from rest_framework.fields import Field, SkipField
 from taggit.managers import _TaggableManager
 
 from wagtail import fields as wagtailcore_fields
+from wagtail.models import Page, Site
 
 from .utils import get_object_detail_url
 
@@ -62,6 +64,9 @@ class PageHtmlUrlField(Field):
     def get_attribute(self, instance):
         return instance
 
+    def prepare_for_listing(self, instances):
+        set_site_root_paths(instances)
+
     def to_representation(self, page):
         try:
             return page.full_url
@@ -100,6 +105,9 @@ class PageLocaleField(Field):
     def get_attribute(self, instance):
         return instance
 
+    def prepare_for_listing(self, instances):
+        models.prefetch_related_objects(instances, "locale")
+
     def to_representation(self, page):
         return page.locale.language_code
 
@@ -123,6 +131,10 @@ class RelatedField(relations.RelatedField):
         self.serializer_class = kwargs.pop("serializer_class")
         super().__init__(*args, **kwargs)
 
+    def prepare_for_listing(self, instances):
+        if len(self.source_attrs) == 1:
+            models.prefetch_related_objects(instances, self.source)
+
     def to_representation(self, value):
         serializer = self.serializer_class(context=self.context)
         return serializer.to_representation(value)
@@ -141,9 +153,32 @@ class PageParentField(relations.RelatedField):
     def get_attribute(self, instance):
         parent = instance.get_parent()
 
-        if self.context["base_queryset"].filter(id=parent.id).exists():
+        if hasattr(self, "_visible_parent_ids"):
+            if parent.id in self._visible_parent_ids:
+                return parent
+        elif self.context["base_queryset"].filter(id=parent.id).exists():
             return parent
 
+    def prepare_for_listing(self, instances):
+        # Fetch the parent pages and check that they can be seen in bulk. The parents
+        # are cached on the pages, where get_parent() will find them
+        parent_paths = {
+            page.path[: -page.steplen] for page in instances if page.depth > 1
+        }
+        parents = {
+            parent.path: parent for parent in Page.objects.filter(path__in=parent_paths)
+        }
+        for page in instances:
+            if page.path[: -page.steplen] in parents:
+                page._cached_parent_obj = parents[page.path[: -page.steplen]]
+
+        set_site_root_paths(parents.values())
+        self._visible_parent_ids = set(
+            self.context["base_queryset"]
+            .filter(id__in=[parent.id for parent in parents.values()])
+            .values_list("id", flat=True)
+        )
+
     def to_representation(self, value):
         serializer_class = get_serializer_class(
             value.__class__,
@@ -163,6 +198,12 @@ class PageAliasOfField(relations.RelatedField):
     def get_attribute(self, instance):
         return instance.alias_of
 
+    def prepare_for_listing(self, instances):
+        models.prefetch_related_objects(instances, "alias_of")
+        set_site_root_paths(
+            [page.alias_of for page in instances if page.alias_of_id is not None]
+        )
+
     def to_representation(self, value):
         serializer_class = get_serializer_class(
             value.__class__,
@@ -217,6 +258,21 @@ class ChildRelationField(Field):
         self.serializer_class = kwargs.pop("serializer_class")
         super().__init__(*args, **kwargs)
 
+    def prepare_for_listing(self, instances):
+        # Fetch the child objects of all of the instances at once, then let the child
+        # serializer's fields do the same for their own relations
+        models.prefetch_related_objects(instances, self.source)
+        child_objects = [
+            child_object
+            for instance in instances
+            for child_object in getattr(instance, self.source).all()
+        ]
+
+        serializer = self.serializer_class(context=self.context)
+        for field in serializer.fields.values():
+            if hasattr(field, "prepare_for_listing"):
+                field.prepare_for_listing(child_objects)
+
     def to_representation(self, value):
         serializer = self.serializer_class(context=self.context)
 
@@ -278,10 +334,53 @@ class TagsField(Field):
     "tags": ["bird", "wagtail"]
     """
 
+    def prepare_for_listing(self, instances):
+        models.prefetch_related_objects(instances, self.source)
+
     def to_representation(self, value):
+        prefetched_tags = getattr(value.instance, "_prefetched_objects_cache", {}).get(
+            value.prefetch_cache_name
+        )
+        if prefetched_tags is not None:
+            return sorted(tag.name for tag in prefetched_tags)
+
         return list(value.all().order_by("name").values_list("name", flat=True))
 
 
+def set_site_root_paths(pages):
+    """
+    Look up the site root paths once for all of the given pages, rather than once for
+    each page when its URL is found (see Page._get_site_root_paths). Pages that
+    already have them are skipped.
+    """
+    site_root_paths = None
+    for page in pages:
+        if hasattr(page, "_wagtail_cached_site_root_paths"):
+            continue
+        if site_root_paths is None:
+            site_root_paths = Site.get_site_root_paths()
+        page._wagtail_cached_site_root_paths = site_root_paths
+
+
+class BaseListSerializer(serializers.ListSerializer):
+    """
+    Serializes a list of objects for listing views.
+
+    Before serialising the objects one by one, each field on the child serializer
+    that defines a ``prepare_for_listing(instances)`` method is given the whole list,
+    so that it can fetch whatever it needs for all of the objects in bulk.
+    """
+
+    def to_representation(self, data):
+        instances = list(data.all() if isinstance(data, models.Manager) else data)
+
+        for field in self.child.fields.values():
+            if hasattr(field, "prepare_for_listing"):
+                field.prepare_for_listing(instances)
+
+        return super().to_representation(instances)
+
+
 class BaseSerializer(serializers.ModelSerializer):
     # Add StreamField to serializer_field_mapping
     serializer_field_mapping = (
@@ -406,6 +505,7 @@ def get_serializer_class(
     class Meta:
         model = model_
         fields = list(field_names)
+        list_serializer_class = BaseListSerializer
 
     attrs = {
         "Meta": Meta,
@@ -4,12 +4,17 @@ from unittest import mock
 
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.test import TestCase
-from django.test.utils import override_settings
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
 from rest_framework.test import APIClient
 
 from wagtail.api.v2 import signal_handlers
+from wagtail.images.models import PendingRendition, Rendition
+from wagtail.images.tests.utils import Image, get_test_image_file
 from wagtail.models import Locale, Page, Site
 from wagtail.models.view_restrictions import BaseViewRestriction
 from wagtail.test.demosite import models
@@ -368,6 +373,89 @@ class TestPageListing(WagtailTestUtils, TestCase):
                 },
             )
 
+    def test_all_fields_query_count_does_not_depend_on_limit(self):
+        blog_index = self.get_homepage().add_child(
+            instance=models.BlogIndexPage(title="Query count", slug="query-count")
+        )
+        image = Image.objects.create(title="Test image", file=get_test_image_file())
+
+        def add_entry(number):
+            entry = models.BlogEntryPage(
+                title="Entry %d" % number,
+                slug="entry-%d" % number,
+                date="2023-01-01",
+                body="<p>Body</p>",
+                feed_image=image,
+            )
+            entry.tags.add("alpha", "beta")
+            entry.carousel_items.add(
+                models.BlogEntryPageCarouselItem(
+                    image=image, caption="Caption", link_external="http://example.com/"
+                )
+            )
+            entry.related_links.add(
+                models.BlogEntryPageRelatedLink(
+                    title="Link", link_external="http://example.com/"
+                )
+            )
+            blog_index.add_child(instance=entry)
+
+        def count_queries():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.get_response(
+                    type="demosite.BlogEntryPage", child_of=blog_index.id, fields="*"
+                )
+            content = json.loads(response.content.decode("UTF-8"))
+            for page in content["items"]:
+                self.assertEqual(page["tags"], ["alpha", "beta"])
+                self.assertEqual(len(page["carousel_items"]), 1)
+            return len(queries)
+
+        add_entry(1)
+        # The first request creates the rendition and caches the site root paths
+        count_queries()
+        query_count = count_queries()
+
+        for number in range(2, 6):
+            add_entry(number)
+
+        self.assertEqual(count_queries(), query_count)
+
+    @override_settings(WAGTAILIMAGES_DEFER_RENDITIONS=True)
+    def test_listing_defers_renditions(self):
+        blog_index = self.get_homepage().add_child(
+            instance=models.BlogIndexPage(title="Deferred", slug="deferred")
+        )
+        for number in range(3):
+            image = Image.objects.create(
+                title="Image %d" % number, file=get_test_image_file()
+            )
+            blog_index.add_child(
+                instance=models.BlogEntryPage(
+                    title="Entry %d" % number,
+                    slug="entry-%d" % number,
+                    date="2023-01-01",
+                    body="<p>Body</p>",
+                    feed_image=image,
+                )
+            )
+
+        with mock.patch.object(Image, "generate_rendition_file") as generate:
+            response = self.get_response(
+                child_of=blog_index.id,
+                type="demosite.BlogEntryPage",
+                fields="feed_image_thumbnail",
+            )
+        content = json.loads(response.content.decode("UTF-8"))
+
+        # The renditions are queued rather than generated during the request
+        generate.assert_not_called()
+        self.assertEqual(len(content["items"]), 3)
+        for page in content["items"]:
+            self.assertEqual(page["feed_image_thumbnail"]["width"], 300)
+        self.assertFalse(Rendition.objects.exists())
+        self.assertEqual(PendingRendition.objects.count(), 3)
+
     def test_all_fields_then_remove_something(self):
         response = self.get_response(
             type="demosite.BlogEntryPage", fields="*,-title,-date,-seo_title"
@@ -1047,6 +1135,152 @@ class TestPageListing(WagtailTestUtils, TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertEqual(content, {"message": "offset must be a positive integer"})
 
+    # CURSOR
+
+    def get_pages_with_cursor(self, **params):
+        page_id_list = []
+        cursor = ""
+        while cursor is not None:
+            response = self.get_response(cursor=cursor, **params)
+            self.assertEqual(response.status_code, 200)
+            content = json.loads(response.content.decode("UTF-8"))
+            self.assertNotIn("total_count", content["meta"])
+
+            page_id_list.extend(self.get_page_id_list(content))
+            cursor = content["meta"]["next"]
+
+        return page_id_list
+
+    def get_listed_pages(self):
+        # The pages that the endpoint lists when no filters are given
+        return (
+            Page.objects.descendant_of(
+                Site.objects.get(is_default_site=True).root_page, inclusive=True
+            )
+            .live()
+            .public()
+        )
+
+    def test_cursor(self):
+        page_ids = list(
+            self.get_listed_pages().order_by("id").values_list("id", flat=True)
+        )
+
+        response = self.get_response(cursor="", limit=3)
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(self.get_page_id_list(content), page_ids[:3])
+        self.assertIsInstance(content["meta"]["next"], str)
+
+        response = self.get_response(cursor=content["meta"]["next"], limit=3)
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(self.get_page_id_list(content), page_ids[3:6])
+
+    def test_cursor_returns_all_pages(self):
+        page_id_list = self.get_pages_with_cursor(limit=3)
+
+        self.assertEqual(
+            page_id_list,
+            list(self.get_listed_pages().order_by("id").values_list("id", flat=True)),
+        )
+
+    def test_cursor_with_reverse_order(self):
+        page_id_list = self.get_pages_with_cursor(order="-id", limit=3)
+
+        self.assertEqual(
+            page_id_list,
+            list(self.get_listed_pages().order_by("-id").values_list("id", flat=True)),
+        )
+
+    def test_cursor_with_order_by_path(self):
+        page_id_list = self.get_pages_with_cursor(order="path", limit=3)
+
+        self.assertEqual(
+            page_id_list,
+            list(self.get_listed_pages().order_by("path").values_list("id", flat=True)),
+        )
+
+    def test_cursor_with_order_by_first_published_at(self):
+        # Give some pages the same date, and one no date, to check that they are
+        # neither skipped nor repeated
+        page_ids = list(
+            self.get_listed_pages().order_by("id").values_list("id", flat=True)
+        )
+        Page.objects.filter(id__in=page_ids[1:4]).update(
+            first_published_at=self.get_homepage().first_published_at
+        )
+        Page.objects.filter(id=page_ids[4]).update(first_published_at=None)
+
+        pages = list(self.get_listed_pages())
+        dated_pages = [page for page in pages if page.first_published_at]
+        undated_pages = [page for page in pages if not page.first_published_at]
+
+        # Pages without a date come last in either direction
+        for order, descending in [
+            ("first_published_at", False),
+            ("-first_published_at", True),
+        ]:
+            with self.subTest(order=order):
+                page_id_list = self.get_pages_with_cursor(order=order, limit=2)
+
+                expected_pages = sorted(
+                    dated_pages,
+                    key=lambda page: (page.first_published_at, page.id),
+                    reverse=descending,
+                ) + sorted(undated_pages, key=lambda page: page.id, reverse=descending)
+                self.assertEqual(page_id_list, [page.id for page in expected_pages])
+
+    def test_cursor_with_filter(self):
+        page_id_list = self.get_pages_with_cursor(
+            type="demosite.BlogEntryPage", limit=1
+        )
+
+        self.assertEqual(page_id_list, [16, 18, 19])
+
+    def test_cursor_with_unsupported_order_gives_error(self):
+        response = self.get_response(cursor="", order="title")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            content,
+            {
+                "message": "cannot order by 'title' with cursor (must be one of: id, path, first_published_at)"
+            },
+        )
+
+    def test_cursor_with_offset_gives_error(self):
+        response = self.get_response(cursor="", offset=10)
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(content, {"message": "offset cannot be used with cursor"})
+
+    def test_cursor_with_search_gives_error(self):
+        response = self.get_response(cursor="", search="blog")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(content, {"message": "cursor cannot be used with search"})
+
+    def test_invalid_cursor_gives_error(self):
+        response = self.get_response(cursor="abc")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(content, {"message": "cursor is not valid"})
+
+    def test_cursor_for_different_order_gives_error(self):
+        response = self.get_response(cursor="", limit=1)
+        cursor = json.loads(response.content.decode("UTF-8"))["meta"]["next"]
+
+        response = self.get_response(cursor=cursor, order="path")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(content, {"message": "cursor was given for a different order"})
+
     # SEARCH
 
     def test_search_for_blog(self):
@@ -1774,3 +2008,164 @@ class TestPageCacheInvalidation(TestCase):
         Page.objects.get(id=2).specific.save_revision()
 
         purge.assert_not_called()
+
+
+class TestPageConditionalRequests(TestCase):
+    fixtures = ["demosite.json"]
+
+    def get_listing_response(self, **headers):
+        return self.client.get(
+            reverse("wagtailapi_v2:pages:listing"),
+            {"type": "demosite.BlogEntryPage"},
+            **headers,
+        )
+
+    def get_detail_response(self, **headers):
+        return self.client.get(
+            reverse("wagtailapi_v2:pages:detail", args=(16,)), **headers
+        )
+
+    def test_listing_not_modified(self):
+        response = self.get_listing_response()
+        self.assertEqual(response.status_code, 200)
+
+        response = self.get_listing_response(HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_listing_etag_changes_on_publish(self):
+        etag = self.get_listing_response()["ETag"]
+
+        Page.objects.get(id=16).specific.save_revision().publish()
+
+        response = self.get_listing_response(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_listing_modified_after_unpublish(self):
+        Page.objects.get(id=16).specific.save_revision().publish()
+        response = self.get_listing_response()
+        self.assertEqual(response.status_code, 200)
+        count = response.json()["meta"]["total_count"]
+
+        # Unpublishing a page doesn't change the dates of the remaining pages, so
+        # listings can't be validated with If-Modified-Since
+        self.assertFalse(response.has_header("Last-Modified"))
+        Page.objects.get(id=16).specific.unpublish()
+
+        response = self.get_listing_response(
+            HTTP_IF_MODIFIED_SINCE=http_date(timezone.now().timestamp())
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["meta"]["total_count"], count - 1)
+
+    def test_listing_etag_changes_on_move(self):
+        etag = self.get_listing_response()["ETag"]
+
+        # Moving the blog index changes the URLs of the blog entries without
+        # publishing them
+        with self.captureOnCommitCallbacks(execute=True):
+            Page.objects.get(id=5).move(Page.objects.get(id=4), pos="last-child")
+
+        response = self.get_listing_response(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_listing_etag_depends_on_query(self):
+        etag = self.get_listing_response()["ETag"]
+
+        response = self.client.get(
+            reverse("wagtailapi_v2:pages:listing"),
+            {"type": "demosite.BlogEntryPage", "fields": "date"},
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_detail_not_modified(self):
+        response = self.get_detail_response()
+        self.assertEqual(response.status_code, 200)
+
+        response = self.get_detail_response(HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+    def test_detail_etag_changes_on_publish(self):
+        etag = self.get_detail_response()["ETag"]
+
+        Page.objects.get(id=16).specific.save_revision().publish()
+
+        response = self.get_detail_response(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_no_etag_for_search(self):
+        response = self.client.get(
+            reverse("wagtailapi_v2:pages:listing"), {"search": "blog"}
+        )
+        self.assertFalse(response.has_header("ETag"))
+
+
+@override_settings(WAGTAILAPI_RESPONSE_CACHE="default")
+class TestPageResponseCache(WagtailTestUtils, TestCase):
+    fixtures = ["demosite.json"]
+
+    def get_response(self, **params):
+        return self.client.get(reverse("wagtailapi_v2:pages:listing"), params)
+
+    def test_response_is_cached(self):
+        response = self.get_response(type="demosite.BlogEntryPage")
+
+        # Only the cache is queried (the test project uses the database cache)
+        with CaptureQueriesContext(connection) as queries:
+            cached_response = self.get_response(type="demosite.BlogEntryPage")
+
+        self.assertFalse(
+            [query for query in queries if "wagtailcore_page" in query["sql"]]
+        )
+        self.assertEqual(cached_response.content, response.content)
+        self.assertEqual(cached_response["ETag"], response["ETag"])
+
+    def test_cache_is_invalidated_on_publish(self):
+        self.get_response(type="demosite.BlogEntryPage")
+
+        page = Page.objects.get(id=16).specific
+        page.title = "New title"
+        with self.captureOnCommitCallbacks(execute=True):
+            page.save_revision().publish()
+
+        content = json.loads(
+            self.get_response(type="demosite.BlogEntryPage").content.decode("UTF-8")
+        )
+        self.assertIn("New title", [item["title"] for item in content["items"]])
+
+    def test_cache_is_invalidated_on_commit(self):
+        self.get_response(type="demosite.BlogEntryPage")
+
+        page = Page.objects.get(id=16).specific
+        page.title = "New title"
+        with self.captureOnCommitCallbacks() as callbacks:
+            page.save_revision().publish()
+
+        # Until the transaction is committed, other requests may still see the old
+        # data, so the cached responses are kept
+        content = json.loads(
+            self.get_response(type="demosite.BlogEntryPage").content.decode("UTF-8")
+        )
+        self.assertNotIn("New title", [item["title"] for item in content["items"]])
+
+        for callback in callbacks:
+            callback()
+
+        content = json.loads(
+            self.get_response(type="demosite.BlogEntryPage").content.decode("UTF-8")
+        )
+        self.assertIn("New title", [item["title"] for item in content["items"]])
+
+    def test_logged_in_requests_are_not_cached(self):
+        self.login()
+        self.get_response(type="demosite.BlogEntryPage")
+
+        with CaptureQueriesContext(connection) as queries:
+            self.get_response(type="demosite.BlogEntryPage")
+
+        self.assertTrue(
+            [query for query in queries if "wagtailcore_page" in query["sql"]]
+        )
@@ -2,9 +2,13 @@ from collections import OrderedDict
 
 from django.conf import settings
 from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count, Max, QuerySet
+from django.db.models.functions import Coalesce
 from django.http import Http404
 from django.shortcuts import redirect
 from django.urls import path, reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from modelcluster.fields import ParentalKey
 from rest_framework import status
 from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
@@ -14,6 +18,14 @@ from rest_framework.viewsets import GenericViewSet
 from wagtail.api import APIField
 from wagtail.models import Page, PageViewRestriction, Site
 
+from .cache import (
+    get_cache_key,
+    get_page_urls_version,
+    get_request_signature,
+    get_response_cache,
+    get_response_cache_timeout,
+    make_hash,
+)
 from .filters import (
     AncestorOfFilter,
     ChildOfFilter,
@@ -24,7 +36,7 @@ from .filters import (
     SearchFilter,
     TranslationOfFilter,
 )
-from .pagination import WagtailPagination
+from .pagination import WagtailCursorPagination, WagtailPagination
 from .serializers import BaseSerializer, PageSerializer, get_serializer_class
 from .utils import (
     BadRequestError,
@@ -38,6 +50,11 @@ class BaseAPIViewSet(GenericViewSet):
     renderer_classes = [JSONRenderer, BrowsableAPIRenderer]
 
     pagination_class = WagtailPagination
+    # Used in place of pagination_class when the "cursor" parameter is given
+    cursor_pagination_class = WagtailCursorPagination
+    # The fields that listings can be ordered by with cursor pagination. These should
+    # all be indexed
+    cursor_pagination_fields = ["id"]
     base_serializer_class = BaseSerializer
     filter_backends = []
     model = None  # Set on subclass
@@ -46,6 +63,7 @@ class BaseAPIViewSet(GenericViewSet):
         [
             "limit",
             "offset",
+            "cursor",
             "fields",
             "order",
             "search",
@@ -63,6 +81,15 @@ class BaseAPIViewSet(GenericViewSet):
     detail_only_fields = []
     name = None  # Set on subclass.
 
+    # Whether to add ETag and Last-Modified headers from get_listing_validators and
+    # get_detail_validators, and respond to matching conditional requests with a 304
+    conditional_requests = True
+
+    # Whether responses to anonymous requests may be stored in the cache named by the
+    # WAGTAILAPI_RESPONSE_CACHE setting. This should only be enabled on endpoints whose
+    # content is invalidated by wagtail.api.v2.cache
+    cache_responses = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -72,21 +99,148 @@ class BaseAPIViewSet(GenericViewSet):
         # summary of the used types to the response.
         self.seen_types = OrderedDict()
 
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            if "cursor" in self.request.GET:
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
     def get_queryset(self):
         return self.model.objects.all().order_by("id")
 
     def listing_view(self, request):
+        cached_response = self.get_cached_response()
+        if cached_response is not None:
+            return cached_response
+
         queryset = self.get_queryset()
         self.check_query_parameters(queryset)
         queryset = self.filter_queryset(queryset)
+
+        validators = self.get_listing_validators(queryset)
+        not_modified_response = self.get_not_modified_response(validators)
+        if not_modified_response is not None:
+            return not_modified_response
+
         queryset = self.paginate_queryset(queryset)
         serializer = self.get_serializer(queryset, many=True)
-        return self.get_paginated_response(serializer.data)
+        return self.finalize_api_response(
+            self.get_paginated_response(serializer.data), validators
+        )
 
     def detail_view(self, request, pk):
+        cached_response = self.get_cached_response()
+        if cached_response is not None:
+            return cached_response
+
         instance = self.get_object()
+
+        validators = self.get_detail_validators(instance)
+        not_modified_response = self.get_not_modified_response(validators)
+        if not_modified_response is not None:
+            return not_modified_response
+
         serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        return self.finalize_api_response(Response(serializer.data), validators)
+
+    def get_listing_validators(self, queryset):
+        """
+        Override this to return an ``(etag, last_modified)`` tuple for a listing of the
+        given (filtered, but not paginated) queryset. See ``make_validators``.
+        """
+        return None
+
+    def get_detail_validators(self, instance):
+        """
+        Override this to return an ``(etag, last_modified)`` tuple for the detail view
+        of the given object. See ``make_validators``.
+        """
+        return None
+
+    def make_validators(self, last_modified, *parts):
+        """
+        Return an ``(etag, last_modified)`` tuple for the current request, where the
+        ETag is derived from the request and the given parts, which should identify
+        the version of the data that the response is built from.
+        """
+        etag = quote_etag(
+            make_hash(
+                self.name,
+                get_request_signature(self.request),
+                last_modified.isoformat() if last_modified else None,
+                parts,
+            )
+        )
+        return etag, last_modified
+
+    def get_not_modified_response(self, validators):
+        if not (validators and self.conditional_requests):
+            return None
+
+        etag, last_modified = validators
+        return get_conditional_response(
+            self.request,
+            etag=etag,
+            last_modified=int(last_modified.timestamp()) if last_modified else None,
+        )
+
+    def is_response_cacheable(self):
+        # Responses may depend on the user and on passwords stored in their session
+        # (see PageViewRestriction), so only anonymous requests without a session
+        # are cached
+        return (
+            self.cache_responses
+            and not self.request.user.is_authenticated
+            and settings.SESSION_COOKIE_NAME not in self.request.COOKIES
+        )
+
+    def get_cached_response(self):
+        """
+        Return the response for the current request from the response cache (or a
+        304 response, if it matches the request's conditional headers), or None if
+        it isn't cached.
+        """
+        self._response_cache_key = None
+        cache = get_response_cache()
+        if cache is None or not self.is_response_cacheable():
+            return None
+
+        self._response_cache_key = get_cache_key(cache, self.request)
+        cached = cache.get(self._response_cache_key)
+        if cached is None:
+            return None
+
+        validators = cached["validators"]
+        not_modified_response = self.get_not_modified_response(validators)
+        if not_modified_response is not None:
+            return not_modified_response
+
+        return self.finalize_api_response(Response(cached["data"]), validators)
+
+    def finalize_api_response(self, response, validators):
+        """
+        Add the ETag and Last-Modified headers to the response, and store it in the
+        response cache if it was looked up there.
+        """
+        if validators and self.conditional_requests:
+            etag, last_modified = validators
+            response["ETag"] = etag
+            if last_modified:
+                response["Last-Modified"] = http_date(last_modified.timestamp())
+
+        cache_key = getattr(self, "_response_cache_key", None)
+        if cache_key and response.status_code == 200:
+            get_response_cache().set(
+                cache_key,
+                {"data": response.data, "validators": validators},
+                get_response_cache_timeout(),
+            )
+            self._response_cache_key = None
+
+        return response
 
     def find_view(self, request):
         queryset = self.get_queryset()
@@ -459,8 +613,10 @@ class PagesAPIViewSet(BaseAPIViewSet):
         "title",
     ]
     detail_only_fields = ["parent"]
+    cursor_pagination_fields = ["id", "path", "first_published_at"]
     name = "pages"
     model = Page
+    cache_responses = True
 
     @classmethod
     def get_detail_default_fields(cls, model):
@@ -578,6 +734,42 @@ class PagesAPIViewSet(BaseAPIViewSet):
         base = super().get_object()
         return base.specific
 
+    def is_response_cacheable(self):
+        # Randomly ordered listings should be different each time
+        return (
+            super().is_response_cacheable()
+            and self.request.GET.get("order") != "random"
+        )
+
+    def get_listing_validators(self, queryset):
+        if not isinstance(queryset, QuerySet):
+            # Search results can't be aggregated
+            return None
+
+        if self.request.GET.get("order") == "random":
+            return None
+
+        result = queryset.order_by().aggregate(
+            last_modified=Max(
+                Coalesce("last_published_at", "latest_revision_created_at")
+            ),
+            count=Count("id"),
+        )
+        # Listings have no Last-Modified header, as unpublishing, deleting or moving a
+        # page changes a listing without changing the dates of the pages in it. The
+        # ETag covers those through the count, and through the URLs version, which is
+        # changed when a page is moved or its slug is changed
+        return self.make_validators(
+            None, result["last_modified"], result["count"], get_page_urls_version()
+        )
+
+    def get_detail_validators(self, instance):
+        return self.make_validators(
+            instance.last_published_at or instance.latest_revision_created_at,
+            instance.pk,
+            instance.url_path,
+        )
+
     def find_object(self, queryset, request):
         site = Site.find_for_request(request)
         if "html_path" in request.GET and site is not None:
@@ -1,4 +1,5 @@
 import collections
+import hashlib
 import itertools
 import json
 import re
@@ -7,12 +8,14 @@ from importlib import import_module
 
 from django import forms
 from django.core import checks
+from django.core.cache import InvalidCacheBackendError, caches
 from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
 from django.template.loader import render_to_string
 from django.utils.encoding import force_str
 from django.utils.functional import cached_property
 from django.utils.html import format_html
-from django.utils.safestring import mark_safe
+from django.utils.safestring import SafeData, mark_safe
 from django.utils.text import capfirst
 
 from wagtail.admin.staticfiles import versioned_static
@@ -60,6 +63,13 @@ class Block(metaclass=BaseBlock):
         icon = "placeholder"
         classname = None
         group = ""
+        # Whether to cache the output of render(); see get_render_cache_key
+        cache = False
+        # Timeout for cached output, in seconds; None uses the cache backend's default
+        cache_timeout = None
+        # Names of template context variables (with optional dotted attribute lookups, such as
+        # 'request.user') that the rendered output depends on, aside from the block value
+        cache_vary_on = ()
 
     # Attributes of Meta which can legally be modified after the block has been instantiated.
     # Used to implement __eq__. label is not included here, despite it technically being mutable via
@@ -219,17 +229,96 @@ class Block(metaclass=BaseBlock):
         Return a text rendering of 'value', suitable for display on templates. By default, this will
         use a template (with the passed context, supplemented by the result of get_context) if a
         'template' property is specified on the block, and fall back on render_basic otherwise.
+
+        If the 'cache' meta option is set, the output is stored in the cache under the key returned
+        by get_render_cache_key, and reused for subsequent renders of the same value.
         """
+        cache_key = self.get_render_cache_key(value, context=context)
+        if cache_key is not None:
+            cache = get_block_render_cache()
+            cached = cache.get(cache_key)
+            if cached is not None:
+                # Output is cached along with whether it was marked as safe, so that
+                # plain text output (as from render_basic) is still escaped
+                rendered, is_safe = cached
+                return mark_safe(rendered) if is_safe else rendered
+
         template = self.get_template(context=context)
         if not template:
-            return self.render_basic(value, context=context)
-
-        if context is None:
-            new_context = self.get_context(value)
+            rendered = self.render_basic(value, context=context)
         else:
-            new_context = self.get_context(value, parent_context=dict(context))
+            if context is None:
+                new_context = self.get_context(value)
+            else:
+                new_context = self.get_context(value, parent_context=dict(context))
+
+            rendered = mark_safe(render_to_string(template, new_context))
+
+        if cache_key is not None:
+            cached = (str(rendered), isinstance(rendered, SafeData))
+            if self.meta.cache_timeout is None:
+                cache.set(cache_key, cached)
+            else:
+                cache.set(cache_key, cached, self.meta.cache_timeout)
+
+        return rendered
+
+    @cached_property
+    def definition_hash(self):
+        """
+        A hash of this block's definition (its class, constructor arguments - including those of
+        any child blocks - and template), which changes whenever the definition does. This is
+        None if the constructor arguments can't be serialized (such as lambdas), in which case
+        the block's output isn't cached.
+        """
+        from django.db.migrations.writer import MigrationWriter
 
-        return mark_safe(render_to_string(template, new_context))
+        try:
+            serialized = MigrationWriter.serialize(self)[0]
+        except ValueError:
+            return None
+
+        definition = "%s.%s:%s:%s" % (
+            type(self).__module__,
+            type(self).__qualname__,
+            serialized,
+            getattr(self.meta, "template", None),
+        )
+        return hashlib.sha1(definition.encode()).hexdigest()
+
+    def get_render_cache_key(self, value, context=None):
+        """
+        Return the cache key under which the output of render() is stored for this value and
+        context, or None if it should not be cached (the default, unless the 'cache' meta option
+        is set).
+
+        The key is built from the block definition, the value (as returned by get_prep_value)
+        and the context variables listed in the 'cache_vary_on' meta option, so any change to the
+        content results in a new key. Blocks whose output depends on other data - such as the
+        current state of objects that the value refers to - should override this to include it.
+        """
+        if not self.meta.cache or self.definition_hash is None:
+            return None
+
+        vary_on = []
+        for path in self.meta.cache_vary_on:
+            bits = path.split(".")
+            variable = context.get(bits[0]) if context is not None else None
+            for bit in bits[1:]:
+                variable = getattr(variable, bit, None)
+            # Use the primary key of model instances (such as request.user), rather than
+            # their string representation
+            vary_on.append(force_str(getattr(variable, "pk", variable)))
+
+        value_json = json.dumps(
+            [self.get_prep_value(value), vary_on],
+            cls=DjangoJSONEncoder,
+            sort_keys=True,
+        )
+        return "wagtail-block-render-%s-%s" % (
+            self.definition_hash,
+            hashlib.sha1(value_json.encode()).hexdigest(),
+        )
 
     def get_api_representation(self, value, context=None):
         """
@@ -422,6 +511,17 @@ class Block(metaclass=BaseBlock):
         )
 
 
+def get_block_render_cache():
+    """
+    Return the cache used to store rendered block output - the 'blocks' cache if one is
+    configured, or the default cache otherwise.
+    """
+    try:
+        return caches["blocks"]
+    except InvalidCacheBackendError:
+        return caches["default"]
+
+
 class BoundBlock:
     def __init__(self, block, value, prefix=None, errors=None):
         self.block = block
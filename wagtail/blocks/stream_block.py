@@ -540,7 +540,14 @@ class StreamValue(MutableSequence):
         def __len__(self):
             return len(self.block_names)
 
-    def __init__(self, stream_block, stream_data, is_lazy=False, raw_text=None):
+    def __init__(
+        self,
+        stream_block,
+        stream_data,
+        is_lazy=False,
+        raw_text=None,
+        prefetch_limit=None,
+    ):
         """
         Construct a StreamValue linked to the given StreamBlock,
         with child values given in stream_data.
@@ -559,12 +566,18 @@ class StreamValue(MutableSequence):
         migrated to a StreamField. In this situation we return a blank StreamValue
         with the raw text accessible under the `raw_text` attribute, so that migration
         code can be rewritten to convert it as desired.
+
+        prefetch_limit applies when is_lazy=True. By default, accessing a block converts
+        every block of the same type in the stream at once; if prefetch_limit is given,
+        only that many blocks of the same type are converted, starting from the one
+        accessed.
         """
         self.stream_block = (
             stream_block  # the StreamBlock object that handles this value
         )
         self.is_lazy = is_lazy
         self.raw_text = raw_text
+        self.prefetch_limit = prefetch_limit
 
         if is_lazy:
             # store raw stream data in _raw_data; on retrieval it will be converted to a native
@@ -603,7 +616,17 @@ class StreamValue(MutableSequence):
 
         if self._bound_blocks[i] is None:
             raw_value = self._raw_data[i]
-            self._prefetch_blocks(raw_value["type"])
+            if self.prefetch_limit:
+                # Only convert a limited number of blocks of this type, starting from this
+                # one, so that accessing the first few blocks of a long stream doesn't
+                # convert the whole stream
+                self._prefetch_blocks(
+                    raw_value["type"],
+                    start=range(len(self._raw_data))[i],
+                    limit=self.prefetch_limit,
+                )
+            else:
+                self._prefetch_blocks(raw_value["type"])
 
         return self._bound_blocks[i]
 
@@ -622,22 +645,26 @@ class StreamValue(MutableSequence):
     def raw_data(self):
         return StreamValue.RawDataView(self)
 
-    def _prefetch_blocks(self, type_name):
+    def _prefetch_blocks(self, type_name, start=0, limit=None):
         """
         Populate _bound_blocks with all items in this stream of type `type_name` that exist in
-        _raw_data but do not already exist in _bound_blocks.
+        _raw_data but do not already exist in _bound_blocks - or if `limit` is given, that many
+        of those items from index `start` onwards.
 
         Fetching is done via the block's bulk_to_python method, so that database lookups are
         batched into a single query where possible.
         """
         child_block = self.stream_block.child_blocks[type_name]
-        # create a mapping of all the child blocks matching the given block type,
+        # create a mapping of the child blocks matching the given block type,
         # mapping (index within the stream) => (raw block value)
-        raw_values = OrderedDict(
-            (i, raw_item["value"])
-            for i, raw_item in enumerate(self._raw_data)
-            if raw_item["type"] == type_name and self._bound_blocks[i] is None
-        )
+        raw_values = OrderedDict()
+        for i in range(start, len(self._raw_data)):
+            raw_item = self._raw_data[i]
+            if self._bound_blocks[i] is None and raw_item["type"] == type_name:
+                raw_values[i] = raw_item["value"]
+                if limit and len(raw_values) >= limit:
+                    break
+
         # pass the raw block values to bulk_to_python as a list
         converted_values = child_block.bulk_to_python(raw_values.values())
 
@@ -20,7 +20,19 @@ class PurgeRequest(Request):
         return "PURGE"
 
 
+class PurgeError(Exception):
+    pass
+
+
 class BaseBackend:
+    # The maximum number of URLs that can be purged in a single call to purge_batch,
+    # or None if there is no limit. Used by the purge queue to split up its batches
+    CHUNK_SIZE = None
+
+    # Failed purges are logged, and then also raised as PurgeError if this is set.
+    # The purge queue sets this so that it can retry them
+    raise_errors = False
+
     def purge(self, url):
         raise NotImplementedError
 
@@ -29,6 +41,13 @@ class BaseBackend:
         for url in urls:
             self.purge(url)
 
+    def purge_failed(self, urls, reason):
+        if self.raise_errors:
+            raise PurgeError(
+                "Couldn't purge %d URL(s) from %s: %s"
+                % (len(urls), type(self).__name__, reason)
+            )
+
 
 class HTTPBackend(BaseBackend):
     def __init__(self, params):
@@ -70,10 +89,12 @@ class HTTPBackend(BaseBackend):
                 e.code,
                 e.reason,
             )
+            self.purge_failed([url], "HTTPError: %d %s" % (e.code, e.reason))
         except URLError as e:
             logger.error(
                 "Couldn't purge '%s' from HTTP cache. URLError: %s", url, e.reason
             )
+            self.purge_failed([url], "URLError: %s" % e.reason)
 
 
 class CloudflareBackend(BaseBackend):
@@ -139,6 +160,8 @@ class CloudflareBackend(BaseBackend):
                             "Couldn't purge '%s' from Cloudflare. Unexpected JSON parse error.",
                             url,
                         )
+                    self.purge_failed(urls, "Unexpected JSON parse error")
+                    return
 
         except requests.exceptions.HTTPError as e:
             for url in urls:
@@ -147,6 +170,7 @@ class CloudflareBackend(BaseBackend):
                     url,
                     e.response.status_code,
                 )
+            self.purge_failed(urls, "HTTPError: %d" % e.response.status_code)
             return
 
         if response_json["success"] is False:
@@ -159,6 +183,7 @@ class CloudflareBackend(BaseBackend):
                     url,
                     error_messages,
                 )
+            self.purge_failed(urls, "Cloudflare errors '%s'" % error_messages)
             return
 
     def purge_batch(self, urls):
@@ -173,6 +198,9 @@ class CloudflareBackend(BaseBackend):
 
 
 class CloudfrontBackend(BaseBackend):
+    # The maximum number of paths in an invalidation batch
+    CHUNK_SIZE = 3000
+
     def __init__(self, params):
         import boto3
 
@@ -208,7 +236,10 @@ class CloudfrontBackend(BaseBackend):
                 paths_by_distribution_id[distribution_id].append(url_parsed.path)
 
         for distribution_id, paths in paths_by_distribution_id.items():
-            self._create_invalidation(distribution_id, paths)
+            for i in range(0, len(paths), self.CHUNK_SIZE):
+                self._create_invalidation(
+                    distribution_id, paths[i : i + self.CHUNK_SIZE]
+                )
 
     def purge(self, url):
         self.purge_batch([url])
@@ -233,6 +264,11 @@ class CloudfrontBackend(BaseBackend):
                     e.response["Error"]["Code"],
                     e.response["Error"]["Message"],
                 )
+            self.purge_failed(
+                paths,
+                "ClientError: %s %s"
+                % (e.response["Error"]["Code"], e.response["Error"]["Message"]),
+            )
 
 
 class AzureBaseBackend(BaseBackend):
@@ -340,6 +376,7 @@ class AzureBaseBackend(BaseBackend):
                     type(self).__name__,
                     exception.response,
                 )
+            self.purge_failed(paths, "HttpOperationError: %r" % exception.response)
 
     def _is_legacy_azure_library(self, *, major_required, installed_version):
         """
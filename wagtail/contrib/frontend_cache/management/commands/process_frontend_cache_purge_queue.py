@@ -0,0 +1,52 @@
+from wagtail.contrib.frontend_cache.queue import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_RETRY_DELAY,
+    logger,
+    process_queue,
+)
+from wagtail.management.base import QueueProcessingCommand
+
+
+class Command(QueueProcessingCommand):
+    help = "Purge the URLs queued with WAGTAILFRONTENDCACHE_PURGE_MODE set to 'queue' from the frontend cache."
+
+    default_batch_size = DEFAULT_BATCH_SIZE
+    queued_items_name = "URLs"
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=DEFAULT_MAX_ATTEMPTS,
+            help="Number of times to try purging a URL before giving up (default: %d)"
+            % DEFAULT_MAX_ATTEMPTS,
+        )
+        parser.add_argument(
+            "--retry-delay",
+            type=float,
+            default=DEFAULT_RETRY_DELAY,
+            help="Number of seconds to wait before retrying a failed purge, doubling with each attempt (default: %d)"
+            % DEFAULT_RETRY_DELAY,
+        )
+
+    def process_batch(self, batch_size, max_attempts, retry_delay, **options):
+        stats = process_queue(
+            batch_size=batch_size,
+            max_attempts=max_attempts,
+            retry_delay=retry_delay,
+        )
+        if stats["entries"]:
+            logger.info(
+                "Processed %(entries)d queued purge(s): purged %(urls)d URL(s) "
+                "in %(batches)d batch(es), %(retried)d to retry, %(dropped)d dropped",
+                stats,
+            )
+        return stats
+
+    def get_summary(self, totals):
+        return (
+            "Purged %(urls)d URL(s) in %(batches)d batch(es), "
+            "%(retried)d to retry, %(dropped)d dropped" % totals
+        )
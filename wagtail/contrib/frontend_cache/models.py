@@ -0,0 +1,20 @@
+from django.db import models
+from django.utils import timezone
+
+
+class PendingPurge(models.Model):
+    """
+    A URL that has been purged with ``WAGTAILFRONTENDCACHE_PURGE_MODE`` set to
+    ``"queue"``, and is yet to be purged from the frontend cache backends by the
+    ``process_frontend_cache_purge_queue`` management command.
+    """
+
+    url = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    wagtail_reference_index_ignore = True
+
+    def __str__(self):
+        return self.url
@@ -0,0 +1,172 @@
+"""
+Deferred frontend cache purging, used in place of purging URLs as soon as they are
+requested when the ``WAGTAILFRONTENDCACHE_PURGE_MODE`` setting is ``"on_commit"`` or
+``"queue"``.
+
+URLs that are purged within a transaction are collected into a ``PurgeURLBatch``,
+which removes duplicates and is run when the transaction is committed (or immediately,
+outside of a transaction). In ``"on_commit"`` mode the batch is purged from the backends
+straight away; in ``"queue"`` mode it is written to the ``PendingPurge`` table, to be
+purged by the ``process_frontend_cache_purge_queue`` management command, which retries
+failed purges with an increasing delay.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from wagtail.utils.transactions import OnCommitBatch
+
+logger = logging.getLogger("wagtail.frontendcache")
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_RETRY_DELAY = 60
+
+
+def get_purge_mode():
+    return getattr(settings, "WAGTAILFRONTENDCACHE_PURGE_MODE", "immediate")
+
+
+class PurgeURLBatch(OnCommitBatch):
+    """
+    A set of URLs that have been purged within a transaction.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Used as an ordered set
+        self.urls = {}
+
+    def add(self, urls):
+        self.urls.update(dict.fromkeys(urls))
+
+    def run(self):
+        from .utils import get_backends
+
+        if get_purge_mode() == "queue":
+            enqueue_urls(self.urls)
+        else:
+            purge_urls(get_backends(), list(self.urls))
+
+
+def add_urls_to_batch(urls, using=None):
+    """
+    Record that the given URLs need to be purged once the current transaction is
+    committed.
+    """
+    PurgeURLBatch.add_to_current(urls, using=using)
+
+
+def enqueue_urls(urls, attempts=0, next_attempt_at=None):
+    from .models import PendingPurge
+
+    PendingPurge.objects.bulk_create(
+        [
+            PendingPurge(
+                url=url,
+                attempts=attempts,
+                next_attempt_at=next_attempt_at or timezone.now(),
+            )
+            for url in urls
+        ]
+    )
+
+
+def purge_urls(backends, urls):
+    """
+    Purge the URLs from each of the given backends (a dict of backend name to backend),
+    in chunks of up to the backend's CHUNK_SIZE URLs. Returns a dict of statistics:
+    the number of ``batches`` sent, and the set of ``failed_urls`` whose chunk
+    failed on at least one backend.
+    """
+    stats = {"batches": 0, "failed_urls": set()}
+
+    for backend_name, backend in backends.items():
+        chunk_size = backend.CHUNK_SIZE or len(urls) or 1
+        for i in range(0, len(urls), chunk_size):
+            chunk = urls[i : i + chunk_size]
+            for url in chunk:
+                logger.info("[%s] Purging URL: %s", backend_name, url)
+
+            stats["batches"] += 1
+            try:
+                backend.purge_batch(chunk)
+            except Exception:
+                logger.exception(
+                    "[%s] Exception raised while purging %d URL(s)",
+                    backend_name,
+                    len(chunk),
+                )
+                stats["failed_urls"].update(chunk)
+
+    return stats
+
+
+def process_queue(
+    batch_size=DEFAULT_BATCH_SIZE,
+    max_attempts=DEFAULT_MAX_ATTEMPTS,
+    retry_delay=DEFAULT_RETRY_DELAY,
+):
+    """
+    Purge the queued URLs that are due, up to batch_size entries. Failed URLs are
+    queued again to be retried after retry_delay seconds, doubling with each attempt,
+    and are dropped after max_attempts attempts.
+
+    Returns a dict of statistics: the number of queue ``entries`` processed, the
+    number of distinct ``urls`` purged, the number of ``batches`` sent to the
+    backends, and the numbers of URLs ``retried`` and ``dropped``.
+    """
+    from .models import PendingPurge
+    from .utils import get_backends
+
+    pending = list(
+        PendingPurge.objects.filter(next_attempt_at__lte=timezone.now()).order_by(
+            "next_attempt_at", "id"
+        )[:batch_size]
+    )
+
+    # The same URL may have been queued several times; make a single attempt, counting
+    # as the highest number of attempts of any of its entries
+    attempts_by_url = {}
+    for item in pending:
+        attempts_by_url[item.url] = max(attempts_by_url.get(item.url, 0), item.attempts)
+
+    # Remove the entries before purging, so that the URLs are queued again if they are
+    # purged again in the meantime
+    PendingPurge.objects.filter(id__in=[item.id for item in pending]).delete()
+
+    backends = get_backends()
+    for backend in backends.values():
+        backend.raise_errors = True
+
+    stats = purge_urls(backends, list(attempts_by_url))
+
+    retried = dropped = 0
+    now = timezone.now()
+    for url in stats["failed_urls"]:
+        attempts = attempts_by_url[url] + 1
+        if attempts >= max_attempts:
+            logger.error(
+                "Giving up purging '%s' from the frontend cache after %d attempts",
+                url,
+                attempts,
+            )
+            dropped += 1
+        else:
+            enqueue_urls(
+                [url],
+                attempts=attempts,
+                next_attempt_at=now
+                + timedelta(seconds=retry_delay * 2 ** (attempts - 1)),
+            )
+            retried += 1
+
+    return {
+        "entries": len(pending),
+        "urls": len(attempts_by_url),
+        "batches": stats["batches"],
+        "retried": retried,
+        "dropped": dropped,
+    }
@@ -1,15 +1,75 @@
 from django.apps import apps
+from django.db.models.signals import post_save
 
-from wagtail.contrib.frontend_cache.utils import purge_page_from_cache
-from wagtail.signals import page_published, page_unpublished
+from wagtail.contrib.frontend_cache.utils import (
+    get_purge_references_depth,
+    get_referencing_pages,
+    purge_pages_from_cache,
+)
+from wagtail.signals import page_published, page_unpublished, published, unpublished
+
+
+def get_dependency_models():
+    """
+    Return the non-page models whose changes are passed on to the pages that reference
+    them, when WAGTAILFRONTENDCACHE_PURGE_REFERENCES_DEPTH is set.
+    """
+    models = set()
+
+    if apps.is_installed("wagtail.images"):
+        from wagtail.images import get_image_model
+
+        models.add(get_image_model())
+
+    if apps.is_installed("wagtail.documents"):
+        from wagtail.documents import get_document_model
+
+        models.add(get_document_model())
+
+    if apps.is_installed("wagtail.snippets"):
+        from wagtail.snippets.models import DEFERRED_REGISTRATIONS, get_snippet_models
+
+        models.update(get_snippet_models())
+        # Snippets registered before the snippets app is ready are only added to
+        # get_snippet_models() once it is
+        models.update(model for model, viewset in DEFERRED_REGISTRATIONS)
+
+    return models
+
+
+def purge_page_and_references(page):
+    # Purge the page along with the pages that reference it, in a single batch
+    pages = [page]
+    depth = get_purge_references_depth()
+    if depth:
+        pages.extend(get_referencing_pages([page], depth))
+
+    purge_pages_from_cache(pages)
 
 
 def page_published_signal_handler(instance, **kwargs):
-    purge_page_from_cache(instance)
+    purge_page_and_references(instance)
 
 
 def page_unpublished_signal_handler(instance, **kwargs):
-    purge_page_from_cache(instance)
+    purge_page_and_references(instance)
+
+
+def object_changed_signal_handler(instance, **kwargs):
+    from wagtail.models import DraftStateMixin
+
+    depth = get_purge_references_depth()
+    if not depth or kwargs.get("raw"):
+        return
+
+    # Saving a draft doesn't change what is shown on the referencing pages, so
+    # models with draft state are purged when they are published or unpublished
+    if kwargs.get("signal") is post_save and isinstance(instance, DraftStateMixin):
+        return
+
+    pages = get_referencing_pages([instance], depth)
+    if pages:
+        purge_pages_from_cache(pages)
 
 
 def register_signal_handlers():
@@ -21,3 +81,10 @@ def register_signal_handlers():
     for model in indexed_models:
         page_published.connect(page_published_signal_handler, sender=model)
         page_unpublished.connect(page_unpublished_signal_handler, sender=model)
+
+    # Snippets, images and documents, which are only purged through the pages that
+    # reference them (see WAGTAILFRONTENDCACHE_PURGE_REFERENCES_DEPTH)
+    for model in get_dependency_models():
+        post_save.connect(object_changed_signal_handler, sender=model)
+        published.connect(object_changed_signal_handler, sender=model)
+        unpublished.connect(object_changed_signal_handler, sender=model)
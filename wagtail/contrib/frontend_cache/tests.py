@@ -5,6 +5,8 @@ import requests
 from azure.mgmt.cdn import CdnManagementClient
 from azure.mgmt.frontdoor import FrontDoorManagementClient
 from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import transaction
 from django.test import TestCase
 from django.test.utils import override_settings
 
@@ -15,10 +17,13 @@ from wagtail.contrib.frontend_cache.backends import (
     CloudflareBackend,
     CloudfrontBackend,
     HTTPBackend,
+    PurgeError,
 )
+from wagtail.contrib.frontend_cache.models import PendingPurge
 from wagtail.contrib.frontend_cache.utils import get_backends
+from wagtail.images.tests.utils import Image, get_test_image_file
 from wagtail.models import Page
-from wagtail.test.testapp.models import EventIndex
+from wagtail.test.testapp.models import EventIndex, EventPage, EventPageRelatedLink
 
 from .utils import (
     PurgeBatch,
@@ -403,6 +408,18 @@ class MockBackend(BaseBackend):
         PURGED_URLS.append(url)
 
 
+class MockFailingBackend(BaseBackend):
+    CHUNK_SIZE = 2
+
+    def __init__(self, config):
+        pass
+
+    def purge_batch(self, urls):
+        PURGED_URLS.extend(urls)
+        if "http://localhost/fail" in urls:
+            self.purge_failed(urls, "Failed")
+
+
 class MockCloudflareBackend(CloudflareBackend):
     def __init__(self, config):
         pass
@@ -583,6 +600,85 @@ class TestCachePurgingSignals(TestCase):
         )
 
 
+@override_settings(
+    WAGTAILFRONTENDCACHE={
+        "varnish": {
+            "BACKEND": "wagtail.contrib.frontend_cache.tests.MockBackend",
+        },
+    },
+    WAGTAILFRONTENDCACHE_PURGE_REFERENCES_DEPTH=1,
+)
+class TestPurgeReferences(TestCase):
+
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        self.image = Image.objects.create(
+            title="Test image", file=get_test_image_file()
+        )
+
+        # Christmas uses the image, and final event links to Christmas
+        self.christmas = EventPage.objects.get(url_path="/home/events/christmas/")
+        self.christmas.feed_image = self.image
+        self.christmas.save()
+
+        final_event = EventPage.objects.get(url_path="/home/events/final-event/")
+        final_event.related_links.add(
+            EventPageRelatedLink(title="Christmas", link_page=self.christmas)
+        )
+        final_event.save()
+
+        # Reset PURGED_URLS to an empty list
+        PURGED_URLS[:] = []
+
+    def test_purge_referencing_pages_on_publish(self):
+        self.christmas.save_revision().publish()
+        self.assertEqual(
+            PURGED_URLS,
+            [
+                "http://localhost/events/christmas/",
+                "http://localhost/events/final-event/",
+            ],
+        )
+
+    def test_purge_referencing_pages_on_unpublish(self):
+        self.christmas.unpublish()
+        self.assertEqual(
+            PURGED_URLS,
+            [
+                "http://localhost/events/christmas/",
+                "http://localhost/events/final-event/",
+            ],
+        )
+
+    def test_purge_referencing_pages_on_image_save(self):
+        self.image.title = "Changed"
+        self.image.save()
+        self.assertEqual(PURGED_URLS, ["http://localhost/events/christmas/"])
+
+    @override_settings(WAGTAILFRONTENDCACHE_PURGE_REFERENCES_DEPTH=2)
+    def test_purge_indirectly_referencing_pages(self):
+        self.image.title = "Changed"
+        self.image.save()
+        self.assertEqual(
+            PURGED_URLS,
+            [
+                "http://localhost/events/christmas/",
+                "http://localhost/events/final-event/",
+            ],
+        )
+
+    @override_settings(WAGTAILFRONTENDCACHE_PURGE_REFERENCES_DEPTH=0)
+    def test_disabled(self):
+        self.christmas.save_revision().publish()
+        self.assertEqual(PURGED_URLS, ["http://localhost/events/christmas/"])
+
+        PURGED_URLS[:] = []
+        self.image.title = "Changed"
+        self.image.save()
+        self.assertEqual(PURGED_URLS, [])
+
+
 class TestPurgeBatchClass(TestCase):
     # Tests the .add_*() methods on PurgeBatch. The .purge() method is tested
     # by TestCachePurgingFunctions.test_purge_batch above
@@ -668,3 +764,152 @@ class TestPurgeBatchClass(TestCase):
             "Couldn't purge 'http://localhost/events/' from Cloudflare. HTTPError: 500",
             log_output.output[0],
         )
+
+
+@override_settings(
+    WAGTAILFRONTENDCACHE={
+        "varnish": {
+            "BACKEND": "wagtail.contrib.frontend_cache.tests.MockBackend",
+        },
+    },
+    WAGTAILFRONTENDCACHE_PURGE_MODE="on_commit",
+)
+class TestOnCommitPurgeMode(TestCase):
+
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        # Reset PURGED_URLS to an empty list
+        PURGED_URLS[:] = []
+
+    def test_purge_on_commit(self):
+        page = EventIndex.objects.get(url_path="/home/events/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            page.save_revision().publish()
+            purge_url_from_cache("http://localhost/events/")
+            purge_url_from_cache("http://localhost/foo")
+
+            # Nothing is purged until the transaction is committed
+            self.assertEqual(PURGED_URLS, [])
+
+        # Each URL is purged once
+        self.assertEqual(
+            PURGED_URLS,
+            [
+                "http://localhost/events/",
+                "http://localhost/events/past/",
+                "http://localhost/foo",
+            ],
+        )
+
+    def test_rolled_back_savepoint(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            purge_url_from_cache("http://localhost/foo")
+            try:
+                with transaction.atomic():
+                    purge_url_from_cache("http://localhost/bar")
+                    raise ValueError
+            except ValueError:
+                pass
+
+        # URLs purged within the rolled back savepoint are discarded with it
+        self.assertEqual(PURGED_URLS, ["http://localhost/foo"])
+
+    def test_backend_settings_purge_immediately(self):
+        purge_url_from_cache(
+            "http://localhost/foo",
+            backend_settings={
+                "varnish": {
+                    "BACKEND": "wagtail.contrib.frontend_cache.tests.MockBackend",
+                },
+            },
+        )
+        self.assertEqual(PURGED_URLS, ["http://localhost/foo"])
+
+
+@override_settings(
+    WAGTAILFRONTENDCACHE={
+        "varnish": {
+            "BACKEND": "wagtail.contrib.frontend_cache.tests.MockFailingBackend",
+        },
+    },
+    WAGTAILFRONTENDCACHE_PURGE_MODE="queue",
+)
+class TestPurgeQueue(TestCase):
+    def setUp(self):
+        # Reset PURGED_URLS to an empty list
+        PURGED_URLS[:] = []
+
+    def test_queue(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            purge_urls_from_cache(["http://localhost/foo", "http://localhost/bar"])
+            purge_url_from_cache("http://localhost/foo")
+
+        self.assertEqual(PURGED_URLS, [])
+        self.assertEqual(
+            sorted(PendingPurge.objects.values_list("url", flat=True)),
+            ["http://localhost/bar", "http://localhost/foo"],
+        )
+
+        call_command("process_frontend_cache_purge_queue", verbosity=0)
+
+        self.assertEqual(PURGED_URLS, ["http://localhost/foo", "http://localhost/bar"])
+        self.assertFalse(PendingPurge.objects.exists())
+
+    def test_duplicate_queue_entries_purged_once(self):
+        PendingPurge.objects.create(url="http://localhost/foo")
+        PendingPurge.objects.create(url="http://localhost/foo")
+
+        call_command("process_frontend_cache_purge_queue", verbosity=0)
+
+        self.assertEqual(PURGED_URLS, ["http://localhost/foo"])
+
+    def test_retry(self):
+        PendingPurge.objects.create(url="http://localhost/foo")
+        PendingPurge.objects.create(url="http://localhost/fail")
+        PendingPurge.objects.create(url="http://localhost/bar")
+
+        with self.assertLogs("wagtail.frontendcache", level="ERROR"):
+            call_command(
+                "process_frontend_cache_purge_queue", verbosity=0, retry_delay=60
+            )
+
+        # URLs are purged in chunks of MockFailingBackend.CHUNK_SIZE, and the URLs in a
+        # failed chunk are queued to be retried later
+        self.assertEqual(
+            PURGED_URLS,
+            ["http://localhost/foo", "http://localhost/fail", "http://localhost/bar"],
+        )
+        self.assertEqual(
+            sorted(PendingPurge.objects.values_list("url", "attempts")),
+            [("http://localhost/fail", 1), ("http://localhost/foo", 1)],
+        )
+        self.assertTrue(
+            all(
+                entry.next_attempt_at > entry.created_at
+                for entry in PendingPurge.objects.all()
+            )
+        )
+
+    def test_give_up_after_max_attempts(self):
+        PendingPurge.objects.create(url="http://localhost/fail", attempts=2)
+
+        with self.assertLogs("wagtail.frontendcache", level="ERROR") as log_output:
+            call_command(
+                "process_frontend_cache_purge_queue", verbosity=0, max_attempts=3
+            )
+
+        self.assertFalse(PendingPurge.objects.exists())
+        self.assertIn(
+            "Giving up purging 'http://localhost/fail' from the frontend cache after 3 attempts",
+            log_output.output[-1],
+        )
+
+    def test_purge_error_raised_only_when_enabled(self):
+        backend = MockFailingBackend({})
+        backend.purge_batch(["http://localhost/fail"])
+
+        backend.raise_errors = True
+        with self.assertRaises(PurgeError):
+            backend.purge_batch(["http://localhost/fail"])
@@ -1,11 +1,14 @@
 import logging
 import re
+from collections import defaultdict
 from urllib.parse import urlparse, urlunparse
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Q
 from django.utils.module_loading import import_string
 
+from wagtail.contrib.frontend_cache.queue import add_urls_to_batch, get_purge_mode
 from wagtail.coreutils import get_content_languages
 
 logger = logging.getLogger("wagtail.frontendcache")
@@ -74,7 +77,8 @@ def purge_urls_from_cache(urls, backend_settings=None, backends=None):
     )
     if settings.USE_I18N and languages:
         langs_regex = "^/(%s)/" % "|".join(languages)
-        new_urls = []
+        # Used as an ordered set
+        new_urls = {}
 
         # Purge the given url for each managed language
         for isocode in languages:
@@ -91,14 +95,21 @@ def purge_urls_from_cache(urls, backend_settings=None, backends=None):
                     )
                 )
 
-                # Check for best performance. True if re.sub found no match
+                # URLs are repeated if re.sub found no match
                 # It happens when i18n_patterns was not used in urls.py to serve content for different languages from different URLs
-                if new_url in new_urls:
-                    continue
+                new_urls[new_url] = None
 
-                new_urls.append(new_url)
+        urls = list(new_urls)
 
-        urls = new_urls
+    if (
+        backend_settings is None
+        and backends is None
+        and get_purge_mode() != "immediate"
+    ):
+        # Purge the URLs once the transaction is committed, or queue them to be
+        # purged by the process_frontend_cache_purge_queue command
+        add_urls_to_batch(urls)
+        return
 
     for backend_name, backend in get_backends(backend_settings, backends).items():
         for url in urls:
@@ -107,6 +118,63 @@ def purge_urls_from_cache(urls, backend_settings=None, backends=None):
         backend.purge_batch(urls)
 
 
+def get_purge_references_depth():
+    return getattr(settings, "WAGTAILFRONTENDCACHE_PURGE_REFERENCES_DEPTH", 0)
+
+
+def get_referencing_pages(objects, depth=1):
+    """
+    Return the live pages that reference any of the given objects according to the
+    reference index, either directly or through a chain of up to ``depth`` references.
+    For example, with a depth of 2, this includes the pages that reference a snippet
+    which references one of the objects. The objects themselves are not included.
+    """
+    from django.contrib.contenttypes.models import ContentType
+
+    from wagtail.models import Page, ReferenceIndex
+
+    page_content_type_id = ContentType.objects.get_for_model(Page).pk
+
+    # (base content type id, object id) pairs of the objects found so far, and of
+    # the ones whose references are still to be looked up
+    seen = set()
+    for obj in objects:
+        seen.add((ReferenceIndex._get_base_content_type(obj).pk, str(obj.pk)))
+    to_visit = set(seen)
+
+    page_ids = []
+    for _level in range(depth):
+        if not to_visit:
+            break
+
+        object_ids_by_content_type = defaultdict(list)
+        for content_type_id, object_id in to_visit:
+            object_ids_by_content_type[content_type_id].append(object_id)
+
+        query = Q()
+        for content_type_id, object_ids in object_ids_by_content_type.items():
+            query |= Q(to_content_type_id=content_type_id, to_object_id__in=object_ids)
+
+        to_visit = set()
+        for key in (
+            ReferenceIndex.objects.filter(query)
+            .values_list("base_content_type_id", "object_id")
+            .distinct()
+        ):
+            if key in seen:
+                continue
+
+            seen.add(key)
+            to_visit.add(key)
+            if key[0] == page_content_type_id:
+                page_ids.append(key[1])
+
+    if not page_ids:
+        return Page.objects.none()
+
+    return Page.objects.live().filter(pk__in=page_ids).specific()
+
+
 def _get_page_cached_urls(page):
     page_url = page.full_url
     if page_url is None:  # nothing to be done if the page has no routable URL
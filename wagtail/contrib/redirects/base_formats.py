@@ -46,6 +46,13 @@ class CSV:
         """
         return Dataset(csv.reader(StringIO(data), delimiter=delimiter))
 
+    def iter_rows(self, file, delimiter=","):
+        """
+        Iterate over the rows of csv data in an open file, without reading it all
+        into memory.
+        """
+        return csv.reader(file, delimiter=delimiter)
+
 
 class TSV(CSV):
     def create_dataset(self, data):
@@ -54,6 +61,12 @@ class TSV(CSV):
         """
         return super().create_dataset(data, delimiter="\t")
 
+    def iter_rows(self, file):
+        """
+        Iterate over the rows of tsv data in an open file.
+        """
+        return super().iter_rows(file, delimiter="\t")
+
 
 class XLSX:
     def is_binary(self):
@@ -73,6 +86,17 @@ class XLSX:
         finally:
             workbook.close()
 
+    def iter_rows(self, file):
+        """
+        Iterate over the rows of the first sheet of a xlsx workbook in an open file,
+        without loading the whole sheet into memory.
+        """
+        workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+        try:
+            yield from workbook.worksheets[0].iter_rows(values_only=True)
+        finally:
+            workbook.close()
+
 
 DEFAULT_FORMATS = [
     CSV,
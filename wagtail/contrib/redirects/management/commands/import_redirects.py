@@ -1,9 +1,15 @@
+import csv
+import itertools
 import os
 
-from django.core.management.base import BaseCommand
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
 
 from wagtail.contrib.redirects.base_formats import Dataset
 from wagtail.contrib.redirects.forms import RedirectForm
+from wagtail.contrib.redirects.matcher import invalidate_redirect_matcher
+from wagtail.contrib.redirects.models import Redirect
 from wagtail.contrib.redirects.utils import (
     get_format_cls_by_extension,
     get_supported_extensions,
@@ -71,6 +77,28 @@ class Command(BaseCommand):
         parser.add_argument(
             "--limit", help="Limit import to num items", type=int, default=None
         )
+        parser.add_argument(
+            "--stream",
+            action="store_true",
+            help=(
+                "Read the file row by row and create or update redirects in batches, "
+                "replacing existing redirects from the same path"
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            help="Number of rows to save at a time in streaming mode",
+            type=int,
+            default=1000,
+        )
+        parser.add_argument(
+            "--errors-file",
+            help=(
+                "Path of a csv file to write the rows that fail to import to, "
+                "in streaming mode"
+            ),
+            type=str,
+        )
 
     def handle(self, *args, **options):
         src = options["src"]
@@ -84,6 +112,12 @@ class Command(BaseCommand):
         ask = options.pop("ask")
         offset = options.pop("offset")
         limit = options.pop("limit")
+        stream = options.pop("stream")
+        batch_size = options.pop("batch_size")
+        errors_file = options.pop("errors_file")
+
+        if stream and ask:
+            raise CommandError("--ask cannot be used with --stream")
 
         errors = []
         successes = 0
@@ -116,6 +150,22 @@ class Command(BaseCommand):
         else:
             mode = "r"
 
+        if stream:
+            return self.handle_stream(
+                src,
+                mode,
+                input_format,
+                site=site,
+                permanent=permanent,
+                from_index=from_index,
+                to_index=to_index,
+                dry_run=dry_run,
+                offset=offset,
+                limit=limit,
+                batch_size=batch_size,
+                errors_file=errors_file,
+            )
+
         with open(src, mode) as fh:
             imported_data = input_format.create_dataset(fh.read())
             sample_data = Dataset(imported_data[:4], imported_data.headers)
@@ -198,6 +248,163 @@ class Command(BaseCommand):
         self.stdout.write("Skipped : {}".format(skipped))
         self.stdout.write("Errors: {}".format(len(errors)))
 
+    def handle_stream(
+        self,
+        src,
+        mode,
+        input_format,
+        site,
+        permanent,
+        from_index,
+        to_index,
+        dry_run,
+        offset,
+        limit,
+        batch_size,
+        errors_file,
+    ):
+        totals = {"found": 0, "created": 0, "updated": 0, "errors": 0}
+
+        # Only used to validate values, in the same way as RedirectForm. Rows have no
+        # redirect page to fall back on, so the link is required
+        self.old_path_field = Redirect._meta.get_field("old_path").formfield()
+        self.redirect_link_field = Redirect._meta.get_field("redirect_link").formfield(
+            required=True
+        )
+
+        error_writer = None
+        if errors_file:
+            error_fh = open(errors_file, "w", newline="")
+            error_writer = csv.writer(error_fh)
+            error_writer.writerow(["row", "from", "to", "error"])
+
+        try:
+            with open(src, mode, **({"newline": ""} if mode == "r" else {})) as fh:
+                rows = input_format.iter_rows(fh)
+                headers = next(rows, None)
+                if headers is not None:
+                    self.stdout.write("Columns: {}".format(list(headers)))
+
+                if site:
+                    self.stdout.write("Using site: {0}".format(site.hostname))
+
+                self.stdout.write("Importing redirects:")
+
+                stop = offset + limit if offset and limit else limit
+                rows = enumerate(itertools.islice(rows, offset, stop), 1)
+
+                while True:
+                    chunk = list(itertools.islice(rows, batch_size))
+                    if not chunk:
+                        break
+
+                    redirects = {}
+                    for index, row in chunk:
+                        totals["found"] += 1
+                        try:
+                            old_path, redirect_link = self.clean_row(
+                                row, from_index, to_index
+                            )
+                        except ValidationError as e:
+                            error = " ".join(e.messages)
+                            totals["errors"] += 1
+                            if error_writer:
+                                error_writer.writerow(
+                                    [
+                                        index,
+                                        _get_column(row, from_index),
+                                        _get_column(row, to_index),
+                                        error,
+                                    ]
+                                )
+                            continue
+
+                        # If a path is repeated, the last row wins
+                        redirects[old_path] = redirect_link
+
+                    if not dry_run:
+                        created, updated = self.save_redirects(
+                            redirects, site, permanent
+                        )
+                        totals["created"] += created
+                        totals["updated"] += updated
+
+                    self.stdout.write(
+                        "Processed {found} rows: {created} created, {updated} "
+                        "updated, {errors} errors".format(**totals)
+                    )
+        finally:
+            if error_writer:
+                error_fh.close()
+
+        self.stdout.write("\n")
+        self.stdout.write("Found: {}".format(totals["found"]))
+        self.stdout.write("Created: {}".format(totals["created"]))
+        self.stdout.write("Updated: {}".format(totals["updated"]))
+        self.stdout.write("Errors: {}".format(totals["errors"]))
+
+    def clean_row(self, row, from_index, to_index):
+        """
+        Return the normalised old path and redirect link of a row, or raise a
+        ValidationError if they aren't valid.
+        """
+        old_path = self.old_path_field.clean(_get_column(row, from_index))
+        redirect_link = self.redirect_link_field.clean(_get_column(row, to_index))
+        return Redirect.normalise_path(old_path), redirect_link
+
+    def save_redirects(self, redirects, site, permanent):
+        """
+        Create or update redirects from the old paths to the links in the given dict,
+        in a single transaction. Returns the numbers of redirects created and updated.
+        """
+        with transaction.atomic():
+            # The database doesn't enforce uniqueness for redirects without a site, so
+            # existing redirects are looked up rather than using bulk_create's
+            # update_conflicts option
+            existing = {
+                redirect.old_path: redirect
+                for redirect in Redirect.objects.filter(
+                    site=site, old_path__in=redirects
+                ).select_for_update()
+            }
+
+            to_create = []
+            for old_path, redirect_link in redirects.items():
+                redirect = existing.get(old_path)
+                if redirect is None:
+                    redirect = Redirect(old_path=old_path, site=site)
+                    to_create.append(redirect)
+
+                redirect.redirect_link = redirect_link
+                redirect.redirect_page = None
+                redirect.redirect_page_route_path = ""
+                redirect.is_permanent = permanent
+                redirect.automatically_created = False
+
+            Redirect.objects.bulk_create(to_create)
+            Redirect.objects.bulk_update(
+                existing.values(),
+                [
+                    "redirect_link",
+                    "redirect_page",
+                    "redirect_page_route_path",
+                    "is_permanent",
+                    "automatically_created",
+                ],
+            )
+
+            # bulk_create() and bulk_update() don't send post_save signals
+            invalidate_redirect_matcher()
+
+        return len(to_create), len(existing)
+
 
 def get_input(msg):  # pragma: no cover
     return input(msg)
+
+
+def _get_column(row, index):
+    try:
+        return row[index]
+    except IndexError:
+        return None
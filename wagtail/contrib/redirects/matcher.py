@@ -0,0 +1,102 @@
+"""
+A process-local table of redirect paths, used by ``RedirectMiddleware`` when the
+``WAGTAILREDIRECTS_IN_MEMORY_MATCHER`` setting is ``True``, so that looking up a path
+that has no redirect doesn't need any database queries.
+
+The table is rebuilt on the next lookup after any redirect is changed. Changes are
+tracked by a version number, which is kept in the default cache so that changes made in
+other processes are noticed too.
+"""
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_CACHE_KEY = "wagtail-redirects-version"
+
+
+def use_in_memory_matcher():
+    return getattr(settings, "WAGTAILREDIRECTS_IN_MEMORY_MATCHER", False)
+
+
+class RedirectMatcher:
+    """
+    Maps normalised ``old_path`` values to the ids of their redirects, keyed by site id
+    (``None`` for redirects that apply to all sites).
+    """
+
+    def __init__(self):
+        self.paths = {}
+        self.version = None
+
+    def build(self):
+        from wagtail.contrib.redirects.models import Redirect
+
+        paths = {}
+        for redirect_id, old_path, site_id in (
+            Redirect.objects.values_list("id", "old_path", "site_id")
+            .order_by()
+            .iterator()
+        ):
+            paths.setdefault(old_path, {})[site_id] = redirect_id
+
+        self.paths = paths
+
+    def match(self, path, site_id=None):
+        """
+        Return the id of the redirect for the given path, preferring one for the given
+        site over one that applies to all sites, or None if there isn't one.
+        """
+        redirects = self.paths.get(path)
+        if redirects is None:
+            return None
+
+        if site_id is None and len(redirects) == 1:
+            # Without a site, a redirect for any site matches (see Redirect.get_for_site)
+            return next(iter(redirects.values()))
+
+        if site_id in redirects:
+            return redirects[site_id]
+        return redirects.get(None)
+
+
+_matcher = RedirectMatcher()
+_local_version = 0
+
+
+def get_version():
+    return (_local_version, cache.get(VERSION_CACHE_KEY))
+
+
+def get_redirect_matcher():
+    """
+    Return the redirect table for this process, rebuilding it first if any redirects
+    have changed since it was last built.
+    """
+    version = get_version()
+    if _matcher.version != version:
+        _matcher.build()
+        _matcher.version = version
+    return _matcher
+
+
+def _bump_local_version():
+    global _local_version
+    _local_version += 1
+
+
+def _bump_version():
+    _bump_local_version()
+    cache.set(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def invalidate_redirect_matcher():
+    """
+    Mark the redirect tables as out of date. Other processes are notified once the
+    current transaction is committed, so that they don't rebuild their tables without
+    the changes; this process rebuilds its table straight away, to see its own changes.
+    """
+    _bump_local_version()
+    if use_in_memory_matcher():
+        transaction.on_commit(_bump_version)
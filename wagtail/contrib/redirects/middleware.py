@@ -5,6 +5,10 @@ from django.utils.deprecation import MiddlewareMixin
 from django.utils.encoding import uri_to_iri
 
 from wagtail.contrib.redirects import models
+from wagtail.contrib.redirects.matcher import (
+    get_redirect_matcher,
+    use_in_memory_matcher,
+)
 from wagtail.models import Site
 
 
@@ -15,6 +19,19 @@ def _get_redirect(request, path):
         return None
 
     site = Site.find_for_request(request)
+
+    if use_in_memory_matcher():
+        redirect_id = get_redirect_matcher().match(path, site.pk if site else None)
+        if redirect_id is None:
+            return None
+        try:
+            return models.Redirect.objects.select_related("redirect_page").get(
+                pk=redirect_id
+            )
+        except models.Redirect.DoesNotExist:
+            # Deleted since the redirect table was built
+            return None
+
     try:
         return models.Redirect.get_for_site(site).get(old_path=path)
     except models.Redirect.MultipleObjectsReturned:
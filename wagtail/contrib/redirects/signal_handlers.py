@@ -7,6 +7,7 @@ from django.db.models import Q
 from wagtail.coreutils import BatchCreator, get_dummy_request
 from wagtail.models import Page, Site
 
+from .matcher import invalidate_redirect_matcher
 from .models import Redirect
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,14 @@ class BatchRedirectCreator(BatchCreator):
             clashes_q |= Q(old_path=item.old_path, site_id=item.site_id)
         Redirect.objects.filter(automatically_created=True).filter(clashes_q).delete()
 
+    def post_process(self):
+        # bulk_create() doesn't send post_save signals
+        invalidate_redirect_matcher()
+
+
+def redirect_changed_signal_handler(**kwargs):
+    invalidate_redirect_matcher()
+
 
 def autocreate_redirects_on_slug_change(
     instance_before: Page, instance: Page, **kwargs
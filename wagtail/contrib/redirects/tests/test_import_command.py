@@ -1,3 +1,4 @@
+import csv
 import os
 import tempfile
 from io import StringIO
@@ -332,3 +333,131 @@ class TestImportCommand(TestCase):
         self.assertEqual(redirects[0].old_path, "/one")
         self.assertEqual(redirects[0].redirect_link, "http://one.test/")
         self.assertIs(redirects[0].is_permanent, True)
+
+
+class TestStreamingImportCommand(TestCase):
+    def write_file(self, lines):
+        f = tempfile.NamedTemporaryFile(mode="w+", encoding="utf-8", suffix=".csv")
+        f.write("from,to\n")
+        f.write("\n".join(lines))
+        f.seek(0)
+        return f
+
+    def test_redirects_get_imported(self):
+        f = self.write_file(
+            [
+                "/one/,http://one.test/",
+                "/two,http://two.test/",
+                "/three,http://three.test/",
+            ]
+        )
+
+        out = StringIO()
+        call_command(
+            "import_redirects", src=f.name, stream=True, batch_size=2, stdout=out
+        )
+
+        self.assertEqual(
+            list(
+                Redirect.objects.order_by("id").values_list("old_path", "redirect_link")
+            ),
+            [
+                ("/one", "http://one.test/"),
+                ("/two", "http://two.test/"),
+                ("/three", "http://three.test/"),
+            ],
+        )
+        self.assertIn(
+            "Processed 2 rows: 2 created, 0 updated, 0 errors", out.getvalue()
+        )
+        self.assertIn("Created: 3", out.getvalue())
+
+    def test_binary_formats_are_supported(self):
+        f = "{}/files/example.xlsx".format(TEST_ROOT)
+
+        out = StringIO()
+        call_command("import_redirects", src=f, stream=True, stdout=out)
+        self.assertEqual(Redirect.objects.count(), 3)
+
+    def test_existing_redirects_get_updated(self):
+        site = Site.objects.first()
+        Redirect.objects.create(
+            old_path="/one", site=site, redirect_link="http://old.test/"
+        )
+        Redirect.objects.create(old_path="/one", redirect_link="http://old.test/")
+        f = self.write_file(["/one,http://one.test/", "/one,http://one-again.test/"])
+
+        out = StringIO()
+        call_command(
+            "import_redirects", src=f.name, stream=True, permanent=False, stdout=out
+        )
+
+        self.assertEqual(Redirect.objects.count(), 2)
+        redirect = Redirect.objects.get(site__isnull=True)
+        self.assertEqual(redirect.redirect_link, "http://one-again.test/")
+        self.assertIs(redirect.is_permanent, False)
+        self.assertEqual(
+            Redirect.objects.get(site=site).redirect_link, "http://old.test/"
+        )
+        self.assertIn("Updated: 1", out.getvalue())
+
+    def test_offset_and_limit(self):
+        f = self.write_file(
+            [
+                "/one,http://one.test/",
+                "/two,http://two.test/",
+                "/three,http://three.test/",
+                "/four,http://four.test/",
+            ]
+        )
+
+        out = StringIO()
+        call_command(
+            "import_redirects", src=f.name, stream=True, offset=1, limit=2, stdout=out
+        )
+
+        self.assertEqual(
+            list(Redirect.objects.order_by("id").values_list("old_path", flat=True)),
+            ["/two", "/three"],
+        )
+
+    def test_dry_run(self):
+        f = self.write_file(["/one,http://one.test/"])
+
+        out = StringIO()
+        call_command(
+            "import_redirects", src=f.name, stream=True, dry_run=True, stdout=out
+        )
+
+        self.assertEqual(Redirect.objects.count(), 0)
+        self.assertIn("Found: 1", out.getvalue())
+
+    def test_errors_get_written_to_file(self):
+        f = self.write_file(["/one,/not-absolute/", "/two,http://two.test/", "/three"])
+        errors_file = tempfile.NamedTemporaryFile(mode="w+", suffix=".csv")
+
+        out = StringIO()
+        call_command(
+            "import_redirects",
+            src=f.name,
+            stream=True,
+            errors_file=errors_file.name,
+            stdout=out,
+        )
+
+        self.assertEqual(Redirect.objects.count(), 1)
+        self.assertIn("Errors: 2", out.getvalue())
+
+        errors_file.seek(0)
+        rows = list(csv.reader(errors_file))
+        self.assertEqual(rows[0], ["row", "from", "to", "error"])
+        self.assertEqual(
+            [row[:3] for row in rows[1:]],
+            [["1", "/one", "/not-absolute/"], ["3", "/three", ""]],
+        )
+
+    def test_ask_cannot_be_used(self):
+        f = self.write_file(["/one,http://one.test/"])
+
+        with self.assertRaises(CommandError):
+            call_command("import_redirects", src=f.name, stream=True, ask=True)
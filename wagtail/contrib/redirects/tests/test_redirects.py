@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from wagtail.admin.admin_url_finder import AdminURLFinder
 from wagtail.contrib.redirects import models
+from wagtail.contrib.redirects.matcher import VERSION_CACHE_KEY
 from wagtail.models import Page, Site
 from wagtail.test.routablepage.models import RoutablePageTest
 from wagtail.test.utils import WagtailTestUtils
@@ -572,6 +576,57 @@ class TestRedirects(TestCase):
         self.assertIs(redirect.is_permanent, True)
 
 
+@override_settings(WAGTAILREDIRECTS_IN_MEMORY_MATCHER=True)
+class TestRedirectsInMemoryMatcher(TestRedirects):
+    # Runs all of the TestRedirects tests with the in-memory redirect table
+
+    def assertNoRedirectQueries(self, queries):
+        self.assertFalse(
+            [
+                query["sql"]
+                for query in queries
+                if models.Redirect._meta.db_table in query["sql"]
+            ]
+        )
+
+    def test_unmatched_path_does_not_query_redirects(self):
+        models.Redirect.objects.create(old_path="/redirectme", redirect_link="/to")
+        self.client.get("/redirectme/")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/not-a-redirect/?foo=bar")
+
+        self.assertEqual(response.status_code, 404)
+        self.assertNoRedirectQueries(queries)
+
+    def test_deleted_redirect(self):
+        redirect = models.Redirect.objects.create(
+            old_path="/redirectme", redirect_link="/redirectto"
+        )
+        response = self.client.get("/redirectme/")
+        self.assertEqual(response.status_code, 301)
+
+        redirect.delete()
+        response = self.client.get("/redirectme/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_redirect_changed_in_other_process(self):
+        self.client.get("/redirectme/")
+
+        # Bypass the signal handlers, then update the version as another process would
+        models.Redirect.objects.bulk_create(
+            [models.Redirect(old_path="/redirectme", redirect_link="/redirectto")]
+        )
+        response = self.client.get("/redirectme/")
+        self.assertEqual(response.status_code, 404)
+
+        cache.set(VERSION_CACHE_KEY, "other-process")
+        response = self.client.get("/redirectme/")
+        self.assertRedirects(
+            response, "/redirectto", status_code=301, fetch_redirect_response=False
+        )
+
+
 class TestRedirectsIndexView(WagtailTestUtils, TestCase):
     def setUp(self):
         self.login()
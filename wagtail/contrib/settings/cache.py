@@ -0,0 +1,116 @@
+"""
+An optional cache of settings instances that is shared between requests, enabled by
+setting ``WAGTAILSETTINGS_CACHE`` to the name of one of the project's caches.
+
+Instances are cached by model and site, along with the pages that their foreign keys
+point to, so that ``page_url`` lookups don't need any queries either. The cache keys
+include a version value, which is changed whenever a setting is saved or deleted, or a
+page is published, moved or deleted, so that all of the cached settings are replaced at
+once.
+"""
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+VERSION_CACHE_KEY = "wagtailsettings:version"
+
+
+def get_settings_cache():
+    alias = getattr(settings, "WAGTAILSETTINGS_CACHE", None)
+    if alias:
+        return caches[alias]
+
+
+def get_version(cache):
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.set(VERSION_CACHE_KEY, version, None)
+    return version
+
+
+def get_cache_key(model, site_id, version):
+    return "wagtailsettings:%s:%s.%s:%s" % (
+        version,
+        model._meta.app_label,
+        model._meta.model_name,
+        "generic" if site_id is None else site_id,
+    )
+
+
+def fetch_related_pages(instance):
+    """
+    Fetch the specific pages referenced by the instance's foreign keys, so that they are
+    stored in the cache along with it.
+    """
+    from wagtail.models import Page
+
+    for field in instance._meta.concrete_fields:
+        if field.many_to_one and issubclass(field.related_model, Page):
+            page = getattr(instance, field.name)
+            if page is not None:
+                # Populates the page's cached 'specific' property
+                page.specific
+
+
+def get_cached_setting(model, site_id, get_instance):
+    """
+    Return the instance of the setting model for the given site id (None for generic
+    settings) from the cache, or call get_instance to get it and add it to the cache.
+    """
+    cache = get_settings_cache()
+    if cache is None:
+        return get_instance()
+
+    key = get_cache_key(model, site_id, get_version(cache))
+    instance = cache.get(key)
+    if instance is None:
+        instance = get_instance()
+        fetch_related_pages(instance)
+        cache.set(key, instance)
+
+    return instance
+
+
+def preload_settings(request, site):
+    """
+    Fetch the instances of all registered setting models for the site from the cache in
+    one go, and store them on the request to be used by ``for_request`` and ``load``.
+    Settings that aren't in the cache yet are left to be fetched when they are used.
+    """
+    from .models import BaseSiteSetting
+    from .registry import registry
+
+    cache = get_settings_cache()
+    if cache is None:
+        return
+
+    version = get_version(cache)
+    models_by_key = {}
+    for model in registry:
+        if not hasattr(request, model.get_cache_attr_name()):
+            site_id = site.pk if issubclass(model, BaseSiteSetting) else None
+            models_by_key[get_cache_key(model, site_id, version)] = model
+
+    for key, instance in cache.get_many(list(models_by_key)).items():
+        if isinstance(instance, BaseSiteSetting):
+            # As in BaseSiteSetting.for_request
+            instance._request = request
+        setattr(request, models_by_key[key].get_cache_attr_name(), instance)
+
+
+def _bump_version():
+    cache = get_settings_cache()
+    if cache is not None:
+        cache.set(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def invalidate_settings_cache():
+    """
+    Mark all of the cached settings as out of date, once the current transaction is
+    committed.
+    """
+    if get_settings_cache() is not None:
+        transaction.on_commit(_bump_version)
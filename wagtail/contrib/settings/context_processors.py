@@ -3,6 +3,7 @@ from django.utils.functional import SimpleLazyObject
 from wagtail.contrib.settings.models import BaseGenericSetting, BaseSiteSetting
 from wagtail.models import Site
 
+from .cache import preload_settings
 from .registry import registry
 
 
@@ -80,6 +81,8 @@ def settings(request):
         if site is None:
             return SettingProxy(request_or_site=None)
 
+        # Fetch all of the site's settings from the cache at once, if it is enabled
+        preload_settings(request, site)
         return SettingProxy(request_or_site=request)
 
     return {"settings": SimpleLazyObject(lambda: _inner(request))}
@@ -5,6 +5,7 @@ from django.utils.translation import gettext as _
 from wagtail.coreutils import InvokeViaAttributeShortcut
 from wagtail.models import Site
 
+from .cache import get_cached_setting
 from .registry import register_setting
 
 __all__ = [
@@ -136,9 +137,15 @@ class BaseSiteSetting(AbstractSetting):
         """
         Get or create an instance of this setting for the site.
         """
-        queryset = cls.base_queryset()
-        instance, created = queryset.get_or_create(site=site)
-        return instance
+
+        def get_instance():
+            queryset = cls.base_queryset()
+            instance, created = queryset.get_or_create(site=site)
+            return instance
+
+        if site is None:
+            return get_instance()
+        return get_cached_setting(cls, site.pk, get_instance)
 
     def __str__(self):
         return _("%(site_setting)s for %(site)s") % {
@@ -181,17 +188,17 @@ class BaseGenericSetting(AbstractSetting):
         the result on the request for faster repeat access.
         """
 
-        # We can only cache on the request, so if there is no request then
-        # we know there's nothing in the cache.
+        # We can only store the instance on a request, so if there is no request
+        # then there's nothing stored for repeat access.
         if request_or_site is None or isinstance(request_or_site, Site):
-            return cls._get_or_create()
+            return get_cached_setting(cls, None, cls._get_or_create)
 
         # Check if we already have this in the cache and return it if so.
         attr_name = cls.get_cache_attr_name()
         if hasattr(request_or_site, attr_name):
             return getattr(request_or_site, attr_name)
 
-        obj = cls._get_or_create()
+        obj = get_cached_setting(cls, None, cls._get_or_create)
 
         # Cache for next time.
         setattr(request_or_site, attr_name, obj)
@@ -0,0 +1,32 @@
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from .cache import invalidate_settings_cache
+
+
+def setting_changed_signal_handler(**kwargs):
+    invalidate_settings_cache()
+
+
+def page_changed_signal_handler(**kwargs):
+    # Cached settings include the pages that they link to
+    invalidate_settings_cache()
+
+
+def register_signal_handlers():
+    from wagtail.models import Page
+
+    from .models import AbstractSetting
+
+    for model in apps.get_models():
+        if issubclass(model, AbstractSetting):
+            post_save.connect(setting_changed_signal_handler, sender=model)
+            post_delete.connect(setting_changed_signal_handler, sender=model)
+        elif issubclass(model, Page):
+            post_delete.connect(page_changed_signal_handler, sender=model)
+
+    page_published.connect(page_changed_signal_handler)
+    page_unpublished.connect(page_changed_signal_handler)
+    post_page_move.connect(page_changed_signal_handler)
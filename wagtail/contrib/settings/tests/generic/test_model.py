@@ -1,7 +1,8 @@
+from django.core.cache import caches
 from django.test import TestCase, override_settings
 
 from wagtail.models import Site
-from wagtail.test.testapp.models import ImportantPagesGenericSetting
+from wagtail.test.testapp.models import ImportantPagesGenericSetting, TestGenericSetting
 
 from .base import GenericSettingsTestMixin
 
@@ -113,3 +114,39 @@ class GenericSettingModelTestCase(GenericSettingsTestMixin, TestCase):
                 self.assertEqual(settings.get_page_url("test_attribute"), "")
                 # when called indirectly via shortcut
                 self.assertEqual(settings.page_url.test_attribute, "")
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "settings": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "wagtailsettings-tests",
+        },
+    },
+    WAGTAILSETTINGS_CACHE="settings",
+)
+class GenericSettingCacheTestCase(GenericSettingsTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        caches["settings"].clear()
+
+    def test_load_uses_cache(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(TestGenericSetting.load(), self.default_settings)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(TestGenericSetting.load(), self.default_settings)
+            self.assertEqual(
+                TestGenericSetting.load(request_or_site=self.get_request()),
+                self.default_settings,
+            )
+
+    def test_deleting_setting_invalidates_cache(self):
+        old_pk = TestGenericSetting.load().pk
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.default_settings.delete()
+
+        # A new instance is created
+        self.assertNotEqual(TestGenericSetting.load().pk, old_pk)
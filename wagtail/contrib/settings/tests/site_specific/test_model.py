@@ -1,8 +1,12 @@
 import pickle
 
+from django.core.cache import caches
 from django.test import TestCase, override_settings
 
-from wagtail.models import Site
+from wagtail.contrib.settings.context_processors import (
+    settings as settings_context_processor,
+)
+from wagtail.models import Page, Site
 from wagtail.test.testapp.models import ImportantPagesSiteSetting, TestSiteSetting
 
 from .base import SiteSettingsTestMixin
@@ -208,3 +212,119 @@ class SettingModelTestCase(SiteSettingsTestMixin, TestCase):
                 self.assertEqual(settings.get_page_url("test_attribute"), "")
                 # when called indirectly via shortcut
                 self.assertEqual(settings.page_url.test_attribute, "")
+
+
+@override_settings(
+    ALLOWED_HOSTS=["localhost", "other"],
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "settings": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "wagtailsettings-tests",
+        },
+    },
+    WAGTAILSETTINGS_CACHE="settings",
+)
+class SettingCacheTestCase(SiteSettingsTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        caches["settings"].clear()
+
+    def test_for_site_uses_cache(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                TestSiteSetting.for_site(self.default_site), self.default_settings
+            )
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                TestSiteSetting.for_site(self.default_site), self.default_settings
+            )
+            self.assertEqual(
+                TestSiteSetting.for_site(self.default_site).title, "Site title"
+            )
+
+        # Each site is cached separately
+        self.assertEqual(TestSiteSetting.for_site(self.other_site).title, "Other title")
+
+    def test_saving_setting_invalidates_cache(self):
+        TestSiteSetting.for_site(self.default_site)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.default_settings.title = "New title"
+            self.default_settings.save()
+
+        self.assertEqual(TestSiteSetting.for_site(self.default_site).title, "New title")
+
+    def test_cached_setting_includes_pages(self):
+        ImportantPagesSiteSetting.objects.create(
+            site=self.default_site,
+            sign_up_page=self.default_site.root_page,
+            general_terms_page=self.default_site.root_page,
+            privacy_policy_page=self.other_site.root_page,
+        )
+        ImportantPagesSiteSetting.for_site(self.default_site)
+
+        with self.assertNumQueries(0):
+            settings = ImportantPagesSiteSetting.for_site(self.default_site)
+            self.assertEqual(
+                settings.privacy_policy_page.specific, self.other_site.root_page
+            )
+
+    def test_moving_page_invalidates_cache(self):
+        ImportantPagesSiteSetting.objects.create(
+            site=self.default_site, sign_up_page=self.other_site.root_page
+        )
+        ImportantPagesSiteSetting.for_site(self.default_site)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other_site.root_page.move(self.default_site.root_page, "last-child")
+
+        settings = ImportantPagesSiteSetting.for_site(self.default_site)
+        self.assertEqual(
+            settings.sign_up_page.url_path,
+            Page.objects.get(pk=self.other_site.root_page.pk).url_path,
+        )
+
+    def test_unpublishing_page_invalidates_cache(self):
+        ImportantPagesSiteSetting.objects.create(
+            site=self.default_site, sign_up_page=self.other_site.root_page
+        )
+        ImportantPagesSiteSetting.for_site(self.default_site)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other_site.root_page.specific.unpublish()
+
+        settings = ImportantPagesSiteSetting.for_site(self.default_site)
+        self.assertFalse(settings.sign_up_page.live)
+
+    def test_deleting_page_invalidates_cache(self):
+        page = self.default_site.root_page.add_child(
+            instance=Page(title="Sign up", slug="sign-up")
+        )
+        ImportantPagesSiteSetting.objects.create(
+            site=self.default_site, sign_up_page=page
+        )
+        ImportantPagesSiteSetting.for_site(self.default_site)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            page.delete()
+
+        settings = ImportantPagesSiteSetting.for_site(self.default_site)
+        self.assertIsNone(settings.sign_up_page)
+
+    def test_context_processor_preloads_settings(self):
+        TestSiteSetting.for_site(self.default_site)
+
+        request = self.get_request()
+        Site.find_for_request(request)
+
+        with self.assertNumQueries(0):
+            context = settings_context_processor(request)
+            self.assertEqual(
+                context["settings"]["tests"]["testsitesetting"], self.default_settings
+            )
+            self.assertEqual(
+                getattr(request, TestSiteSetting.get_cache_attr_name()),
+                self.default_settings,
+            )
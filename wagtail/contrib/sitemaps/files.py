@@ -0,0 +1,338 @@
+"""
+Pre-generated sitemap files, for sites with too many pages for the sitemap to be built
+on each request.
+
+The live, public pages of each site are split into shards by primary key, each of which
+is written to its own sitemap file (along with a gzipped copy), and listed in a sitemap
+index file for the site. Splitting by primary key means that publishing or unpublishing
+a page only changes the one shard that it belongs to.
+"""
+import gzip
+import os
+import re
+import shutil
+import tempfile
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.urls import NoReverseMatch, reverse
+from django.utils import translation
+from django.utils.http import RFC3986_SUBDELIMS
+from django.utils.module_loading import import_string
+
+DEFAULT_SHARD_SIZE = 10000
+
+INDEX_FILENAME = "sitemap.xml"
+SHARD_FILENAME = "sitemap-%d.xml"
+SHARD_FILENAME_RE = re.compile(r"^sitemap-(\d+)\.xml$")
+
+
+def get_sitemap_storage():
+    storage = getattr(settings, "WAGTAILSITEMAPS_STORAGE", default_storage)
+    if isinstance(storage, str):
+        module = import_string(storage)
+        storage = module()
+    return storage
+
+
+def get_shard_size():
+    return getattr(settings, "WAGTAILSITEMAPS_SHARD_SIZE", DEFAULT_SHARD_SIZE)
+
+
+def get_sitemap_file_name(site_id, shard=None):
+    """
+    Return the name of the sitemap file in the storage for the given site and shard,
+    or of the sitemap index file if shard is None.
+    """
+    filename = INDEX_FILENAME if shard is None else SHARD_FILENAME % shard
+    return "sitemaps/%d/%s" % (site_id, filename)
+
+
+class SitemapFileGenerator:
+    """
+    Writes the sitemap files for a site to the storage.
+
+    Page URLs are built from the site's root URL and the page's ``url_path``, which
+    avoids calling ``reverse()`` for every page. Pages of types that override
+    ``get_sitemap_urls``, ``get_url_parts`` or ``get_full_url`` are fetched as their
+    specific type, and their ``get_sitemap_urls`` method is used instead.
+    """
+
+    def __init__(self, site, storage=None, shard_size=None):
+        self.site = site
+        self.storage = storage or get_sitemap_storage()
+        self.shard_size = shard_size or get_shard_size()
+
+        self.root_path = site.root_page.url_path
+        self.root_url = site.root_url
+        self.serve_path_prefix = self.get_serve_path_prefix()
+        self.append_slash = getattr(settings, "WAGTAIL_APPEND_SLASH", True)
+        self._has_custom_urls = {}
+
+    def get_serve_path_prefix(self):
+        # The path that wagtail_serve is mounted at, so that page paths can be appended
+        # to it rather than calling reverse() for each page. None if wagtail_serve is
+        # not registered, in which case the pages' own get_sitemap_urls are used
+        try:
+            if getattr(settings, "WAGTAIL_I18N_ENABLED", False):
+                with translation.override(self.site.root_page.locale.language_code):
+                    return reverse("wagtail_serve", args=("",))
+            return reverse("wagtail_serve", args=("",))
+        except NoReverseMatch:
+            return None
+
+    def get_pages(self):
+        from wagtail.models import Page
+
+        return (
+            Page.objects.descendant_of(self.site.root_page, inclusive=True)
+            .live()
+            .public()
+            .only(
+                "id",
+                "content_type",
+                "url_path",
+                "last_published_at",
+                "latest_revision_created_at",
+            )
+        )
+
+    def get_shard(self, page_id):
+        return page_id // self.shard_size
+
+    def has_custom_urls(self, page_class):
+        from wagtail.models import Page
+
+        if page_class not in self._has_custom_urls:
+            self._has_custom_urls[page_class] = page_class is None or any(
+                getattr(page_class, name) is not getattr(Page, name)
+                for name in ("get_sitemap_urls", "get_url_parts", "get_full_url")
+            )
+        return self._has_custom_urls[page_class]
+
+    def get_sitemap_urls(self, page):
+        path = self.serve_path_prefix + quote(
+            page.url_path[len(self.root_path) :], safe=RFC3986_SUBDELIMS + "/~:@"
+        )
+        # Remove the trailing slash if WAGTAIL_APPEND_SLASH is False and we're not
+        # serving the root path, as Page.get_url_parts does
+        if not self.append_slash and path != "/":
+            path = path.rstrip("/")
+
+        return [
+            {
+                "location": self.root_url + path,
+                "lastmod": (page.last_published_at or page.latest_revision_created_at),
+            }
+        ]
+
+    def iter_urls(self, pages):
+        """
+        Yield the sitemap URLs of the given pages, which are generic Page instances.
+        """
+        from wagtail.models import Page
+
+        pages = list(pages)
+
+        # Fetch the pages that need their own get_sitemap_urls all at once
+        specific_pages = {}
+        if self.serve_path_prefix is None:
+            specific_page_ids = {page.pk for page in pages}
+        else:
+            specific_page_ids = {
+                page.pk for page in pages if self.has_custom_urls(page.specific_class)
+            }
+        if specific_page_ids:
+            specific_pages = Page.objects.filter(pk__in=specific_page_ids).specific()
+            specific_pages = {page.pk: page for page in specific_pages}
+
+        for page in pages:
+            if page.pk in specific_pages:
+                yield from specific_pages[page.pk].get_sitemap_urls()
+            elif page.pk not in specific_page_ids:
+                yield from self.get_sitemap_urls(page)
+
+    def get_shard_url(self, shard):
+        try:
+            return self.root_url + reverse("wagtailsitemaps_shard", args=(shard,))
+        except NoReverseMatch:
+            raise ImproperlyConfigured(
+                "Sitemap files require a URL pattern named 'wagtailsitemaps_shard', "
+                "taking the shard number as an argument"
+            )
+
+    def generate(self):
+        """
+        Write all of the sitemap files for the site, and remove any files for shards
+        that no longer have any pages. Returns the number of shards written.
+        """
+        shards = sorted(
+            {
+                self.get_shard(page_id)
+                for page_id in self.get_pages().values_list("pk", flat=True).iterator()
+            }
+        )
+        for shard in shards:
+            self.write_shard(shard)
+
+        for shard in set(self.get_existing_shards()) - set(shards):
+            self.delete_files(get_sitemap_file_name(self.site.pk, shard))
+
+        self.write_index()
+        return len(shards)
+
+    def update(self, page_ids):
+        """
+        Rewrite the sitemap files containing the pages with the given ids (which may
+        no longer be live, or exist), and the sitemap index.
+        """
+        for shard in sorted({self.get_shard(page_id) for page_id in page_ids}):
+            self.write_shard(shard)
+        self.write_index()
+
+    def is_generated(self):
+        return self.storage.exists(get_sitemap_file_name(self.site.pk))
+
+    def write_shard(self, shard):
+        first_id = shard * self.shard_size
+        pages = (
+            self.get_pages()
+            .filter(pk__gte=first_id, pk__lt=first_id + self.shard_size)
+            .order_by("pk")
+        )
+        name = get_sitemap_file_name(self.site.pk, shard)
+
+        if not pages.exists():
+            self.delete_files(name)
+            return
+
+        def write_urls(f):
+            f.write(
+                '<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            )
+            for url_info in self.iter_urls(pages.iterator()):
+                f.write("<url>")
+                f.write("<loc>%s</loc>" % escape(url_info["location"]))
+                if url_info.get("lastmod"):
+                    f.write(
+                        "<lastmod>%s</lastmod>"
+                        % url_info["lastmod"].strftime("%Y-%m-%d")
+                    )
+                if url_info.get("changefreq"):
+                    f.write(
+                        "<changefreq>%s</changefreq>" % escape(url_info["changefreq"])
+                    )
+                if url_info.get("priority") is not None:
+                    f.write("<priority>%s</priority>" % url_info["priority"])
+                f.write("</url>\n")
+            f.write("</urlset>\n")
+
+        self.write_files(name, write_urls)
+
+    def get_existing_shards(self):
+        try:
+            directories, files = self.storage.listdir(
+                os.path.dirname(get_sitemap_file_name(self.site.pk))
+            )
+        except FileNotFoundError:
+            return []
+
+        return sorted(
+            int(match.group(1))
+            for match in map(SHARD_FILENAME_RE.match, files)
+            if match
+        )
+
+    def write_index(self):
+        def write_sitemaps(f):
+            f.write(
+                '<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            )
+            for shard in self.get_existing_shards():
+                name = get_sitemap_file_name(self.site.pk, shard)
+                f.write("<sitemap>")
+                f.write("<loc>%s</loc>" % escape(self.get_shard_url(shard)))
+                try:
+                    lastmod = self.storage.get_modified_time(name)
+                except NotImplementedError:
+                    pass
+                else:
+                    f.write("<lastmod>%s</lastmod>" % lastmod.strftime("%Y-%m-%d"))
+                f.write("</sitemap>\n")
+            f.write("</sitemapindex>\n")
+
+        self.write_files(get_sitemap_file_name(self.site.pk), write_sitemaps)
+
+    def write_files(self, name, write_content):
+        """
+        Save the content written by the write_content function (which is given a text
+        file object) under the given name, and a gzipped copy under name + ".gz".
+        """
+        with tempfile.TemporaryFile() as xml_file, tempfile.TemporaryFile() as gz_file:
+            with gzip.GzipFile(fileobj=gz_file, mode="wb", mtime=0) as gz:
+                tee = _TeeWriter(xml_file, gz)
+                write_content(tee)
+
+            for f, file_name in [(xml_file, name), (gz_file, name + ".gz")]:
+                f.seek(0)
+                self.replace_file(file_name, f)
+
+    def replace_file(self, name, f):
+        """
+        Save the content of the file object f under the given name, replacing any
+        existing file without removing it first, so that the file is never missing
+        while it is served.
+        """
+        if self.storage.get_available_name(name) == name:
+            # There is no file with this name yet, or the storage overwrites existing
+            # files when saving (as most remote storages do)
+            self.storage.save(name, File(f, name=os.path.basename(name)))
+            return
+
+        try:
+            path = self.storage.path(name)
+        except NotImplementedError:
+            # The storage can neither overwrite nor rename files
+            self.storage.delete(name)
+            self.storage.save(name, File(f, name=os.path.basename(name)))
+            return
+
+        # Write the new content to a temporary file alongside the existing one, then
+        # swap it in with an atomic rename
+        with tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(path), prefix=".", delete=False
+        ) as temp_file:
+            shutil.copyfileobj(f, temp_file)
+        try:
+            os.chmod(
+                temp_file.name,
+                getattr(self.storage, "file_permissions_mode", None) or 0o644,
+            )
+            os.replace(temp_file.name, path)
+        except OSError:
+            os.remove(temp_file.name)
+            raise
+
+    def delete_files(self, name):
+        self.storage.delete(name)
+        self.storage.delete(name + ".gz")
+
+
+class _TeeWriter:
+    """
+    Encodes text and writes it to several binary files.
+    """
+
+    def __init__(self, *files):
+        self.files = files
+
+    def write(self, text):
+        data = text.encode("utf-8")
+        for f in self.files:
+            f.write(data)
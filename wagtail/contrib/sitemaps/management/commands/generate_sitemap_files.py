@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from wagtail.contrib.sitemaps.files import SitemapFileGenerator
+from wagtail.models import Site
+
+
+class Command(BaseCommand):
+    help = (
+        "Write the sitemap files for each site to the WAGTAILSITEMAPS_STORAGE storage."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--site",
+            type=int,
+            action="append",
+            dest="site_ids",
+            help="ID of a site to generate the sitemap files for (default: all sites)",
+        )
+        parser.add_argument(
+            "--shard-size",
+            type=int,
+            help="Maximum number of pages in each sitemap file (default: the WAGTAILSITEMAPS_SHARD_SIZE setting, or 10000)",
+        )
+
+    def handle(self, *args, **options):
+        sites = Site.objects.select_related("root_page", "root_page__locale")
+        if options["site_ids"]:
+            sites = sites.filter(pk__in=options["site_ids"])
+            if len(sites) != len(set(options["site_ids"])):
+                raise CommandError("Site not found")
+
+        for site in sites:
+            shard_count = SitemapFileGenerator(
+                site, shard_size=options["shard_size"]
+            ).generate()
+
+            if options["verbosity"] > 0:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Wrote {shard_count} sitemap file(s) for site '{site}'"
+                    )
+                )
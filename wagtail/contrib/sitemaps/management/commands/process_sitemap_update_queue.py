@@ -0,0 +1,21 @@
+from wagtail.contrib.sitemaps.queue import DEFAULT_BATCH_SIZE, logger, process_queue
+from wagtail.management.base import QueueProcessingCommand
+
+
+class Command(QueueProcessingCommand):
+    help = "Rewrite the generated sitemap files containing the pages queued with WAGTAILSITEMAPS_AUTO_UPDATE enabled."
+
+    default_batch_size = DEFAULT_BATCH_SIZE
+    queued_items_name = "pages"
+
+    def process_batch(self, batch_size, **options):
+        stats = process_queue(batch_size=batch_size)
+        if stats["entries"]:
+            logger.info(
+                "Processed %(entries)d queued sitemap update(s) for %(sites)d site(s)",
+                stats,
+            )
+        return stats
+
+    def get_summary(self, totals):
+        return "Processed %(entries)d queued sitemap update(s)" % totals
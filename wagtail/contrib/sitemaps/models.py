@@ -0,0 +1,21 @@
+from django.db import models
+
+
+class PendingSitemapUpdate(models.Model):
+    """
+    A page whose entry in a site's generated sitemap files needs rewriting, queued
+    when ``WAGTAILSITEMAPS_AUTO_UPDATE`` is enabled and processed by the
+    ``process_sitemap_update_queue`` management command.
+    """
+
+    site = models.ForeignKey(
+        "wagtailcore.Site", on_delete=models.CASCADE, related_name="+"
+    )
+    # Not a foreign key, as the page may have been deleted
+    page_id = models.IntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    wagtail_reference_index_ignore = True
+
+    def __str__(self):
+        return "Page %d on site %d" % (self.page_id, self.site_id)
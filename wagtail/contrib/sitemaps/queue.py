@@ -0,0 +1,79 @@
+"""
+Queued updates to the generated sitemap files, used when ``WAGTAILSITEMAPS_AUTO_UPDATE``
+is enabled.
+
+Rewriting a sitemap file means fetching every page in its shard, which is too slow to do
+in the request that publishes a page. Instead, the pages that have changed are recorded
+in the ``PendingSitemapUpdate`` table, as part of the same transaction, and the
+``process_sitemap_update_queue`` management command rewrites the files containing them.
+"""
+import logging
+from collections import defaultdict
+
+from .files import SitemapFileGenerator
+
+logger = logging.getLogger("wagtail.sitemaps")
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def enqueue_sitemap_updates(page_ids, url_paths):
+    """
+    Queue updates of the given pages in the sitemap files of each site whose pages
+    include any of the given url paths.
+    """
+    from wagtail.models import Site
+
+    from .models import PendingSitemapUpdate
+
+    site_ids = {
+        site_root_path.site_id
+        for site_root_path in Site.get_site_root_paths()
+        if any(url_path.startswith(site_root_path.root_path) for url_path in url_paths)
+    }
+
+    PendingSitemapUpdate.objects.bulk_create(
+        [
+            PendingSitemapUpdate(site_id=site_id, page_id=page_id)
+            for site_id in site_ids
+            for page_id in page_ids
+        ]
+    )
+
+
+def process_queue(batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Rewrite the sitemap files containing the pages of up to batch_size queued updates.
+    Sites that don't have generated sitemap files are left alone.
+
+    Returns a dict of statistics: the number of queue ``entries`` processed, and the
+    number of ``sites`` whose files were updated.
+    """
+    from wagtail.models import Site
+
+    from .models import PendingSitemapUpdate
+
+    pending = list(
+        PendingSitemapUpdate.objects.order_by("id").values_list(
+            "id", "site_id", "page_id"
+        )[:batch_size]
+    )
+
+    # Remove the entries before updating the files, so that the pages are queued
+    # again if they change again in the meantime
+    PendingSitemapUpdate.objects.filter(id__in=[item[0] for item in pending]).delete()
+
+    page_ids_by_site = defaultdict(set)
+    for id, site_id, page_id in pending:
+        page_ids_by_site[site_id].add(page_id)
+
+    updated_sites = 0
+    for site in Site.objects.filter(pk__in=page_ids_by_site).select_related(
+        "root_page", "root_page__locale"
+    ):
+        generator = SitemapFileGenerator(site)
+        if generator.is_generated():
+            generator.update(page_ids_by_site[site.pk])
+            updated_sites += 1
+
+    return {"entries": len(pending), "sites": updated_sites}
@@ -0,0 +1,60 @@
+from django.conf import settings
+from django.db.models.signals import post_delete
+
+from wagtail.models import Page
+from wagtail.signals import (
+    page_published,
+    page_slug_changed,
+    page_unpublished,
+    post_page_move,
+)
+
+from .queue import enqueue_sitemap_updates
+
+
+def update_sitemap_files(page_ids, url_paths):
+    """
+    Queue the rewriting of the generated sitemap files containing the given pages, for
+    each site whose pages include any of the given url paths.
+    """
+    if getattr(settings, "WAGTAILSITEMAPS_AUTO_UPDATE", False):
+        enqueue_sitemap_updates(page_ids, url_paths)
+
+
+def update_sitemap_files_on_publish(instance, **kwargs):
+    update_sitemap_files([instance.pk], [instance.url_path])
+
+
+def update_sitemap_files_on_delete(instance, **kwargs):
+    update_sitemap_files([instance.pk], [instance.url_path])
+
+
+def update_sitemap_files_for_descendants(instance, url_path_before, url_path_after):
+    if url_path_before == url_path_after:
+        return
+
+    # The URLs of all of the page's descendants have changed too
+    page_ids = list(
+        Page.objects.descendant_of(instance, inclusive=True).values_list(
+            "pk", flat=True
+        )
+    )
+    update_sitemap_files(page_ids, [url_path_before, url_path_after])
+
+
+def update_sitemap_files_on_move(instance, url_path_before, url_path_after, **kwargs):
+    update_sitemap_files_for_descendants(instance, url_path_before, url_path_after)
+
+
+def update_sitemap_files_on_slug_change(instance, instance_before, **kwargs):
+    update_sitemap_files_for_descendants(
+        instance, instance_before.url_path, instance.url_path
+    )
+
+
+def register_signal_handlers():
+    page_published.connect(update_sitemap_files_on_publish)
+    page_unpublished.connect(update_sitemap_files_on_publish)
+    page_slug_changed.connect(update_sitemap_files_on_slug_change)
+    post_delete.connect(update_sitemap_files_on_delete, sender=Page)
+    post_page_move.connect(update_sitemap_files_on_move)
@@ -1,14 +1,21 @@
 import datetime
+import gzip
+import shutil
+import tempfile
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.shortcuts import get_current_site
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
 from django.test import RequestFactory, TestCase, override_settings
 from django.utils import timezone
 
 from wagtail.models import Page, PageViewRestriction, Site
 from wagtail.test.testapp.models import EventIndex, SimplePage
 
+from .files import SitemapFileGenerator, get_sitemap_file_name
+from .models import PendingSitemapUpdate
 from .sitemap_generator import Sitemap
 
 
@@ -284,3 +291,170 @@ class TestSitemapView(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response["Content-Type"], "application/xml")
+
+
+class TestSitemapFiles(TestCase):
+    def setUp(self):
+        self.home_page = Page.objects.get(id=2)
+        self.child_page = self.home_page.add_child(
+            instance=SimplePage(
+                title="Hello world!",
+                slug="hello-world",
+                content="hello",
+                live=True,
+                last_published_at=datetime.datetime(
+                    2017, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc
+                ),
+            )
+        )
+        self.unpublished_child_page = self.home_page.add_child(
+            instance=SimplePage(
+                title="Unpublished",
+                slug="unpublished",
+                content="hello",
+                live=False,
+            )
+        )
+        self.event_index = self.home_page.add_child(
+            instance=EventIndex(title="Events", slug="events", live=True)
+        )
+        self.site = Site.objects.get(is_default_site=True)
+
+        storage_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, storage_dir)
+        self.storage = FileSystemStorage(location=storage_dir)
+
+    def read_file(self, shard=None):
+        with self.storage.open(get_sitemap_file_name(self.site.pk, shard)) as f:
+            return f.read().decode("utf-8")
+
+    def test_generate(self):
+        SitemapFileGenerator(self.site, storage=self.storage).generate()
+
+        content = self.read_file(0)
+        self.assertIn(
+            "<url><loc>http://localhost/hello-world/</loc><lastmod>2017-01-01</lastmod></url>",
+            content,
+        )
+        self.assertNotIn("/unpublished/", content)
+
+        # The gzipped copy has the same content
+        with self.storage.open(get_sitemap_file_name(self.site.pk, 0) + ".gz") as f:
+            self.assertEqual(gzip.decompress(f.read()).decode("utf-8"), content)
+
+        index = self.read_file()
+        self.assertIn("<loc>http://localhost/sitemap-files/sitemap-0.xml</loc>", index)
+
+    def test_urls_match_sitemap(self):
+        SitemapFileGenerator(self.site, storage=self.storage).generate()
+        content = self.read_file(0)
+
+        request = RequestFactory().get("/sitemap.xml")
+        sitemap = Sitemap(request)
+        for url_info in sitemap.get_urls(1, get_current_site(request), request.scheme):
+            self.assertIn("<loc>%s</loc>" % url_info["location"], content)
+
+    def test_uses_specific_get_sitemap_urls(self):
+        SitemapFileGenerator(self.site, storage=self.storage).generate()
+
+        # EventIndex.get_sitemap_urls adds a URL for its "past" view
+        self.assertIn("<loc>http://localhost/events/past/</loc>", self.read_file(0))
+
+    def test_shards(self):
+        SitemapFileGenerator(self.site, storage=self.storage, shard_size=1).generate()
+
+        index = self.read_file()
+        self.assertIn(
+            "<loc>http://localhost/sitemap-files/sitemap-%d.xml</loc>"
+            % self.child_page.pk,
+            index,
+        )
+        self.assertNotIn("sitemap-%d.xml" % self.unpublished_child_page.pk, index)
+        self.assertIn(
+            "http://localhost/hello-world/", self.read_file(self.child_page.pk)
+        )
+
+    def test_update(self):
+        generator = SitemapFileGenerator(self.site, storage=self.storage, shard_size=1)
+        generator.generate()
+
+        self.child_page.unpublish()
+        generator.update([self.child_page.pk])
+
+        self.assertNotIn("sitemap-%d.xml" % self.child_page.pk, self.read_file())
+        self.assertFalse(
+            self.storage.exists(get_sitemap_file_name(self.site.pk, self.child_page.pk))
+        )
+
+    def test_regenerate_replaces_files(self):
+        generator = SitemapFileGenerator(self.site, storage=self.storage)
+        generator.generate()
+        self.unpublished_child_page.save_revision().publish()
+        generator.generate()
+
+        # The files are replaced, rather than saved under new names
+        directories, files = self.storage.listdir("sitemaps/%d" % self.site.pk)
+        self.assertEqual(
+            sorted(files),
+            ["sitemap-0.xml", "sitemap-0.xml.gz", "sitemap.xml", "sitemap.xml.gz"],
+        )
+        self.assertIn("http://localhost/unpublished/", self.read_file(0))
+
+    def test_auto_update_on_publish(self):
+        with self.settings(
+            WAGTAILSITEMAPS_STORAGE=self.storage, WAGTAILSITEMAPS_AUTO_UPDATE=True
+        ):
+            call_command("generate_sitemap_files", verbosity=0)
+
+            self.unpublished_child_page.save_revision().publish()
+
+            # The update is queued, rather than made while publishing
+            self.assertEqual(
+                list(PendingSitemapUpdate.objects.values_list("site_id", "page_id")),
+                [(self.site.pk, self.unpublished_child_page.pk)],
+            )
+            self.assertNotIn("http://localhost/unpublished/", self.read_file(0))
+
+            call_command("process_sitemap_update_queue", verbosity=0)
+
+        self.assertIn("http://localhost/unpublished/", self.read_file(0))
+        self.assertFalse(PendingSitemapUpdate.objects.exists())
+
+    def test_auto_update_disabled(self):
+        self.unpublished_child_page.save_revision().publish()
+        self.assertFalse(PendingSitemapUpdate.objects.exists())
+
+    def test_serve_sitemap_file(self):
+        SitemapFileGenerator(self.site, storage=self.storage).generate()
+
+        with self.settings(WAGTAILSITEMAPS_STORAGE=self.storage):
+            response = self.client.get("/sitemap-files/sitemap-0.xml")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/xml")
+        self.assertNotIn("Content-Encoding", response)
+        self.assertIn(
+            "http://localhost/hello-world/",
+            b"".join(response.streaming_content).decode("utf-8"),
+        )
+
+    def test_serve_sitemap_file_gzip(self):
+        SitemapFileGenerator(self.site, storage=self.storage).generate()
+
+        with self.settings(WAGTAILSITEMAPS_STORAGE=self.storage):
+            response = self.client.get(
+                "/sitemap-files/sitemap.xml", HTTP_ACCEPT_ENCODING="gzip, deflate"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn(
+            "sitemap-0.xml",
+            gzip.decompress(b"".join(response.streaming_content)).decode("utf-8"),
+        )
+
+    def test_serve_sitemap_file_not_generated(self):
+        with self.settings(WAGTAILSITEMAPS_STORAGE=self.storage):
+            response = self.client.get("/sitemap-files/sitemap.xml")
+
+        self.assertEqual(response.status_code, 404)
@@ -1,7 +1,14 @@
 import inspect
 
+from django.conf import settings
 from django.contrib.sitemaps import views as sitemap_views
+from django.http import FileResponse, Http404
+from django.utils.cache import patch_vary_headers
 
+from wagtail.utils import sendfile_streaming_backend
+from wagtail.utils.sendfile import sendfile
+
+from .files import get_sitemap_file_name, get_sitemap_storage
 from .sitemap_generator import Sitemap
 
 
@@ -26,3 +33,58 @@ def prepare_sitemaps(request, sitemaps):
         else:
             initialised_sitemaps[name] = sitemap_cls
     return initialised_sitemaps
+
+
+def serve_sitemap_file(request, shard=None):
+    """
+    Serve the pre-generated sitemap index file for the current site, or the sitemap
+    file of the given shard (see wagtail.contrib.sitemaps.files). The gzipped copy
+    is served to clients that accept it.
+    """
+    from wagtail.models import Site
+
+    site = Site.find_for_request(request)
+    if site is None:
+        raise Http404
+
+    name = get_sitemap_file_name(site.pk, shard)
+    encoding = None
+    if "gzip" in request.META.get("HTTP_ACCEPT_ENCODING", ""):
+        name += ".gz"
+        encoding = "gzip"
+
+    storage = get_sitemap_storage()
+    try:
+        local_path = storage.path(name)
+    except NotImplementedError:
+        local_path = None
+
+    if local_path:
+        # Use wagtail.utils.sendfile to serve the file;
+        # this provides support for if-modified-since and django-sendfile backends
+        sendfile_opts = {
+            "mimetype": "application/xml",
+            "encoding": encoding,
+            "attachment_filename": False,
+        }
+        if not hasattr(settings, "SENDFILE_BACKEND"):
+            # Fallback to streaming backend if user hasn't specified SENDFILE_BACKEND
+            sendfile_opts["backend"] = sendfile_streaming_backend.sendfile
+
+        response = sendfile(request, local_path, **sendfile_opts)
+        if encoding is None:
+            # sendfile sets the header even when there is no encoding
+            del response["Content-Encoding"]
+    else:
+        # The storage backend doesn't expose filesystem paths, so stream the file
+        # content instead
+        try:
+            f = storage.open(name)
+        except FileNotFoundError:
+            raise Http404
+        response = FileResponse(f, content_type="application/xml")
+        if encoding:
+            response["Content-Encoding"] = encoding
+
+    patch_vary_headers(response, ["Accept-Encoding"])
+    return response
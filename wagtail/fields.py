@@ -83,7 +83,11 @@ class Creator:
 
 
 class StreamField(models.Field):
-    def __init__(self, block_types, use_json_field=None, **kwargs):
+    # The number of blocks of the same type that are converted together when a block of
+    # a stream is first accessed, if lazy_decode is enabled
+    lazy_prefetch_limit = 20
+
+    def __init__(self, block_types, use_json_field=None, lazy_decode=False, **kwargs):
         # extract kwargs that are to be passed on to the block, not handled by super
         block_opts = {}
         for arg in ["min_num", "max_num", "block_counts", "collapsed"]:
@@ -98,6 +102,10 @@ class StreamField(models.Field):
         super().__init__(**kwargs)
 
         self.use_json_field = use_json_field
+        # When True, accessing a block of a stream loaded from the database only converts
+        # a limited number of blocks of the same type to native values, rather than all
+        # of them (see StreamValue's prefetch_limit)
+        self.lazy_decode = lazy_decode
 
         if isinstance(block_types, Block):
             # use the passed block as the top-level block
@@ -160,13 +168,13 @@ class StreamField(models.Field):
                 # but better to handle it just in case...
                 return StreamValue(self.stream_block, [])
 
-            return self.stream_block.to_python(unpacked_value)
+            return self._stream_value_from_json(unpacked_value)
         elif value and isinstance(value, list) and isinstance(value[0], dict):
             # The value is already unpacked since JSONField-based StreamField should
             # accept deserialised values (no need to call json.dumps() first).
             # In addition, the value is not a list of (block_name, value) tuples
             # handled in the `else` block.
-            return self.stream_block.to_python(value)
+            return self._stream_value_from_json(value)
         else:
             # See if it looks like the standard non-smart representation of a
             # StreamField value: a list of (block_name, value) tuples
@@ -182,6 +190,12 @@ class StreamField(models.Field):
             # Test succeeded, so return as a StreamValue-ified version of that value
             return StreamValue(self.stream_block, value)
 
+    def _stream_value_from_json(self, value):
+        stream_value = self.stream_block.to_python(value)
+        if self.lazy_decode:
+            stream_value.prefetch_limit = self.lazy_prefetch_limit
+        return stream_value
+
     def get_prep_value(self, value):
         if (
             isinstance(value, StreamValue)
@@ -1,6 +1,7 @@
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 
-from rest_framework.fields import Field
+from django.conf import settings
+from rest_framework.fields import Field, SkipField
 
 from ..models import SourceImageIOError
 from ..utils import to_svg_safe_spec
@@ -33,14 +34,32 @@ class ImageRenditionField(Field):
         self.preserve_svg = preserve_svg
         super().__init__(*args, **kwargs)
 
+    def get_filter_spec(self, image):
+        if image.is_svg() and self.preserve_svg:
+            return to_svg_safe_spec(self.filter_spec)
+        return self.filter_spec
+
+    def prepare_for_listing(self, instances):
+        # Find or create (or with WAGTAILIMAGES_DEFER_RENDITIONS, queue) the
+        # renditions for every image in the listing in bulk. They are stored on the
+        # images, where get_rendition() will find them
+        images_by_spec = defaultdict(list)
+        for instance in instances:
+            try:
+                image = self.get_attribute(instance)
+            except SkipField:
+                continue
+
+            if image is not None:
+                images_by_spec[type(image), self.get_filter_spec(image)].append(image)
+
+        defer = getattr(settings, "WAGTAILIMAGES_DEFER_RENDITIONS", False)
+        for (image_model, filter_spec), images in images_by_spec.items():
+            image_model.get_renditions_for_images(images, filter_spec, defer=defer)
+
     def to_representation(self, image):
         try:
-            if image.is_svg() and self.preserve_svg:
-                filter_spec = to_svg_safe_spec(self.filter_spec)
-            else:
-                filter_spec = self.filter_spec
-
-            thumbnail = image.get_rendition(filter_spec)
+            thumbnail = image.get_rendition(self.get_filter_spec(image))
 
             return OrderedDict(
                 [
@@ -0,0 +1,60 @@
+from wagtail.images import get_image_model
+from wagtail.images.models import PendingRendition
+from wagtail.management.base import QueueProcessingCommand
+
+DEFAULT_BATCH_SIZE = 100
+
+
+class Command(QueueProcessingCommand):
+    """Command to generate renditions that were deferred by AbstractImage.defer_rendition()."""
+
+    help = "Generate image renditions that have been queued with WAGTAILIMAGES_DEFER_RENDITIONS enabled."
+
+    default_batch_size = DEFAULT_BATCH_SIZE
+    queued_items_name = "pending renditions"
+
+    def process_batch(self, batch_size, **options):
+        pending = list(
+            PendingRendition.objects.order_by("created_at", "id")[:batch_size]
+        )
+        if not pending:
+            return {"entries": 0}
+
+        generated = self.generate_renditions(pending)
+
+        # Remove the batch whether or not generation succeeded, so that a broken
+        # image does not block the queue. Any rendition that failed will be
+        # generated on demand by the serve view instead
+        PendingRendition.objects.filter(id__in=[item.id for item in pending]).delete()
+
+        return {"entries": len(pending), "generated": generated}
+
+    def get_summary(self, totals):
+        return "Successfully generated %(generated)d image rendition(s)" % totals
+
+    def generate_renditions(self, pending):
+        filter_specs_by_image_id = {}
+        for item in pending:
+            filter_specs_by_image_id.setdefault(item.image_id, []).append(
+                item.filter_spec
+            )
+
+        success_count = 0
+        images = get_image_model().objects.in_bulk(filter_specs_by_image_id.keys())
+        for image_id, filter_specs in filter_specs_by_image_id.items():
+            image = images.get(image_id)
+            if image is None:
+                # The image has been deleted since the rendition was requested
+                continue
+
+            try:
+                # Generates all missing renditions of the image together, so that
+                # its source file is only opened once
+                with image.open_file():
+                    image.get_renditions(*filter_specs)
+            except Exception:
+                self.stderr.write(f"Could not generate rendition for {image.title}")
+            else:
+                success_count += len(filter_specs)
+
+        return success_count
@@ -1,6 +1,52 @@
-from django.core.management.base import BaseCommand
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
 
 from wagtail.images import get_image_model
+from wagtail.management.utils import init_worker, map_in_workers, parse_since
+from wagtail.models import Collection
+
+DEFAULT_CHUNK_SIZE = 100
+
+
+def update_renditions_for_images(image_ids, filter_specs=None, purge_only=False):
+    """
+    Purge (and unless ``purge_only`` is set, regenerate) the renditions of the given
+    images. Renditions of each image are handled together, so that its source file
+    is only opened once.
+
+    Returns a tuple of the number of renditions processed and a list of error
+    messages. This is a module-level function so that it can be run in worker processes.
+    """
+    Image = get_image_model()
+    success_count = 0
+    errors = []
+
+    for image in Image.objects.filter(id__in=image_ids).order_by("id"):
+        renditions = image.renditions.all()
+        if filter_specs:
+            renditions = renditions.filter(filter_spec__in=filter_specs)
+        renditions = list(renditions)
+
+        try:
+            for rendition in renditions:
+                rendition.delete()
+
+            if not purge_only:
+                with image.open_file():
+                    image.get_renditions(
+                        *[rendition.filter_spec for rendition in renditions]
+                    )
+        except Exception:
+            if purge_only:
+                errors.append(f"Could not purge rendition for {image.title}")
+            else:
+                errors.append(f"Could not regenerate rendition for {image.title}")
+        else:
+            success_count += len(renditions)
+
+    return success_count, errors
 
 
 class Command(BaseCommand):
@@ -14,43 +60,133 @@ class Command(BaseCommand):
             action="store_true",
             help="Purge all image renditions without regenerating them",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of worker processes to regenerate renditions with (default: 1)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Number of images to handle in each batch (default: %d)"
+            % DEFAULT_CHUNK_SIZE,
+        )
+        parser.add_argument(
+            "--collection",
+            type=int,
+            help="Only update renditions of images within the collection with this ID (including its descendants)",
+        )
+        parser.add_argument(
+            "--filter-spec",
+            action="append",
+            dest="filter_specs",
+            help="Only update renditions with this filter spec. Can be given multiple times",
+        )
+        parser.add_argument(
+            "--since",
+            help="Only update renditions of images uploaded on or after this date / datetime (ISO 8601)",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help=(
+                "Path of a file to record progress in. If the file exists, images that "
+                "were handled by a previous run are skipped"
+            ),
+        )
 
     def handle(self, *args, **options):
-        renditions = get_image_model().get_rendition_model().objects.all()
-        if len(renditions) == 0:
+        renditions = self.get_renditions(options)
+        if not renditions.exists():
             self.stdout.write("No image renditions found.")
             return
 
-        success_count = 0
-        if options["purge_only"]:
-            for rendition in renditions:
-                try:
-                    rendition_image = rendition.image
-                    rendition.delete()
-                    success_count = success_count + 1
-                except Exception:
-                    self.stderr.write(
-                        f"Could not purge rendition for {rendition_image.title}"
-                    )
+        image_ids = renditions.order_by("image_id").values_list("image_id", flat=True)
+
+        checkpoint = options["checkpoint"]
+        if checkpoint and os.path.exists(checkpoint):
+            with open(checkpoint) as f:
+                image_ids = image_ids.filter(image_id__gt=int(f.read().strip()))
+
+        chunks = self.get_chunks(image_ids.distinct(), options["chunk_size"])
+        purge_only = options["purge_only"]
+        args = (options["filter_specs"], purge_only)
+
+        if options["workers"] > 1:
+            with ProcessPoolExecutor(
+                max_workers=options["workers"], initializer=init_worker
+            ) as executor:
+                results = map_in_workers(
+                    executor,
+                    update_renditions_for_images,
+                    chunks,
+                    *[[arg] * len(chunks) for arg in args],
+                )
+                success_count = self.handle_results(zip(chunks, results), checkpoint)
+        else:
+            success_count = self.handle_results(
+                (
+                    (chunk, update_renditions_for_images(chunk, *args))
+                    for chunk in chunks
+                ),
+                checkpoint,
+            )
+
+        if purge_only:
             self.stdout.write(
                 self.style.SUCCESS(
                     f"Successfully purged {success_count} image rendition(s)"
                 )
             )
         else:
-            for rendition in renditions:
-                try:
-                    rendition_filter = rendition.filter
-                    rendition_image = rendition.image
-                    rendition.delete()
-                    rendition_image.get_rendition(rendition_filter)
-                    success_count = success_count + 1
-                except Exception:
-                    self.stderr.write(
-                        f"Could not regenerate rendition for {rendition_image.title}"
-                    )
             self.stdout.write(
                 self.style.SUCCESS(
                     f"Successfully regenerated {success_count} image rendition(s)"
                 )
             )
+
+    def get_renditions(self, options):
+        renditions = get_image_model().get_rendition_model().objects.all()
+
+        if options["collection"]:
+            try:
+                collection = Collection.objects.get(id=options["collection"])
+            except Collection.DoesNotExist:
+                raise CommandError(
+                    "Collection with ID %d does not exist" % options["collection"]
+                )
+            renditions = renditions.filter(
+                image__collection__in=collection.get_descendants(inclusive=True)
+            )
+
+        if options["filter_specs"]:
+            renditions = renditions.filter(filter_spec__in=options["filter_specs"])
+
+        if options["since"]:
+            renditions = renditions.filter(
+                image__created_at__gte=parse_since(options["since"])
+            )
+
+        return renditions
+
+    def get_chunks(self, image_ids, chunk_size):
+        # Fetch all IDs up front, as the renditions they are selected from are
+        # replaced while the chunks are being processed
+        image_ids = list(image_ids)
+        return [
+            image_ids[i : i + chunk_size] for i in range(0, len(image_ids), chunk_size)
+        ]
+
+    def handle_results(self, results, checkpoint):
+        # Results arrive in the same order as the chunks, so once a chunk is done
+        # every image up to its last one has been handled
+        success_count = 0
+        for chunk, (count, errors) in results:
+            success_count += count
+            for error in errors:
+                self.stderr.write(error)
+            if checkpoint:
+                with open(checkpoint, "w") as f:
+                    f.write(str(chunk[-1]))
+        return success_count
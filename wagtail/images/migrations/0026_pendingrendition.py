@@ -0,0 +1,36 @@
+# Generated by Django 4.0.10 on 2026-10-16 21:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wagtailimages", "0025_alter_image_file_alter_rendition_file"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingRendition",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("image_id", models.PositiveIntegerField()),
+                ("filter_spec", models.CharField(max_length=255)),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, db_index=True),
+                ),
+            ],
+            options={
+                "unique_together": {("image_id", "filter_spec")},
+            },
+        ),
+    ]
@@ -1,11 +1,12 @@
 import hashlib
 import logging
+import math
 import os.path
 import time
 from collections import OrderedDict
 from contextlib import contextmanager
 from tempfile import SpooledTemporaryFile
-from typing import Union
+from typing import Dict, Iterable, List, Union
 
 import willow
 from django.apps import apps
@@ -14,17 +15,19 @@ from django.core import checks
 from django.core.cache import InvalidCacheBackendError, caches
 from django.core.files import File
 from django.core.files.storage import default_storage
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.forms.utils import flatatt
 from django.urls import reverse
 from django.utils.functional import cached_property
 from django.utils.module_loading import import_string
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
+from PIL import Image as PILImage
 from taggit.managers import TaggableManager
+from willow.plugins.pillow import PillowImage
 
 from wagtail import hooks
-from wagtail.coreutils import string_to_ascii
+from wagtail.coreutils import accepts_kwarg, string_to_ascii
 from wagtail.images.exceptions import (
     InvalidFilterSpecError,
     UnknownOutputImageFormatError,
@@ -406,31 +409,38 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         """Get the Rendition model for this Image model"""
         return cls.renditions.rel.related_model
 
-    def get_rendition(self, filter: Union["Filter", str]) -> "AbstractRendition":
+    def get_rendition(
+        self, filter: Union["Filter", str], defer: bool = None
+    ) -> "AbstractRendition":
         """
         Returns a ``Rendition`` instance with a ``file`` field value (an
         image) reflecting the supplied ``filter`` value and focal point values
         from this object.
 
+        If the rendition does not exist yet and ``defer`` is true (by default, if
+        ``WAGTAILIMAGES_DEFER_RENDITIONS`` is enabled), it is queued to be generated
+        in the background by ``defer_rendition()`` and an unsaved placeholder is
+        returned instead.
+
         Note: If using custom image models, an instance of the custom rendition
         model will be returned.
         """
         if isinstance(filter, str):
             filter = Filter(spec=filter)
 
+        if defer is None:
+            defer = getattr(settings, "WAGTAILIMAGES_DEFER_RENDITIONS", False)
+
         Rendition = self.get_rendition_model()
 
         try:
             rendition = self.find_existing_rendition(filter)
         except Rendition.DoesNotExist:
+            if defer:
+                return self.defer_rendition(filter)
             rendition = self.create_rendition(filter)
             # Reuse this rendition if requested again from this object
-            if "renditions" in getattr(self, "_prefetched_objects_cache", {}):
-                self._prefetched_objects_cache["renditions"]._result_cache.append(
-                    rendition
-                )
-            elif hasattr(self, "prefetched_renditions"):
-                self.prefetched_renditions.append(rendition)
+            self._add_to_prefetched_renditions(rendition)
 
         try:
             cache = caches["renditions"]
@@ -443,6 +453,240 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
 
         return rendition
 
+    def get_renditions(
+        self, *filters: Union["Filter", str]
+    ) -> Dict[str, "AbstractRendition"]:
+        """
+        Returns a ``dict`` of ``Rendition`` instances for the supplied ``filters``,
+        keyed by filter spec. This is equivalent to calling ``get_rendition()`` for
+        each filter, but existing renditions are looked up with a single cache lookup
+        and database query, and missing ones are created with a single
+        ``bulk_create()``.
+
+        Note: If using custom image models, instances of the custom rendition
+        model will be returned.
+        """
+        renditions = self.get_renditions_for_images(
+            [self], *filters, fail_silently=False
+        )
+        return renditions[self.pk]
+
+    @classmethod
+    def get_renditions_for_images(
+        cls,
+        images: Iterable["AbstractImage"],
+        *filters: Union["Filter", str],
+        fail_silently: bool = True,
+        defer: bool = False,
+    ) -> Dict[int, Dict[str, "AbstractRendition"]]:
+        """
+        Returns ``Rendition`` instances for every combination of the supplied
+        ``images`` and ``filters``, as a ``dict`` of the form
+        ``{image.pk: {filter_spec: rendition}}``.
+
+        Renditions are looked up in any prefetched values first, then in the
+        renditions cache with a single ``get_many()``, then in the database with a
+        single query. Any that are still missing are generated and saved with a
+        single ``bulk_create()``. The results are stored on each image, so that
+        subsequent calls to ``get_rendition()`` with the same filters (such as from
+        the ``{% image %}`` tag) need no further lookups.
+
+        If ``fail_silently`` is true, images whose source file cannot be read are
+        left out of the result rather than raising ``SourceImageIOError``.
+
+        If ``defer`` is true, missing renditions are not generated, but queued with
+        a single query as by ``defer_rendition()``, and unsaved placeholders are
+        returned for them instead.
+        """
+        Rendition = cls.get_rendition_model()
+        filters = list(
+            {
+                filter.spec: filter
+                for filter in (
+                    Filter(spec=filter) if isinstance(filter, str) else filter
+                    for filter in filters
+                )
+            }.values()
+        )
+
+        images_by_pk = {}
+        for image in images:
+            images_by_pk.setdefault(image.pk, []).append(image)
+
+        result = {pk: {} for pk in images_by_pk}
+        # Maps (image_id, filter_spec, focal_point_key) to (image, filter) for
+        # renditions that have not been found yet
+        missing = {}
+
+        for pk, instances in images_by_pk.items():
+            image = instances[0]
+            fetched_renditions = getattr(image, "_fetched_renditions", {})
+            prefetched_renditions = image._get_prefetched_renditions() or []
+            for filter in filters:
+                focal_point_key = filter.get_cache_key(image)
+                if (filter.spec, focal_point_key) in fetched_renditions:
+                    result[pk][filter.spec] = fetched_renditions[
+                        (filter.spec, focal_point_key)
+                    ]
+                    continue
+                for rendition in prefetched_renditions:
+                    if (
+                        rendition.filter_spec == filter.spec
+                        and rendition.focal_point_key == focal_point_key
+                    ):
+                        result[pk][filter.spec] = rendition
+                        break
+                else:
+                    missing[(pk, filter.spec, focal_point_key)] = (image, filter)
+
+        # Next, query the cache (if configured)
+        try:
+            cache = caches["renditions"]
+        except InvalidCacheBackendError:
+            cache = None
+
+        if cache is not None and missing:
+            cache_keys = {
+                Rendition.construct_cache_key(pk, focal_point_key, filter_spec): (
+                    pk,
+                    filter_spec,
+                    focal_point_key,
+                )
+                for pk, filter_spec, focal_point_key in missing.keys()
+            }
+            for cache_key, rendition in cache.get_many(cache_keys.keys()).items():
+                if rendition:
+                    key = cache_keys[cache_key]
+                    result[key[0]][key[1]] = rendition
+                    del missing[key]
+
+        # Renditions that are found or created from here on are added to the cache
+        to_cache = list(missing.values())
+
+        # Then look up the remaining renditions with a single query
+        if missing:
+            for rendition in Rendition.objects.filter(
+                image_id__in={key[0] for key in missing.keys()},
+                filter_spec__in={key[1] for key in missing.keys()},
+            ):
+                key = (
+                    rendition.image_id,
+                    rendition.filter_spec,
+                    rendition.focal_point_key,
+                )
+                if key in missing:
+                    # Avoid a further query when accessing rendition.image
+                    rendition.image = missing.pop(key)[0]
+                    result[rendition.image_id][rendition.filter_spec] = rendition
+
+        if defer and missing:
+            PendingRendition.objects.bulk_create(
+                [
+                    PendingRendition(image_id=image.pk, filter_spec=filter.spec)
+                    for image, filter in missing.values()
+                ],
+                ignore_conflicts=True,
+            )
+            for image, filter in missing.values():
+                result[image.pk][filter.spec] = image._get_placeholder_rendition(filter)
+            missing = {}
+
+        # Generate any renditions that don't exist yet, decoding each source image
+        # only once, and save them in bulk
+        filters_by_image = {}
+        for image, filter in missing.values():
+            filters_by_image.setdefault(image.pk, (image, []))[1].append(filter)
+
+        to_create = []
+        for image, image_filters in filters_by_image.values():
+            try:
+                with image.open_rendition_source(image_filters) as source:
+                    for filter in image_filters:
+                        to_create.append(
+                            Rendition(
+                                image=image,
+                                filter_spec=filter.spec,
+                                focal_point_key=filter.get_cache_key(image),
+                                file=image.generate_rendition_file(
+                                    filter, source=source
+                                ),
+                            )
+                        )
+            except SourceImageIOError:
+                if not fail_silently:
+                    raise
+                to_create = [r for r in to_create if r.image_id != image.pk]
+                del result[image.pk]
+
+        for rendition in cls._save_renditions(Rendition, to_create):
+            result[rendition.image_id][rendition.filter_spec] = rendition
+
+        # Store the renditions on each image, for reuse by get_rendition(). These are
+        # kept apart from any prefetched renditions, which get_rendition() treats as
+        # complete, as they only cover the filters requested here
+        for pk, renditions in result.items():
+            for image in images_by_pk[pk]:
+                fetched_renditions = image.__dict__.setdefault(
+                    "_fetched_renditions", {}
+                )
+                for rendition in renditions.values():
+                    fetched_renditions[
+                        (rendition.filter_spec, rendition.focal_point_key)
+                    ] = rendition
+
+        to_cache = [
+            (image, filter)
+            for image, filter in to_cache
+            if image.pk in result and not result[image.pk][filter.spec].is_placeholder
+        ]
+
+        if cache is not None and to_cache:
+            cache.set_many(
+                {
+                    Rendition.construct_cache_key(
+                        image.pk, filter.get_cache_key(image), filter.spec
+                    ): result[image.pk][filter.spec]
+                    for image, filter in to_cache
+                }
+            )
+
+        return result
+
+    @staticmethod
+    def _save_renditions(
+        Rendition, renditions: List["AbstractRendition"]
+    ) -> List["AbstractRendition"]:
+        if not renditions:
+            return []
+
+        try:
+            with transaction.atomic():
+                return Rendition.objects.bulk_create(renditions)
+        except IntegrityError:
+            # Some of these renditions were created by another process in the
+            # meantime, so fall back on get_or_create() for each of them
+            return [
+                Rendition.objects.get_or_create(
+                    image_id=rendition.image_id,
+                    filter_spec=rendition.filter_spec,
+                    focal_point_key=rendition.focal_point_key,
+                    defaults={"file": rendition.file},
+                )[0]
+                for rendition in renditions
+            ]
+
+    def _get_prefetched_renditions(self):
+        if "renditions" in getattr(self, "_prefetched_objects_cache", {}):
+            return self.renditions.all()
+        return getattr(self, "prefetched_renditions", None)
+
+    def _add_to_prefetched_renditions(self, rendition):
+        # Reuse this rendition if requested again from this object
+        if "renditions" in getattr(self, "_prefetched_objects_cache", {}):
+            self._prefetched_objects_cache["renditions"]._result_cache.append(rendition)
+        elif hasattr(self, "prefetched_renditions"):
+            self.prefetched_renditions.append(rendition)
+
     def find_existing_rendition(self, filter: "Filter") -> "AbstractRendition":
         """
         Returns an existing ``Rendition`` instance with a ``file`` field value
@@ -459,12 +703,13 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         Rendition = self.get_rendition_model()
         cache_key = filter.get_cache_key(self)
 
-        # Interrogate prefetched values first (if available)
-        if "renditions" in getattr(self, "_prefetched_objects_cache", {}):
-            prefetched_renditions = self.renditions.all()
-        else:
-            prefetched_renditions = getattr(self, "prefetched_renditions", None)
+        # Use any rendition found by get_renditions_for_images()
+        fetched_renditions = getattr(self, "_fetched_renditions", {})
+        if (filter.spec, cache_key) in fetched_renditions:
+            return fetched_renditions[(filter.spec, cache_key)]
 
+        # Then interrogate prefetched values (if available)
+        prefetched_renditions = self._get_prefetched_renditions()
         if prefetched_renditions is not None:
             for rendition in prefetched_renditions:
                 if (
@@ -512,7 +757,86 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         )
         return rendition
 
-    def generate_rendition_file(self, filter: "Filter") -> File:
+    def defer_rendition(self, filter: "Filter") -> "AbstractRendition":
+        """
+        Records that the rendition for the supplied ``filter`` needs generating, to
+        be picked up by the ``wagtail_generate_pending_renditions`` management
+        command, and returns an unsaved placeholder rendition in the meantime.
+
+        The placeholder has the dimensions the rendition will have, and its URL
+        points at the ``wagtailimages_serve`` view, which generates the rendition
+        on demand if it is requested before the queue has been processed.
+        """
+        # Let the database ignore duplicates, rather than querying for them first
+        PendingRendition.objects.bulk_create(
+            [PendingRendition(image_id=self.pk, filter_spec=filter.spec)],
+            ignore_conflicts=True,
+        )
+        return self._get_placeholder_rendition(filter)
+
+    def _get_placeholder_rendition(self, filter: "Filter") -> "AbstractRendition":
+        width, height = filter.get_transform(self).size
+        rendition = self.get_rendition_model()(
+            image=self,
+            filter_spec=filter.spec,
+            focal_point_key=filter.get_cache_key(self),
+            width=width,
+            height=height,
+        )
+        rendition.is_placeholder = True
+        return rendition
+
+    @contextmanager
+    def open_rendition_source(self, filters: Iterable["Filter"] = ()):
+        """
+        Opens and decodes the original image file once, returning a
+        ``RenditionSource`` that can be passed to ``generate_rendition_file()``
+        for each of the supplied ``filters``.
+
+        For JPEG images, if all of the filters shrink the image to half its size
+        or less, the image is reduced while it is being decoded (using Pillow's
+        draft mode), which is much faster and uses much less memory than decoding
+        it at full size.
+        """
+        with self.get_willow_image() as willow:
+            original_format = willow.format_name
+            full_size = None
+            scale = 1
+
+            if original_format == "jpeg" and filters:
+                willow.f.seek(0)
+                pillow_image = PILImage.open(willow.f)
+                width, height = pillow_image.size
+                orientation = pillow_image.getexif().get(0x0112, 1)
+                if orientation in (5, 6, 7, 8):
+                    full_size = (height, width)
+                else:
+                    full_size = (width, height)
+
+                required_scale = max(
+                    filter.get_required_scale(self, full_size) for filter in filters
+                )
+                if required_scale <= 0.5:
+                    pillow_image.draft(
+                        pillow_image.mode,
+                        (
+                            math.ceil(width * required_scale),
+                            math.ceil(height * required_scale),
+                        ),
+                    )
+                    pillow_image.load()
+                    scale = pillow_image.width / width
+                    willow = PillowImage(pillow_image)
+
+            willow = willow.auto_orient()
+            if full_size is None or scale == 1:
+                full_size = (willow.image.width, willow.image.height)
+
+            yield RenditionSource(willow, original_format, full_size, scale)
+
+    def generate_rendition_file(
+        self, filter: "Filter", *, source: "RenditionSource" = None
+    ) -> File:
         """
         Generates an in-memory image matching the supplied ``filter`` value
         and focal point value from this object, wraps it in a ``File`` object
@@ -520,6 +844,10 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         as the ``file`` field value for rendition objects saved by
         ``AbstractImage.create_rendition()``.
 
+        If a ``source`` from ``open_rendition_source()`` is supplied, the rendition
+        is generated from it rather than by decoding the original image again
+        (unless the filter's ``run()`` method doesn't accept a ``source`` argument).
+
         NOTE: The responsibility of generating the new image from the original
         falls to the supplied ``filter`` object. If you want to do anything
         custom with rendition images (for example, to preserve metadata from
@@ -537,10 +865,16 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
 
         start_time = time.time()
 
+        run_kwargs = {}
+        # Custom Filter subclasses may override run() without the source argument
+        if source is not None and accepts_kwarg(filter.run, "source"):
+            run_kwargs["source"] = source
+
         try:
             generated_image = filter.run(
                 self,
                 SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE),
+                **run_kwargs,
             )
 
             logger.debug(
@@ -693,87 +1027,106 @@ class Filter:
             transform = operation.run(transform, image)
         return transform
 
-    def run(self, image, output):
-        with image.get_willow_image() as willow:
-            original_format = willow.format_name
-
-            # Fix orientation of image
-            willow = willow.auto_orient()
-
-            # Transform the image
-            transform = self.get_transform(
-                image, (willow.image.width, willow.image.height)
-            )
-            willow = willow.crop(transform.get_rect().round())
-            willow = willow.resize(transform.size)
+    def get_required_scale(self, image, size=None):
+        """
+        Returns the fraction of the original image's resolution that is needed
+        to produce the output of this filter without any loss of quality.
+        """
+        transform = self.get_transform(image, size)
+        rect = transform.get_rect()
+        if not rect.width or not rect.height:
+            return 1
+        return max(
+            transform.size[0] / rect.width,
+            transform.size[1] / rect.height,
+        )
 
-            # Apply filters
-            env = {
-                "original-format": original_format,
+    def run(self, image, output, source=None):
+        if source is None:
+            # Only renditions generated together by get_renditions() are reduced on
+            # decoding, so single renditions are resized exactly as before
+            with image.open_rendition_source() as source:
+                return self._run(image, output, source)
+        return self._run(image, output, source)
+
+    def _run(self, image, output, source):
+        original_format = source.original_format
+        willow = source.willow
+
+        # Transform the image. The transform is calculated against the full size
+        # image, so the crop needs scaling if the source was reduced on decoding
+        transform = self.get_transform(image, source.size)
+        rect = transform.get_rect()
+        if source.scale != 1:
+            rect = Rect(*(coordinate * source.scale for coordinate in rect))
+        willow = willow.crop(rect.round())
+        willow = willow.resize(transform.size)
+
+        # Apply filters
+        env = {
+            "original-format": original_format,
+        }
+        for operation in self.filter_operations:
+            willow = operation.run(willow, image, env) or willow
+
+        # Find the output format to use
+        if "output-format" in env:
+            # Developer specified an output format
+            output_format = env["output-format"]
+        else:
+            # Convert bmp and webp to png by default
+            default_conversions = {
+                "bmp": "png",
+                "webp": "png",
             }
-            for operation in self.filter_operations:
-                willow = operation.run(willow, image, env) or willow
-
-            # Find the output format to use
-            if "output-format" in env:
-                # Developer specified an output format
-                output_format = env["output-format"]
-            else:
-                # Convert bmp and webp to png by default
-                default_conversions = {
-                    "bmp": "png",
-                    "webp": "png",
-                }
 
-                # Convert unanimated GIFs to PNG as well
-                if not willow.has_animation():
-                    default_conversions["gif"] = "png"
+            # Convert unanimated GIFs to PNG as well
+            if not willow.has_animation():
+                default_conversions["gif"] = "png"
 
-                # Allow the user to override the conversions
-                conversion = getattr(settings, "WAGTAILIMAGES_FORMAT_CONVERSIONS", {})
-                default_conversions.update(conversion)
+            # Allow the user to override the conversions
+            conversion = getattr(settings, "WAGTAILIMAGES_FORMAT_CONVERSIONS", {})
+            default_conversions.update(conversion)
 
-                # Get the converted output format falling back to the original
-                output_format = default_conversions.get(
-                    original_format, original_format
-                )
-
-            if output_format == "jpeg":
-                # Allow changing of JPEG compression quality
-                if "jpeg-quality" in env:
-                    quality = env["jpeg-quality"]
-                else:
-                    quality = getattr(settings, "WAGTAILIMAGES_JPEG_QUALITY", 85)
+            # Get the converted output format falling back to the original
+            output_format = default_conversions.get(original_format, original_format)
 
-                # If the image has an alpha channel, give it a white background
-                if willow.has_alpha():
-                    willow = willow.set_background_color_rgb((255, 255, 255))
+        if output_format == "jpeg":
+            # Allow changing of JPEG compression quality
+            if "jpeg-quality" in env:
+                quality = env["jpeg-quality"]
+            else:
+                quality = getattr(settings, "WAGTAILIMAGES_JPEG_QUALITY", 85)
 
-                return willow.save_as_jpeg(
-                    output, quality=quality, progressive=True, optimize=True
-                )
-            elif output_format == "png":
-                return willow.save_as_png(output, optimize=True)
-            elif output_format == "gif":
-                return willow.save_as_gif(output)
-            elif output_format == "webp":
-                # Allow changing of WebP compression quality
-                if (
-                    "output-format-options" in env
-                    and "lossless" in env["output-format-options"]
-                ):
-                    return willow.save_as_webp(output, lossless=True)
-                elif "webp-quality" in env:
-                    quality = env["webp-quality"]
-                else:
-                    quality = getattr(settings, "WAGTAILIMAGES_WEBP_QUALITY", 85)
+            # If the image has an alpha channel, give it a white background
+            if willow.has_alpha():
+                willow = willow.set_background_color_rgb((255, 255, 255))
 
-                return willow.save_as_webp(output, quality=quality)
-            elif output_format == "svg":
-                return willow.save_as_svg(output)
-            raise UnknownOutputImageFormatError(
-                f"Unknown output image format '{output_format}'"
+            return willow.save_as_jpeg(
+                output, quality=quality, progressive=True, optimize=True
             )
+        elif output_format == "png":
+            return willow.save_as_png(output, optimize=True)
+        elif output_format == "gif":
+            return willow.save_as_gif(output)
+        elif output_format == "webp":
+            # Allow changing of WebP compression quality
+            if (
+                "output-format-options" in env
+                and "lossless" in env["output-format-options"]
+            ):
+                return willow.save_as_webp(output, lossless=True)
+            elif "webp-quality" in env:
+                quality = env["webp-quality"]
+            else:
+                quality = getattr(settings, "WAGTAILIMAGES_WEBP_QUALITY", 85)
+
+            return willow.save_as_webp(output, quality=quality)
+        elif output_format == "svg":
+            return willow.save_as_svg(output)
+        raise UnknownOutputImageFormatError(
+            f"Unknown output image format '{output_format}'"
+        )
 
     def get_cache_key(self, image):
         vary_parts = []
@@ -792,6 +1145,23 @@ class Filter:
         return hashlib.sha1(vary_string.encode("utf-8")).hexdigest()[:8]
 
 
+class RenditionSource:
+    """
+    An original image that has been decoded and auto-oriented once, from which
+    several renditions can be generated. Returned by
+    ``AbstractImage.open_rendition_source()``.
+
+    ``size`` is the size of the original image, after orientation. If the image was
+    reduced while decoding, ``willow`` is smaller than this by a factor of ``scale``.
+    """
+
+    def __init__(self, willow, original_format, size, scale=1):
+        self.willow = willow
+        self.original_format = original_format
+        self.size = size
+        self.scale = scale
+
+
 class AbstractRendition(ImageFileMixin, models.Model):
     filter_spec = models.CharField(max_length=255, db_index=True)
     """ Use local ImageField with Willow support.  """
@@ -809,8 +1179,15 @@ class AbstractRendition(ImageFileMixin, models.Model):
 
     wagtail_reference_index_ignore = True
 
+    # Set on unsaved placeholders returned by AbstractImage.defer_rendition()
+    is_placeholder = False
+
     @property
     def url(self):
+        if self.is_placeholder:
+            from wagtail.images.views.serve import generate_image_url
+
+            return generate_image_url(self.image, self.filter_spec)
         return self.file.url
 
     @property
@@ -945,6 +1322,27 @@ class Rendition(AbstractRendition):
         unique_together = (("image", "filter_spec", "focal_point_key"),)
 
 
+class PendingRendition(models.Model):
+    """
+    A rendition of an image of the ``WAGTAILIMAGES_IMAGE_MODEL`` model that has been
+    requested with rendition generation deferred (see ``AbstractImage.defer_rendition()``),
+    and is yet to be generated by the ``wagtail_generate_pending_renditions``
+    management command.
+    """
+
+    image_id = models.PositiveIntegerField()
+    filter_spec = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    wagtail_reference_index_ignore = True
+
+    class Meta:
+        unique_together = (("image_id", "filter_spec"),)
+
+    def __str__(self):
+        return "%s: %s" % (self.image_id, self.filter_spec)
+
+
 class UploadedImage(models.Model):
     """
     Temporary storage for images uploaded through the multiple image uploader, when validation rules (e.g.
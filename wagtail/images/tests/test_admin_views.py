@@ -3,6 +3,7 @@ import json
 import urllib
 
 from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.template.defaultfilters import filesizeformat
 from django.template.loader import render_to_string
@@ -21,6 +22,7 @@ from wagtail.models import (
     Collection,
     GroupCollectionPermission,
     Page,
+    PendingReferenceIndexUpdate,
     get_root_collection_id,
 )
 from wagtail.test.testapp.models import (
@@ -1322,6 +1324,39 @@ class TestUsage(WagtailTestUtils, TestCase):
         # There's no usage so there should be no table rows
         self.assertRegex(response.content.decode("utf-8"), r"<tbody>(\s|\n)*</tbody>")
 
+    def test_usage_page_with_pending_reference_index_updates(self):
+        event_page = Page.objects.get(id=2).add_child(
+            instance=EventPage(
+                title="Christmas",
+                slug="christmas",
+                feed_image=self.image,
+                date_from=datetime.date.today(),
+                audience="private",
+                location="Test",
+                cost="Test",
+            )
+        )
+
+        # Pending updates are only checked for when updates are queued
+        with self.settings(WAGTAIL_REFERENCE_INDEX_UPDATE_MODE="queue"):
+            # Pages are not known to reference images
+            PendingReferenceIndexUpdate.objects.create(
+                content_type=ContentType.objects.get_for_model(Page), object_id="2"
+            )
+            response = self.client.get(
+                reverse("wagtailimages:image_usage", args=[self.image.id])
+            )
+            self.assertNotContains(response, "this list may not be up to date")
+
+            PendingReferenceIndexUpdate.objects.create(
+                content_type=ContentType.objects.get_for_model(EventPage),
+                object_id=str(event_page.pk),
+            )
+            response = self.client.get(
+                reverse("wagtailimages:image_usage", args=[self.image.id])
+            )
+            self.assertContains(response, "this list may not be up to date")
+
     def test_usage_no_tags(self):
         # tags should not count towards an image's references
         self.image.tags.add("illustration")
@@ -23,3 +23,21 @@ class TestImageRenditionField(TestCase):
         self.assertEqual(representation["width"], rendition.width)
         self.assertEqual(representation["height"], rendition.height)
         self.assertEqual(representation["alt"], rendition.alt)
+
+    def test_prepare_for_listing(self):
+        other_image = Image.objects.create(
+            title="Other test image",
+            file=get_test_image_file(),
+        )
+        self.image.get_rendition("width-400")
+        images = list(Image.objects.filter(pk__in=[self.image.pk, other_image.pk]))
+
+        field = ImageRenditionField("width-400", source="*")
+        field.bind("thumbnail", None)
+        field.prepare_for_listing(images)
+
+        self.assertEqual(other_image.renditions.count(), 1)
+        with self.assertNumQueries(0):
+            for image in images:
+                representation = field.to_representation(image)
+                self.assertEqual(representation["width"], 400)
@@ -1,11 +1,18 @@
+import datetime
+import os
 import re
+import tempfile
 import warnings
 from io import StringIO
 
 from django.core import management
+from django.core.management.base import CommandError
 from django.test import TestCase
+from django.utils import timezone
 
 from wagtail.images import get_image_model
+from wagtail.images.models import PendingRendition
+from wagtail.models import Collection
 
 from .utils import Image, get_test_image_file
 
@@ -88,3 +95,113 @@ class TestUpdateImageRenditions(TestCase):
         renditions_now = get_image_model().get_rendition_model().objects.all()
         total_renditions_now = len(renditions_now)
         self.assertEqual(total_renditions_now, 0)
+
+    def test_image_renditions_are_regenerated(self):
+        self.run_command()
+
+        rendition = Image.get_rendition_model().objects.get()
+        self.assertNotEqual(rendition.pk, self.rendition.pk)
+        self.assertEqual(rendition.filter_spec, "original")
+        # The new rendition is generated from the original image
+        self.assertEqual(rendition.width, 640)
+
+    def test_image_renditions_with_filter_spec(self):
+        other_rendition = self.image.get_rendition("width-100")
+
+        output = self.run_command(filter_specs=["width-100"])
+        self.assertIn("Successfully regenerated 1 image rendition(s)", output.read())
+
+        renditions = Image.get_rendition_model().objects.all()
+        self.assertIn(self.rendition, renditions)
+        self.assertNotIn(other_rendition, renditions)
+        self.assertTrue(renditions.filter(filter_spec="width-100").exists())
+
+    def test_image_renditions_with_collection(self):
+        collection = Collection.get_first_root_node().add_child(name="Other")
+        other_image = Image.objects.create(
+            title="Other image", file=get_test_image_file(), collection=collection
+        )
+        other_rendition = other_image.get_rendition("width-100")
+
+        output = self.run_command(collection=collection.id)
+        self.assertIn("Successfully regenerated 1 image rendition(s)", output.read())
+
+        renditions = Image.get_rendition_model().objects.all()
+        self.assertIn(self.rendition, renditions)
+        self.assertNotIn(other_rendition, renditions)
+
+    def test_image_renditions_with_since(self):
+        Image.objects.filter(pk=self.image.pk).update(
+            created_at=timezone.now() - datetime.timedelta(days=10)
+        )
+        since = (timezone.now() - datetime.timedelta(days=1)).date().isoformat()
+
+        output = self.run_command(since=since)
+        self.assertEqual(output.read(), "No image renditions found.\n")
+
+    def test_image_renditions_with_invalid_since(self):
+        with self.assertRaises(CommandError):
+            self.run_command(since="yesterday")
+
+    def test_image_renditions_with_checkpoint(self):
+        other_image = Image.objects.create(
+            title="Other image", file=get_test_image_file()
+        )
+        other_rendition = other_image.get_rendition("width-100")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint = os.path.join(tmpdir, "checkpoint")
+            with open(checkpoint, "w") as f:
+                f.write(str(self.image.pk))
+
+            output = self.run_command(checkpoint=checkpoint, chunk_size=1)
+            self.assertIn(
+                "Successfully regenerated 1 image rendition(s)", output.read()
+            )
+
+            with open(checkpoint) as f:
+                self.assertEqual(f.read(), str(other_image.pk))
+
+        renditions = Image.get_rendition_model().objects.all()
+        self.assertIn(self.rendition, renditions)
+        self.assertNotIn(other_rendition, renditions)
+
+
+class TestGeneratePendingRenditions(TestCase):
+    def setUp(self):
+        self.image = Image.objects.create(
+            title="Test image",
+            file=get_test_image_file(filename="test_image.png"),
+        )
+
+    def run_command(self, **options):
+        output = StringIO()
+        management.call_command(
+            "wagtail_generate_pending_renditions", stdout=output, **options
+        )
+        output.seek(0)
+
+        return output
+
+    def test_generates_pending_renditions(self):
+        self.image.get_rendition("width-100", defer=True)
+        self.image.get_rendition("height-50", defer=True)
+        self.assertEqual(PendingRendition.objects.count(), 2)
+        self.assertFalse(self.image.renditions.exists())
+
+        output = self.run_command(batch_size=1)
+        self.assertIn("Successfully generated 2 image rendition(s)", output.read())
+
+        self.assertFalse(PendingRendition.objects.exists())
+        self.assertEqual(
+            set(self.image.renditions.values_list("filter_spec", flat=True)),
+            {"width-100", "height-50"},
+        )
+
+    def test_skips_deleted_images(self):
+        self.image.get_rendition("width-100", defer=True)
+        self.image.delete()
+
+        output = self.run_command()
+        self.assertIn("Successfully generated 0 image rendition(s)", output.read())
+        self.assertFalse(PendingRendition.objects.exists())
@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 from django.contrib.auth.models import Group, Permission
 from django.core.cache import caches
@@ -12,8 +13,15 @@ from django.test.utils import override_settings
 from django.urls import reverse
 from willow.image import Image as WillowImage
 
-from wagtail.images.models import Rendition, SourceImageIOError, get_rendition_storage
+from wagtail.images.models import (
+    Filter,
+    PendingRendition,
+    Rendition,
+    SourceImageIOError,
+    get_rendition_storage,
+)
 from wagtail.images.rect import Rect
+from wagtail.images.views.serve import generate_image_url
 from wagtail.models import Collection, GroupCollectionPermission, Page, ReferenceIndex
 from wagtail.test.testapp.models import (
     EventPage,
@@ -22,7 +30,7 @@ from wagtail.test.testapp.models import (
 )
 from wagtail.test.utils import WagtailTestUtils
 
-from .utils import Image, get_test_image_file
+from .utils import Image, get_test_image_file, get_test_image_file_jpeg
 
 
 class CustomStorage(Storage):
@@ -521,6 +529,240 @@ class TestPrefetchRenditions(TestCase):
         self.assertListEqual(self.large_renditions, large_renditions)
 
 
+class TestGetRenditions(TestCase):
+    def setUp(self):
+        self.image = Image.objects.create(
+            title="Test image",
+            file=get_test_image_file(),
+        )
+        self.other_image = Image.objects.create(
+            title="Other test image",
+            file=get_test_image_file(),
+        )
+
+    def test_get_renditions(self):
+        renditions = self.image.get_renditions("width-400", "max-100x100")
+
+        self.assertEqual(list(renditions.keys()), ["width-400", "max-100x100"])
+        self.assertEqual(renditions["width-400"].width, 400)
+        self.assertEqual(renditions["max-100x100"].width, 100)
+        self.assertEqual(renditions["width-400"], self.image.get_rendition("width-400"))
+        self.assertEqual(self.image.renditions.count(), 2)
+
+    def test_get_renditions_with_filter_instances(self):
+        renditions = self.image.get_renditions(Filter("width-400"), "width-400")
+        self.assertEqual(list(renditions.keys()), ["width-400"])
+
+    def test_existing_renditions_found_with_one_query(self):
+        existing = self.image.get_rendition("width-400")
+        image = Image.objects.get(pk=self.image.pk)
+
+        with self.assertNumQueries(1):
+            renditions = image.get_renditions("width-400")
+        self.assertEqual(renditions["width-400"], existing)
+
+    def test_missing_renditions_created_in_bulk(self):
+        existing = self.image.get_rendition("width-400")
+        image = Image.objects.get(pk=self.image.pk)
+
+        # One query to find existing renditions, then a single insert (wrapped in a
+        # savepoint) for all of the missing ones
+        with self.assertNumQueries(4):
+            renditions = image.get_renditions(
+                "width-400", "max-100x100", "fill-50x50", "original"
+            )
+
+        self.assertEqual(renditions["width-400"], existing)
+        self.assertEqual(renditions["fill-50x50"].width, 50)
+        self.assertEqual(image.renditions.count(), 4)
+        for rendition in renditions.values():
+            self.assertIsNotNone(rendition.pk)
+
+    def test_renditions_reused_by_get_rendition(self):
+        self.image.get_renditions("width-400", "max-100x100")
+
+        with self.assertNumQueries(0):
+            rendition = self.image.get_rendition("max-100x100")
+        self.assertEqual(rendition.width, 100)
+
+    def test_get_rendition_after_get_renditions_for_other_filter(self):
+        existing = self.image.get_rendition("max-100x100")
+        image = Image.objects.get(pk=self.image.pk)
+        Image.get_renditions_for_images([image], "width-400")
+
+        # Renditions of other filters are still looked up, not regenerated
+        with override_settings(WAGTAILIMAGES_DEFER_RENDITIONS=True):
+            rendition = image.get_rendition("max-100x100")
+        self.assertEqual(rendition, existing)
+        self.assertEqual(image.renditions.count(), 2)
+
+    def test_get_renditions_for_images(self):
+        self.image.get_rendition("width-400")
+        images = list(Image.objects.filter(pk__in=[self.image.pk, self.other_image.pk]))
+
+        renditions = Image.get_renditions_for_images(images, "width-400", "max-100x100")
+
+        self.assertEqual(set(renditions.keys()), {self.image.pk, self.other_image.pk})
+        for image in images:
+            self.assertEqual(
+                set(renditions[image.pk].keys()), {"width-400", "max-100x100"}
+            )
+            with self.assertNumQueries(0):
+                image.get_rendition("width-400")
+        self.assertEqual(Rendition.objects.count(), 4)
+
+    def test_get_renditions_for_images_with_cache(self):
+        self.image.get_rendition("width-400")
+        renditions_cache = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "renditions": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "test-get-renditions",
+            },
+        }
+        with self.settings(CACHES=renditions_cache):
+            caches["renditions"].clear()
+            Image.get_renditions_for_images(
+                Image.objects.filter(pk__in=[self.image.pk, self.other_image.pk]),
+                "width-400",
+            )
+
+            images = list(
+                Image.objects.filter(pk__in=[self.image.pk, self.other_image.pk])
+            )
+            with self.assertNumQueries(0):
+                renditions = Image.get_renditions_for_images(images, "width-400")
+            self.assertEqual(len(renditions), 2)
+
+    def test_get_renditions_for_images_with_missing_file(self):
+        other_image = Image.objects.get(pk=self.other_image.pk)
+        other_image.file.storage.delete(other_image.file.name)
+
+        renditions = Image.get_renditions_for_images(
+            [self.image, other_image], "width-400"
+        )
+        self.assertEqual(list(renditions.keys()), [self.image.pk])
+
+        with self.assertRaises(SourceImageIOError):
+            other_image.get_renditions("width-400")
+
+    def test_get_renditions_for_images_decodes_each_image_once(self):
+        images = [self.image, self.other_image]
+        with mock.patch.object(
+            Image, "get_willow_image", autospec=True, side_effect=Image.get_willow_image
+        ) as get_willow_image:
+            Image.get_renditions_for_images(
+                images, "width-400", "max-100x100", "fill-50x50"
+            )
+        self.assertEqual(get_willow_image.call_count, 2)
+        self.assertEqual(Rendition.objects.count(), 6)
+
+
+class TestDeferRendition(TestCase):
+    def setUp(self):
+        self.image = Image.objects.create(
+            title="Test image",
+            file=get_test_image_file(),
+        )
+
+    def test_defer_rendition(self):
+        rendition = self.image.get_rendition("width-400", defer=True)
+
+        self.assertTrue(rendition.is_placeholder)
+        self.assertIsNone(rendition.pk)
+        self.assertEqual((rendition.width, rendition.height), (400, 300))
+        self.assertEqual(
+            rendition.url,
+            generate_image_url(self.image, "width-400"),
+        )
+        self.assertFalse(self.image.renditions.exists())
+        self.assertEqual(
+            list(PendingRendition.objects.values_list("image_id", "filter_spec")),
+            [(self.image.pk, "width-400")],
+        )
+
+    def test_defer_rendition_twice_queues_once(self):
+        self.image.get_rendition("width-400", defer=True)
+        self.image.get_rendition("width-400", defer=True)
+        self.assertEqual(PendingRendition.objects.count(), 1)
+
+    def test_existing_rendition_not_deferred(self):
+        existing = self.image.get_rendition("width-400")
+        rendition = self.image.get_rendition("width-400", defer=True)
+
+        self.assertFalse(rendition.is_placeholder)
+        self.assertEqual(rendition, existing)
+        self.assertFalse(PendingRendition.objects.exists())
+
+    @override_settings(WAGTAILIMAGES_DEFER_RENDITIONS=True)
+    def test_defer_setting(self):
+        rendition = self.image.get_rendition("width-400")
+        self.assertTrue(rendition.is_placeholder)
+
+        rendition = self.image.get_rendition("width-400", defer=False)
+        self.assertFalse(rendition.is_placeholder)
+        self.assertTrue(self.image.renditions.exists())
+
+    def test_serve_view_generates_deferred_rendition(self):
+        rendition = self.image.get_rendition("width-400", defer=True)
+
+        response = self.client.get(rendition.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(self.image.renditions.filter(filter_spec="width-400").exists())
+
+
+class TestRenditionSource(TestCase):
+    def setUp(self):
+        self.image = Image.objects.create(
+            title="Test image",
+            file=get_test_image_file_jpeg(size=(2000, 1000)),
+        )
+
+    def test_jpeg_reduced_on_decode(self):
+        filters = [Filter(spec="max-400x400"), Filter(spec="fill-100x100")]
+        with self.image.open_rendition_source(filters) as source:
+            self.assertEqual(source.size, (2000, 1000))
+            # Decoded at the smallest JPEG scale that still covers both renditions
+            self.assertEqual(source.scale, 0.25)
+            self.assertEqual(source.willow.get_size(), (500, 250))
+
+            for filter, size in zip(filters, [(400, 200), (100, 100)]):
+                rendition_file = self.image.generate_rendition_file(
+                    filter, source=source
+                )
+                self.assertEqual(WillowImage.open(rendition_file).get_size(), size)
+
+    def test_not_reduced_when_full_size_needed(self):
+        filters = [Filter(spec="max-400x400"), Filter(spec="fill-1500x800")]
+        with self.image.open_rendition_source(filters) as source:
+            self.assertEqual(source.scale, 1)
+            self.assertEqual(source.willow.get_size(), (2000, 1000))
+
+    def test_crop_scaled_to_reduced_source(self):
+        self.image.focal_point_x = 1800
+        self.image.focal_point_y = 500
+        self.image.focal_point_width = 100
+        self.image.focal_point_height = 100
+        filter = Filter(spec="fill-100x100-c100")
+
+        expected = WillowImage.open(
+            self.image.generate_rendition_file(filter)
+        ).get_size()
+        with self.image.open_rendition_source([filter]) as source:
+            rendition_file = self.image.generate_rendition_file(filter, source=source)
+        self.assertEqual(WillowImage.open(rendition_file).get_size(), expected)
+
+    def test_filter_run_without_source_argument(self):
+        class CustomFilter(Filter):
+            def run(self, image, output):
+                return super().run(image, output)
+
+        filter = CustomFilter(spec="max-400x400")
+        with self.image.open_rendition_source([filter]) as source:
+            rendition_file = self.image.generate_rendition_file(filter, source=source)
+        self.assertEqual(WillowImage.open(rendition_file).get_size(), (400, 200))
+
+
 class TestUsageCount(TestCase):
     fixtures = ["test.json"]
 
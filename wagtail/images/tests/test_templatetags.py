@@ -1,4 +1,4 @@
-from django.template import Variable
+from django.template import Context, Template, Variable
 from django.test import TestCase
 
 from wagtail.images.models import Image, Rendition
@@ -103,3 +103,20 @@ class ImageNodeTestCase(TestCase):
                 self.assertEqual(
                     node.get_filter(preserve_svg=image.is_svg()).spec, expected
                 )
+
+    def test_render_uses_renditions_fetched_in_bulk(self):
+        images = list(Image.objects.filter(pk=self.image.pk))
+        Image.get_renditions_for_images(
+            images, "width-400", "fill-100x100|jpegquality-40"
+        )
+
+        template = Template(
+            "{% load wagtailimages_tags %}{% for image in images %}"
+            "{% image image width-400 %}{% image image fill-100x100 jpegquality-40 %}"
+            "{% endfor %}"
+        )
+        with self.assertNumQueries(0):
+            rendered = template.render(Context({"images": images}))
+
+        self.assertIn('width="400"', rendered)
+        self.assertIn('width="100"', rendered)
@@ -47,9 +47,10 @@ class ServeView(View):
 
         image = get_object_or_404(self.model, id=image_id)
 
-        # Get/generate the rendition
+        # Get/generate the rendition. This view is where deferred renditions are
+        # served from, so always generate them here
         try:
-            rendition = image.get_rendition(filter_spec)
+            rendition = image.get_rendition(filter_spec, defer=False)
         except SourceImageIOError:
             return HttpResponse(
                 "Source image file not found", content_type="text/plain", status=410
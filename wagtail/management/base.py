@@ -0,0 +1,68 @@
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+
+DEFAULT_INTERVAL = 5
+
+
+class QueueProcessingCommand(BaseCommand):
+    """
+    Base class for management commands that work through a queue in batches, until it
+    is empty or, with the ``--loop`` option, indefinitely, waiting ``--interval``
+    seconds whenever the queue is empty.
+
+    Subclasses implement ``process_batch()``, which is passed the command's options,
+    processes up to ``batch_size`` queue entries and returns a dict of statistics,
+    including the number of ``entries`` processed (zero once the queue is empty). The
+    statistics of all batches are added up and passed to ``get_summary()``, whose
+    result is output when the command finishes.
+    """
+
+    # The default for the --batch-size option. If None, the option isn't available
+    default_batch_size = None
+
+    # Describes the queue entries in the help of the options, e.g. "objects"
+    queued_items_name = "items"
+
+    def add_arguments(self, parser):
+        if self.default_batch_size is not None:
+            parser.add_argument(
+                "--batch-size",
+                type=int,
+                default=self.default_batch_size,
+                help="Number of queued %s to process at a time (default: %d)"
+                % (self.queued_items_name, self.default_batch_size),
+            )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, checking the queue for new %s" % self.queued_items_name,
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=DEFAULT_INTERVAL,
+            help="Number of seconds to wait between checks of an empty queue when running with --loop (default: %d)"
+            % DEFAULT_INTERVAL,
+        )
+
+    def process_batch(self, **options):
+        raise NotImplementedError
+
+    def get_summary(self, totals):
+        raise NotImplementedError
+
+    def handle(self, *args, **options):
+        totals = Counter()
+        while True:
+            stats = self.process_batch(**options)
+            totals.update(stats)
+
+            if not stats["entries"]:
+                if not options["loop"]:
+                    break
+                time.sleep(options["interval"])
+
+        if options["verbosity"] > 0:
+            self.stdout.write(self.style.SUCCESS(self.get_summary(totals)))
@@ -0,0 +1,65 @@
+from collections import defaultdict
+
+from django.db import transaction
+
+from wagtail.management.base import QueueProcessingCommand
+from wagtail.models import PendingReferenceIndexUpdate, ReferenceIndex
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class Command(QueueProcessingCommand):
+    help = "Update the reference index for objects queued with WAGTAIL_REFERENCE_INDEX_UPDATE_MODE set to 'queue'."
+
+    default_batch_size = DEFAULT_BATCH_SIZE
+    queued_items_name = "objects"
+
+    def process_batch(self, batch_size, **options):
+        pending = list(
+            PendingReferenceIndexUpdate.objects.select_related("content_type").order_by(
+                "created_at", "id"
+            )[:batch_size]
+        )
+
+        if not pending:
+            return {"entries": 0}
+
+        with transaction.atomic():
+            # Remove the entries in the same transaction as the update, so that they
+            # are kept if it fails. Objects saved again while the update is running
+            # will be queued again, as only their latest state matters
+            PendingReferenceIndexUpdate.objects.filter(
+                id__in=[item.id for item in pending]
+            ).delete()
+
+            object_ids_by_content_type = defaultdict(list)
+            for item in pending:
+                object_ids_by_content_type[item.content_type].append(item.object_id)
+
+            for content_type, object_ids in object_ids_by_content_type.items():
+                self.update_objects(content_type, object_ids)
+
+        return {"entries": len(pending)}
+
+    def get_summary(self, totals):
+        return "Updated %(entries)d object(s) in the reference index" % totals
+
+    def update_objects(self, content_type, object_ids):
+        model = content_type.model_class()
+        if model is None:
+            # The model has been removed since the objects were queued
+            return
+
+        objects = list(model._default_manager.filter(pk__in=object_ids))
+        ReferenceIndex.create_or_update_for_objects(objects)
+
+        # Objects that have been deleted since they were queued have no references
+        existing_object_ids = {str(object.pk) for object in objects}
+        ReferenceIndex.objects.filter(
+            base_content_type=ReferenceIndex._get_base_content_type(model),
+            object_id__in=[
+                object_id
+                for object_id in object_ids
+                if object_id not in existing_object_ids
+            ],
+        ).delete()
@@ -1,12 +1,37 @@
+from concurrent.futures import ProcessPoolExecutor
+
 from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
+from wagtail.management.utils import init_worker, map_in_workers, pk_ranges
 from wagtail.models import ReferenceIndex
 
 DEFAULT_CHUNK_SIZE = 1000
 
 
+def index_pk_range(model, first_pk, last_pk):
+    """
+    Create or update the references of the objects of the model with primary keys
+    between first_pk and last_pk (inclusive), and return the number of objects.
+    """
+    with transaction.atomic():
+        objects = list(
+            model.objects.filter(pk__gte=first_pk, pk__lte=last_pk).order_by("pk")
+        )
+        ReferenceIndex.create_or_update_for_objects(objects)
+    return len(objects)
+
+
+def index_pk_range_in_worker(model_label, first_pk, last_pk):
+    """
+    As index_pk_range, but identifying the model by its label so that it can be run
+    in a worker process.
+    """
+    return index_pk_range(apps.get_model(model_label), first_pk, last_pk)
+
+
 class Command(BaseCommand):
     def write(self, *args, **kwargs):
         """
@@ -26,38 +51,109 @@ class Command(BaseCommand):
             type=int,
             help="Set number of records to be fetched at once for inserting into the index",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of worker processes to extract references with (default: 1)",
+        )
 
     def handle(self, **options):
         self.verbosity = options["verbosity"]
 
         chunk_size = options.get("chunk_size")
+        workers = options["workers"]
         object_count = 0
 
         self.write("Rebuilding reference index")
 
-        with transaction.atomic():
-            ReferenceIndex.objects.all().delete()
+        executor = None
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=init_worker)
 
+        try:
             for model in apps.get_models():
                 if not ReferenceIndex.model_is_indexable(model):
                     continue
 
                 self.write(str(model))
 
-                # Add items (chunk_size at a time)
-                for chunk in self.print_iter_progress(
-                    self.queryset_chunks(model.objects.all().order_by("pk"), chunk_size)
-                ):
-                    for instance in chunk:
-                        ReferenceIndex.create_or_update_for_object(instance)
-
-                    object_count += len(chunk)
+                # Each chunk of objects is compared with the existing records and
+                # committed in its own transaction, so that an interrupted rebuild
+                # keeps the chunks that have been completed
+                ranges = pk_ranges(model.objects.all(), chunk_size)
+                if executor is not None:
+                    results = map_in_workers(
+                        executor,
+                        index_pk_range_in_worker,
+                        [model._meta.label] * len(ranges),
+                        [first for first, last in ranges],
+                        [last for first, last in ranges],
+                    )
+                else:
+                    results = (
+                        index_pk_range(model, first, last) for first, last in ranges
+                    )
+
+                for count in self.print_iter_progress(results):
+                    object_count += count
 
                 self.print_newline()
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.remove_stale_references(chunk_size)
 
         self.write("Indexed %d objects" % object_count)
         self.print_newline()
 
+    def remove_stale_references(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Delete the records of objects that no longer exist, and of models that are no
+        longer indexed.
+        """
+        for content_type_id in (
+            ReferenceIndex.objects.order_by()
+            .values_list("content_type_id", flat=True)
+            .distinct()
+        ):
+            model = ContentType.objects.get_for_id(content_type_id).model_class()
+            if model is None or not ReferenceIndex.model_is_indexable(model):
+                ReferenceIndex.objects.filter(content_type_id=content_type_id).delete()
+
+        for base_content_type_id in (
+            ReferenceIndex.objects.order_by()
+            .values_list("base_content_type_id", flat=True)
+            .distinct()
+        ):
+            model = ContentType.objects.get_for_id(base_content_type_id).model_class()
+            references = ReferenceIndex.objects.filter(
+                base_content_type_id=base_content_type_id
+            )
+            if model is None:
+                references.delete()
+                continue
+
+            object_ids = list(
+                references.order_by().values_list("object_id", flat=True).distinct()
+            )
+            for i in range(0, len(object_ids), chunk_size):
+                chunk = object_ids[i : i + chunk_size]
+                existing_object_ids = {
+                    str(pk)
+                    for pk in model._default_manager.filter(pk__in=chunk).values_list(
+                        "pk", flat=True
+                    )
+                }
+                references.filter(
+                    object_id__in=[
+                        object_id
+                        for object_id in chunk
+                        if object_id not in existing_object_ids
+                    ]
+                ).delete()
+
     def print_newline(self):
         self.write("")
 
@@ -83,20 +179,3 @@ class Command(BaseCommand):
                 self.write(" ", ending="")
 
             self.stdout.flush()
-
-    # Atomic so the count of models doesn't change as it is iterated
-    @transaction.atomic
-    def queryset_chunks(self, qs, chunk_size=DEFAULT_CHUNK_SIZE):
-        """
-        Yield a queryset in chunks of at most ``chunk_size``. The chunk yielded
-        will be a list, not a queryset. Iterating over the chunks is done in a
-        transaction so that the order and count of items in the queryset
-        remains stable.
-        """
-        i = 0
-        while True:
-            items = list(qs[i * chunk_size :][:chunk_size])
-            if not items:
-                break
-            yield items
-            i += 1
@@ -0,0 +1,69 @@
+"""
+Helpers shared by the management commands that process objects in chunks, optionally in
+worker processes.
+"""
+import datetime
+
+from django.conf import settings
+from django.core.management.base import CommandError
+from django.db import connections
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+
+def init_worker():
+    """
+    Initializer for the worker processes of a ProcessPoolExecutor, for use with
+    map_in_workers.
+    """
+    # Worker processes started with the "spawn" method (rather than forked from
+    # the command) need to set up Django themselves
+    import django
+
+    django.setup()
+
+    # Forked workers inherit the command's connection objects. Discard them rather
+    # than closing them, which would also end the command's database sessions
+    for connection in connections.all():
+        connection.connection = None
+
+
+def map_in_workers(executor, fn, *iterables):
+    """
+    Call executor.map, having closed the database connections first, as worker
+    processes are forked as tasks are submitted and connections can't be shared with
+    them. The connections are opened again by the next query.
+    """
+    connections.close_all()
+    return executor.map(fn, *iterables)
+
+
+def pk_ranges(queryset, chunk_size):
+    """
+    Return a list of (first_pk, last_pk) tuples, splitting the primary keys of the
+    queryset into ranges of up to chunk_size objects.
+    """
+    pks = list(queryset.order_by("pk").values_list("pk", flat=True))
+    return [
+        (pks[i], pks[min(i + chunk_size, len(pks)) - 1])
+        for i in range(0, len(pks), chunk_size)
+    ]
+
+
+def parse_since(value):
+    """
+    Parse the value of a --since option, which is an ISO 8601 date or datetime, into
+    a datetime (timezone-aware if USE_TZ is enabled). Raises CommandError if it is
+    not valid.
+    """
+    since = parse_datetime(value)
+    if since is None:
+        date = parse_date(value)
+        if date is None:
+            raise CommandError(
+                "Invalid --since value '%s'. Use the YYYY-MM-DD format." % value
+            )
+        since = datetime.datetime.combine(date, datetime.time())
+    if settings.USE_TZ and timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return since
@@ -11,6 +11,7 @@ as Page.
 
 import functools
 import logging
+import posixpath
 import uuid
 import warnings
 from io import StringIO
@@ -118,7 +119,7 @@ from .i18n import (  # noqa
     bootstrap_translatable_model,
     get_translatable_models,
 )
-from .reference_index import ReferenceIndex  # noqa
+from .reference_index import PendingReferenceIndexUpdate, ReferenceIndex  # noqa
 from .sites import Site, SiteManager, SiteRootPath  # noqa
 from .view_restrictions import BaseViewRestriction
 
@@ -3010,6 +3011,111 @@ class GroupPagePermission(models.Model):
         )
 
 
+class PagePermissionLookup:
+    """
+    The page permissions that a user has through their groups, compiled into a mapping
+    of page paths to the permission types granted on that page (and its descendants).
+    The permissions for any page can then be found from the prefixes of its path,
+    without querying the database.
+    """
+
+    def __init__(self, permissions):
+        """
+        permissions is an iterable of (page path, permission type) tuples.
+        """
+        self.permissions_by_path = {}
+        for path, permission_type in permissions:
+            self.permissions_by_path.setdefault(path, set()).add(permission_type)
+
+        self.permission_types = set().union(*self.permissions_by_path.values())
+
+    def get_permissions(self, path):
+        """
+        Return the set of permission types that apply to the page with the given path.
+        """
+        permissions = set()
+        for length in range(Page.steplen, len(path) + 1, Page.steplen):
+            permissions.update(self.permissions_by_path.get(path[:length], ()))
+        return permissions
+
+    def get_root_paths(self, *permission_types):
+        """
+        Return the paths of the pages that have any of the given permission types,
+        leaving out the pages that are within another one of these pages, as
+        they are already covered by it.
+        """
+        root_paths = []
+        for path in sorted(
+            path
+            for path, permissions in self.permissions_by_path.items()
+            if permissions.intersection(permission_types)
+        ):
+            # Descendants are sorted straight after their ancestor
+            if not root_paths or not path.startswith(root_paths[-1]):
+                root_paths.append(path)
+        return root_paths
+
+    def get_ancestor_paths(self):
+        """
+        Return the paths of all the ancestors of the pages that have any permissions.
+        """
+        return {
+            path[:length]
+            for path in self.permissions_by_path
+            for length in range(Page.steplen, len(path), Page.steplen)
+        }
+
+    def get_common_ancestor_path(self):
+        """
+        Return the path of the first common ancestor of the pages that have any
+        permissions (as ``PageQuerySet.first_common_ancestor`` would find), or an empty
+        string if there isn't one.
+        """
+        path = posixpath.commonprefix(
+            [path[: -Page.steplen] for path in self.permissions_by_path]
+        )
+        return path[: len(path) - len(path) % Page.steplen]
+
+
+# Changed whenever page permissions are changed, so that the lookups stored on user
+# objects by get_page_permission_lookup are rebuilt
+_page_permissions_version = 0
+
+
+def clear_page_permission_lookups():
+    global _page_permissions_version
+    _page_permissions_version += 1
+
+
+def get_page_permission_lookup(user):
+    """
+    Return the PagePermissionLookup for the given (active, non-superuser) user. This is
+    stored on the user object, which is shared by everything handling the same request.
+    """
+    version, lookup = getattr(user, "_wagtail_page_permission_lookup", (None, None))
+    if version != _page_permissions_version:
+        version = _page_permissions_version
+        lookup = PagePermissionLookup(
+            GroupPagePermission.objects.filter(group__user=user).values_list(
+                "page__path", "permission_type"
+            )
+        )
+        user._wagtail_page_permission_lookup = (version, lookup)
+    return lookup
+
+
+def get_paths_filter(paths, **kwargs):
+    """
+    Return a Q object matching the pages within any of the pages with the given paths,
+    with any extra filters given as keyword arguments, or None if there are no paths.
+    """
+    path_filter = None
+    for path in paths:
+        q = Q(path__startswith=path, **kwargs)
+        path_filter = q if path_filter is None else path_filter | q
+    return path_filter
+
+
 class UserPagePermissionsProxy:
     """Helper object that encapsulates all the page permission rules that this user has
     across the page hierarchy."""
@@ -3022,6 +3128,10 @@ class UserPagePermissionsProxy:
                 group__user=self.user
             ).select_related("page")
 
+    @property
+    def lookup(self):
+        return get_page_permission_lookup(self.user)
+
     def revisions_for_moderation(self):
         """Return a queryset of page revisions awaiting moderation that this user has publish permission on"""
 
@@ -3031,21 +3141,12 @@ class UserPagePermissionsProxy:
         if self.user.is_superuser:
             return Revision.page_revisions.submitted()
 
-        # get the list of pages for which they have direct publish permission
-        # (i.e. they can publish any page within this subtree)
-        publishable_pages_paths = (
-            self.permissions.filter(permission_type="publish")
-            .values_list("page__path", flat=True)
-            .distinct()
-        )
-        if not publishable_pages_paths:
-            return Revision.objects.none()
-
         # compile a filter expression to apply to the Revision.page_revisions.submitted() queryset:
-        # return only those pages whose paths start with one of the publishable_pages paths
-        only_my_sections = Q(path__startswith=publishable_pages_paths[0])
-        for page_path in publishable_pages_paths[1:]:
-            only_my_sections = only_my_sections | Q(path__startswith=page_path)
+        # return only those pages within the pages that they have direct publish
+        # permission on (i.e. they can publish any page within this subtree)
+        only_my_sections = get_paths_filter(self.lookup.get_root_paths("publish"))
+        if only_my_sections is None:
+            return Revision.objects.none()
 
         # return the filtered queryset
         return Revision.page_revisions.submitted().filter(
@@ -3070,32 +3171,33 @@ class UserPagePermissionsProxy:
         if self.user.is_superuser:
             return Page.objects.all()
 
-        explorable_pages = Page.objects.none()
-
-        # Creates a union queryset of all objects the user has access to add,
-        # edit and publish
-        for perm in self.permissions.filter(
-            Q(permission_type="add")
-            | Q(permission_type="edit")
-            | Q(permission_type="publish")
-            | Q(permission_type="lock")
-        ):
-            explorable_pages |= Page.objects.descendant_of(perm.page, inclusive=True)
+        # All pages within the pages that the user has access to add, edit and publish
+        explorable_pages = get_paths_filter(
+            self.lookup.get_root_paths("add", "edit", "publish", "lock")
+        )
 
         # For all pages with specific permissions, add their ancestors as
         # explorable. This will allow deeply nested pages to be accessed in the
         # explorer. For example, in the hierarchy A>B>C>D where the user has
         # 'edit' access on D, they will be able to navigate to D without having
         # explicit access to A, B or C.
-        page_permissions = Page.objects.filter(group_permissions__in=self.permissions)
-        for page in page_permissions:
-            explorable_pages |= page.get_ancestors()
+        ancestor_paths = self.lookup.get_ancestor_paths()
+        if ancestor_paths:
+            ancestor_pages = Q(path__in=ancestor_paths)
+            if explorable_pages is None:
+                explorable_pages = ancestor_pages
+            else:
+                explorable_pages |= ancestor_pages
+
+        if explorable_pages is None:
+            return Page.objects.none()
 
         # Remove unnecessary top-level ancestors that the user has no access to
-        fca_page = page_permissions.first_common_ancestor()
-        explorable_pages = explorable_pages.filter(path__startswith=fca_page.path)
+        fca_path = self.lookup.get_common_ancestor_path()
+        if fca_path:
+            explorable_pages &= Q(path__startswith=fca_path)
 
-        return explorable_pages
+        return Page.objects.filter(explorable_pages)
 
     def editable_pages(self):
         """Return a queryset of the pages that this user has permission to edit"""
@@ -3105,21 +3207,31 @@ class UserPagePermissionsProxy:
         if self.user.is_superuser:
             return Page.objects.all()
 
-        editable_pages = Page.objects.none()
-
-        for perm in self.permissions.filter(permission_type="add"):
-            # user has edit permission on any subpage of perm.page
-            # (including perm.page itself) that is owned by them
-            editable_pages |= Page.objects.descendant_of(
-                perm.page, inclusive=True
-            ).filter(owner=self.user)
-
-        for perm in self.permissions.filter(permission_type="edit"):
-            # user has edit permission on any subpage of perm.page
-            # (including perm.page itself) regardless of owner
-            editable_pages |= Page.objects.descendant_of(perm.page, inclusive=True)
+        # user has edit permission on any subpage of a page with edit permission
+        # (including the page itself) regardless of owner
+        edit_root_paths = self.lookup.get_root_paths("edit")
+        editable_pages = get_paths_filter(edit_root_paths)
+
+        # user has edit permission on any subpage of a page with add permission
+        # (including the page itself) that is owned by them, unless that's already
+        # covered by edit permission
+        owned_pages = get_paths_filter(
+            [
+                path
+                for path in self.lookup.get_root_paths("add")
+                if not path.startswith(tuple(edit_root_paths))
+            ],
+            owner=self.user,
+        )
 
-        return editable_pages
+        if editable_pages is None and owned_pages is None:
+            return Page.objects.none()
+        elif owned_pages is None:
+            return Page.objects.filter(editable_pages)
+        elif editable_pages is None:
+            return Page.objects.filter(owned_pages)
+        else:
+            return Page.objects.filter(editable_pages | owned_pages)
 
     def can_edit_pages(self):
         """Return True if the user has permission to edit any pages"""
@@ -3133,14 +3245,13 @@ class UserPagePermissionsProxy:
         if self.user.is_superuser:
             return Page.objects.all()
 
-        publishable_pages = Page.objects.none()
-
-        for perm in self.permissions.filter(permission_type="publish"):
-            # user has publish permission on any subpage of perm.page
-            # (including perm.page itself)
-            publishable_pages |= Page.objects.descendant_of(perm.page, inclusive=True)
+        # user has publish permission on any subpage of a page with publish permission
+        # (including the page itself)
+        publishable_pages = get_paths_filter(self.lookup.get_root_paths("publish"))
+        if publishable_pages is None:
+            return Page.objects.none()
 
-        return publishable_pages
+        return Page.objects.filter(publishable_pages)
 
     def can_publish_pages(self):
         """Return True if the user has permission to publish any pages"""
@@ -3153,7 +3264,7 @@ class UserPagePermissionsProxy:
         if not self.user.is_active:
             return False
         else:
-            return self.permissions.filter(permission_type="unlock").exists()
+            return "unlock" in self.lookup.permission_types
 
 
 class PagePermissionTester:
@@ -3164,11 +3275,7 @@ class PagePermissionTester:
         self.page_is_root = page.depth == 1  # Equivalent to page.is_root()
 
         if self.user.is_active and not self.user.is_superuser:
-            self.permissions = {
-                perm.permission_type
-                for perm in user_perms.permissions
-                if self.page.path.startswith(perm.page.path)
-            }
+            self.permissions = user_perms.lookup.get_permissions(self.page.path)
 
     def user_has_lock(self):
         return self.page.locked_by_id == self.user.pk
@@ -1,8 +1,10 @@
 import uuid
+from collections import defaultdict
 
+from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRel
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.db import models, transaction
 from django.utils.functional import cached_property
 from django.utils.text import capfirst
 from django.utils.translation import gettext_lazy as _
@@ -367,87 +369,172 @@ class ReferenceIndex(models.Model):
         Args:
             object (Model): The model instance to create/update ReferenceIndex records for
         """
+        cls.create_or_update_for_objects([object])
+
+    @classmethod
+    def create_or_update_for_objects(cls, objects):
+        """
+        Creates or updates ReferenceIndex records for the given objects.
+
+        This works the same way as `create_or_update_for_object`, but finds the existing
+        records for all of the objects in one query per base content type, and makes a
+        single insert and a single delete for the whole list.
+
+        Note: This method must be called within a `django.db.transaction.atomic()` block.
+
+        Args:
+            objects (list): The model instances to create/update ReferenceIndex records for
+        """
         # For the purpose of this method, a "reference record" is a tuple of
         # (to_content_type_id, to_object_id, model_path, content_path) - the properties that
         # uniquely define a reference
 
-        # Extract new references and construct a set of reference records
-        references = set(cls._extract_references_from_object(object))
-
-        # Find content types for this model and all of its ancestor classes,
-        # ordered from most to least specific
-        content_types = [
-            ContentType.objects.get_for_model(model_or_object, for_concrete_model=False)
-            for model_or_object in ([object] + object._meta.get_parent_list())
-        ]
-        content_type = content_types[0]
-        base_content_type = content_types[-1]
-        known_content_type_ids = [ct.id for ct in content_types]
-
-        # Find existing references in the database so we know what to add/delete.
-        # Construct a dict mapping reference records to the (content_type_id, id) pair that the
-        # existing database entry is found under
-        existing_references = {
-            (to_content_type_id, to_object_id, model_path, content_path): (
-                content_type_id,
-                id,
+        # Group the objects by base content type and primary key (as stored in object_id),
+        # along with the set of reference records extracted from each one and the content
+        # types for its model and all of its ancestor classes, ordered from most to least
+        # specific
+        objects_by_base_content_type = defaultdict(dict)
+        for object in objects:
+            references = set(cls._extract_references_from_object(object))
+            content_types = [
+                ContentType.objects.get_for_model(
+                    model_or_object, for_concrete_model=False
+                )
+                for model_or_object in ([object] + object._meta.get_parent_list())
+            ]
+            objects_by_base_content_type[content_types[-1]][str(object.pk)] = (
+                object,
+                references,
+                content_types,
             )
-            for id, content_type_id, to_content_type_id, to_object_id, model_path, content_path in cls.objects.filter(
-                base_content_type=base_content_type, object_id=object.pk
+
+        new_records = []
+        deleted_reference_ids = []
+
+        for base_content_type, objects_data in objects_by_base_content_type.items():
+            # Find existing references in the database so we know what to add/delete.
+            # Construct a dict for each object, mapping reference records to the
+            # (content_type_id, id) pair that the existing database entry is found under
+            existing_references_by_object_id = defaultdict(dict)
+            existing_records = cls.objects.filter(
+                base_content_type=base_content_type, object_id__in=objects_data.keys()
             ).values_list(
                 "id",
+                "object_id",
                 "content_type_id",
                 "to_content_type",
                 "to_object_id",
                 "model_path",
                 "content_path",
             )
-        }
-
-        # Construct the set of reference records that have been found on the object but are not
-        # already present in the database
-        new_references = references - set(existing_references.keys())
-        # Create database records for those reference records
-        cls.objects.bulk_create(
-            [
-                cls(
-                    content_type=content_type,
-                    base_content_type=base_content_type,
-                    object_id=object.pk,
-                    to_content_type_id=to_content_type_id,
-                    to_object_id=to_object_id,
-                    model_path=model_path,
-                    content_path=content_path,
-                    content_path_hash=cls._get_content_path_hash(content_path),
+            for id, object_id, content_type_id, *reference_data in existing_records:
+                # reference_data is (to_content_type_id, to_object_id, model_path, content_path)
+                existing_references_by_object_id[object_id][tuple(reference_data)] = (
+                    content_type_id,
+                    id,
                 )
-                for to_content_type_id, to_object_id, model_path, content_path in new_references
-            ]
-        )
 
-        # Delete removed references
-        deleted_reference_ids = []
-        # Look at the reference record and the supporting content_type / id for each existing
-        # reference in the database
-        for (reference_data, (content_type_id, id)) in existing_references.items():
-            if reference_data in references:
-                # Do not delete this reference, as it is still present in the new set
-                continue
-
-            if content_type_id not in known_content_type_ids:
-                # The content type for the existing record does not match the current model or any
-                # superclass. We can infer that the existing record is for a more specific subclass
-                # than the one we're currently indexing - e.g. we are indexing <Page id=123> while
-                # the existing reference was recorded against <BlogPage id=123>. In this case, do
-                # not treat the missing reference as a deletion - it likely still exists, but on a
-                # relation which can only be seen on the more specific model.
-                continue
-
-            # If we reach here, this is a legitimate deletion - add it to the list of IDs to delete
-            deleted_reference_ids.append(id)
+            for object_id, (object, references, content_types) in objects_data.items():
+                content_type = content_types[0]
+                known_content_type_ids = [ct.id for ct in content_types]
+                existing_references = existing_references_by_object_id[object_id]
+
+                # Construct database records for the reference records that have been found
+                # on the object but are not already present in the database
+                new_references = references - set(existing_references.keys())
+                new_records.extend(
+                    cls(
+                        content_type=content_type,
+                        base_content_type=base_content_type,
+                        object_id=object.pk,
+                        to_content_type_id=to_content_type_id,
+                        to_object_id=to_object_id,
+                        model_path=model_path,
+                        content_path=content_path,
+                        content_path_hash=cls._get_content_path_hash(content_path),
+                    )
+                    for to_content_type_id, to_object_id, model_path, content_path in new_references
+                )
+
+                # Look at the reference record and the supporting content_type / id for each
+                # existing reference in the database
+                for reference_data, existing_record in existing_references.items():
+                    content_type_id, id = existing_record
+                    if reference_data in references:
+                        # Do not delete this reference, as it is still present in the new set
+                        continue
+
+                    if content_type_id not in known_content_type_ids:
+                        # The content type for the existing record does not match the current model or any
+                        # superclass. We can infer that the existing record is for a more specific subclass
+                        # than the one we're currently indexing - e.g. we are indexing <Page id=123> while
+                        # the existing reference was recorded against <BlogPage id=123>. In this case, do
+                        # not treat the missing reference as a deletion - it likely still exists, but on a
+                        # relation which can only be seen on the more specific model.
+                        continue
+
+                    # If we reach here, this is a legitimate deletion - add it to the list of IDs to delete
+                    deleted_reference_ids.append(id)
+
+        # Create database records for the new references
+        cls.objects.bulk_create(new_records)
 
         # Perform the deletion
         cls.objects.filter(id__in=deleted_reference_ids).delete()
 
+    @classmethod
+    def queue_update_for_object(cls, object):
+        """
+        Records that the ReferenceIndex records for the given object need to be created or
+        updated, once the current transaction is committed. The queued objects are processed
+        by the `process_reference_index_queue` management command, which indexes each one
+        as it is at that time, so saving an object several times before then only queues it
+        once.
+
+        Args:
+            object (Model): The model instance to queue an update of the ReferenceIndex records for
+        """
+        content_type = ContentType.objects.get_for_model(
+            object, for_concrete_model=False
+        )
+        object_id = str(object.pk)
+
+        transaction.on_commit(
+            lambda: PendingReferenceIndexUpdate.objects.bulk_create(
+                [
+                    PendingReferenceIndexUpdate(
+                        content_type=content_type, object_id=object_id
+                    )
+                ],
+                ignore_conflicts=True,
+            )
+        )
+
+    @classmethod
+    def has_pending_updates(cls, object=None):
+        """
+        Returns True if there are queued objects whose ReferenceIndex records have not
+        been updated yet, in which case the index may not reflect the latest changes.
+
+        Args:
+            object (Model): If given, only queued objects that may reference this object
+                are considered - that is, objects of the types that are recorded as
+                referencing any object of the same type as this one
+        """
+        pending_updates = PendingReferenceIndexUpdate.objects.all()
+
+        if object is not None:
+            pending_updates = pending_updates.filter(
+                models.Exists(
+                    cls.objects.filter(
+                        to_content_type_id=cls._get_base_content_type(object),
+                        content_type_id=models.OuterRef("content_type_id"),
+                    )
+                )
+            )
+
+        return pending_updates.exists()
+
     @classmethod
     def remove_for_object(cls, object):
         """
@@ -643,3 +730,30 @@ class ReferenceIndex(models.Model):
 # correctly will require support for ManyToMany relations with through models:
 # https://github.com/wagtail/wagtail/issues/9629
 ItemBase.wagtail_reference_index_ignore = True
+
+
+def get_reference_index_update_mode():
+    return getattr(settings, "WAGTAIL_REFERENCE_INDEX_UPDATE_MODE", "immediate")
+
+
+class PendingReferenceIndexUpdate(models.Model):
+    """
+    An object that has been saved with `WAGTAIL_REFERENCE_INDEX_UPDATE_MODE` set to
+    `"queue"`, and is yet to have its ReferenceIndex records updated by the
+    `process_reference_index_queue` management command.
+    """
+
+    content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, related_name="+"
+    )
+    # We do not use an IntegerField since primary keys are not always integers.
+    object_id = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    wagtail_reference_index_ignore = True
+
+    class Meta:
+        unique_together = ("content_type", "object_id")
+
+    def __str__(self):
+        return "%s: %s" % (self.content_type.name, self.object_id)
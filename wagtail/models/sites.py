@@ -1,3 +1,5 @@
+import copy
+import uuid
 from collections import namedtuple
 
 from django.apps import apps
@@ -61,6 +63,108 @@ def get_site_for_hostname(hostname, port):
     raise Site.DoesNotExist()
 
 
+SITE_CACHE_VERSION_CACHE_KEY = "wagtail_site_cache_version"
+
+
+class SiteCache:
+    """
+    A process-local map of hostname / port to Site, used by ``Site.find_for_request``
+    when ``WAGTAIL_SITE_CACHE_ENABLED`` is set.
+
+    The full set of Site records is loaded once per process and requests are matched
+    against it in memory, following the same rules as ``get_site_for_hostname``. A
+    version key held in the Django cache is checked on each lookup, so that changes
+    to Site records made by any process are picked up by all of them.
+    """
+
+    def __init__(self):
+        self.version = None
+        self.sites = []
+        self.matches = {}
+
+    def get_version(self):
+        version = cache.get(SITE_CACHE_VERSION_CACHE_KEY)
+        if version is None:
+            version = uuid.uuid4().hex
+            if not cache.add(SITE_CACHE_VERSION_CACHE_KEY, version, None):
+                version = cache.get(SITE_CACHE_VERSION_CACHE_KEY, version)
+        return version
+
+    def invalidate(self):
+        cache.set(SITE_CACHE_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+        self.version = None
+
+    def load(self, version):
+        Site = apps.get_model("wagtailcore.Site")
+        self.sites = list(Site.objects.select_related("root_page"))
+        self.matches = {}
+        self.version = version
+
+    def find(self, hostname, port):
+        version = self.get_version()
+        if version != self.version:
+            self.load(version)
+
+        try:
+            port = int(port)
+        except (TypeError, ValueError):
+            port = None
+
+        key = (hostname, port)
+        site = self.matches.get(key)
+        if site is None:
+            site = self._match(hostname, port)
+            # Only remember exact matches, so that the map is bounded by the number
+            # of sites. Other hostnames and ports come from the Host header and can't
+            # be trusted to be few; they are matched against the loaded sites again
+            if site is not None and site.hostname == hostname and site.port == port:
+                self.matches[key] = site
+
+        if site is None:
+            return None
+
+        # Return a copy, so that attributes cached on the instances while handling
+        # one request (such as the specific root page) don't leak into others. The
+        # loaded instances are never handed out, so shallow copies are enough
+        site = copy.copy(site)
+        site.root_page = copy.copy(site.root_page)
+        return site
+
+    def _match(self, hostname, port):
+        def match_rank(site):
+            if site.hostname == hostname and site.port == port:
+                return MATCH_HOSTNAME_PORT
+            elif site.hostname == hostname and site.is_default_site:
+                return MATCH_HOSTNAME_DEFAULT
+            elif site.is_default_site:
+                return MATCH_DEFAULT
+            return MATCH_HOSTNAME
+
+        sites = sorted(
+            (
+                site
+                for site in self.sites
+                if site.hostname == hostname or site.is_default_site
+            ),
+            key=match_rank,
+        )
+
+        if sites:
+            if len(sites) == 1 or match_rank(sites[0]) in (
+                MATCH_HOSTNAME_PORT,
+                MATCH_HOSTNAME_DEFAULT,
+            ):
+                return sites[0]
+
+            if match_rank(sites[0]) == MATCH_DEFAULT:
+                return sites[len(sites) == 2]
+
+        return None
+
+
+site_cache = SiteCache()
+
+
 class SiteManager(models.Manager):
     def get_queryset(self):
         return super(SiteManager, self).get_queryset().order_by(Lower("hostname"))
@@ -162,6 +266,9 @@ class Site(models.Model):
     def _find_for_request(request):
         hostname = split_domain_port(request.get_host())[0]
         port = request.get_port()
+        if getattr(settings, "WAGTAIL_SITE_CACHE_ENABLED", False):
+            return site_cache.find(hostname, port)
+
         site = None
         try:
             site = get_site_for_hostname(hostname, port)
@@ -267,3 +374,10 @@ class Site(models.Model):
     @staticmethod
     def clear_site_root_paths_cache():
         cache.delete(SITE_ROOT_PATHS_CACHE_KEY, version=SITE_ROOT_PATHS_CACHE_VERSION)
+
+    @staticmethod
+    def clear_site_cache():
+        """
+        Invalidate the process-local hostname / port to Site map in every process
+        """
+        site_cache.invalidate()
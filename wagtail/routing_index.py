@@ -0,0 +1,142 @@
+"""
+An optional index mapping ``(site_id, url_path)`` to ``(page_id, content_type_id)``,
+allowing ``wagtail.views.serve`` to resolve a page with a single cache lookup and a
+single query for the specific page, regardless of how deep the page is in the tree.
+
+Enabled by setting ``WAGTAIL_ROUTING_INDEX = True``. Entries are populated lazily from
+requests that were routed through the standard ``Page.route`` implementation, and are
+stored in the Django cache so that they can be shared between processes.
+"""
+import hashlib
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+
+ROUTING_INDEX_CACHE_PREFIX = "wagtail_routing_index"
+ROUTING_INDEX_GENERATION_CACHE_KEY = "wagtail_routing_index_generation"
+ROUTING_INDEX_CACHE_TIMEOUT = 3600
+
+
+def routing_index_enabled():
+    return getattr(settings, "WAGTAIL_ROUTING_INDEX", False)
+
+
+def _get_generation():
+    generation = cache.get(ROUTING_INDEX_GENERATION_CACHE_KEY)
+    if generation is None:
+        generation = 1
+        cache.add(ROUTING_INDEX_GENERATION_CACHE_KEY, generation, None)
+    return generation
+
+
+def _get_cache_key(site_id, url_path):
+    # url_paths can be long and contain characters that are not valid in
+    # memcached keys, so use a digest of the path in the key instead
+    digest = hashlib.md5(url_path.encode("utf-8")).hexdigest()
+    return "%s:%s:%s" % (ROUTING_INDEX_CACHE_PREFIX, site_id, digest)
+
+
+def _uses_default_route(model):
+    Page = apps.get_model("wagtailcore.Page")
+    return model is not None and model.route is Page.route
+
+
+def lookup(site, root_page, path_components):
+    """
+    Return the live specific page that ``root_page.route`` would resolve ``path_components``
+    to, or ``None`` if the path is not in the index (in which case the caller should fall
+    back on ``Page.route``).
+    """
+    url_path = root_page.url_path + "".join(
+        component + "/" for component in path_components
+    )
+    cache_key = _get_cache_key(site.pk, url_path)
+
+    # Fetch the entry along with the current generation in a single round trip;
+    # entries recorded under an earlier generation have been invalidated by clear()
+    result = cache.get_many([ROUTING_INDEX_GENERATION_CACHE_KEY, cache_key])
+    entry = result.get(cache_key)
+    if entry is None:
+        return None
+
+    generation, page_id, content_type_id = entry
+    if generation != result.get(ROUTING_INDEX_GENERATION_CACHE_KEY):
+        return None
+
+    model = ContentType.objects.get_for_id(content_type_id).model_class()
+    page = None
+    if model is not None:
+        page = model.objects.filter(id=page_id).first()
+
+    # Entries are only a hint: anything that no longer matches the tree is discarded
+    if page is None or not page.live or page.url_path != url_path:
+        cache.delete(cache_key)
+        return None
+
+    return page
+
+
+def record(site, root_page, route_result):
+    """
+    Add the result of routing a request through ``root_page.route`` to the index, if the
+    page was resolved purely by the default ``Page.route`` implementation.
+    """
+    page, args, kwargs = route_result
+    if args or kwargs or not page.url_path.startswith(root_page.url_path):
+        return
+
+    # Any custom ``route`` method between the site root and the page itself may
+    # intercept the path, so only index pages reached through ``Page.route`` alone.
+    Page = apps.get_model("wagtailcore.Page")
+    steplen = Page.steplen
+    ancestor_paths = [
+        page.path[:length]
+        for length in range(len(root_page.path), len(page.path) + 1, steplen)
+    ]
+    content_type_ids = set(
+        Page.objects.filter(path__in=ancestor_paths).values_list(
+            "content_type_id", flat=True
+        )
+    )
+    for content_type_id in content_type_ids:
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        if not _uses_default_route(model):
+            return
+
+    cache.set(
+        _get_cache_key(site.pk, page.url_path),
+        (_get_generation(), page.pk, page.content_type_id),
+        ROUTING_INDEX_CACHE_TIMEOUT,
+    )
+
+
+def remove_page(page):
+    """
+    Remove all entries for the given page from the index.
+    """
+    Site = apps.get_model("wagtailcore.Site")
+    cache.delete_many(
+        [
+            _get_cache_key(site_id, page.url_path)
+            for site_id in {
+                root_path.site_id
+                for root_path in Site.get_site_root_paths()
+                if page.url_path.startswith(root_path.root_path)
+            }
+        ]
+    )
+
+
+def clear():
+    """
+    Invalidate every entry in the index. Used for changes that affect the URL paths of
+    whole subtrees, such as moves or slug changes.
+    """
+    try:
+        cache.incr(ROUTING_INDEX_GENERATION_CACHE_KEY)
+    except ValueError:
+        # The generation key has been evicted (or was never set), so existing entries
+        # are already unreachable by lookup()
+        pass
@@ -0,0 +1,49 @@
+from wagtail.management.base import QueueProcessingCommand
+from wagtail.search.models import PendingIndexUpdate
+from wagtail.search.queue import (
+    DEFAULT_BATCH_SIZE,
+    enqueue_index_updates,
+    update_index_for_objects,
+)
+
+
+class Command(QueueProcessingCommand):
+    help = "Update the search index for objects queued with WAGTAILSEARCH_AUTO_UPDATE_MODE set to 'queue'."
+
+    default_batch_size = DEFAULT_BATCH_SIZE
+    queued_items_name = "objects"
+
+    def process_batch(self, batch_size, **options):
+        pending = list(
+            PendingIndexUpdate.objects.select_related("content_type").order_by(
+                "created_at", "id"
+            )[:batch_size]
+        )
+
+        if not pending:
+            return {"entries": 0}
+
+        objects = {}
+        for item in pending:
+            model = item.content_type.model_class()
+            if model is None:
+                # The model has been removed since the object was queued
+                continue
+            objects[(model, model._meta.pk.to_python(item.object_id))] = None
+
+        # Remove the entries before updating the index, so that any changes made
+        # to the objects in the meantime are queued again rather than being
+        # treated as duplicates of these entries
+        PendingIndexUpdate.objects.filter(id__in=[item.id for item in pending]).delete()
+
+        try:
+            update_index_for_objects(objects, batch_size=batch_size)
+        except Exception:
+            # Put the entries back, so that they are retried on the next run
+            enqueue_index_updates(objects)
+            raise
+
+        return {"entries": len(pending), "objects": len(objects)}
+
+    def get_summary(self, totals):
+        return "Updated %(objects)d object(s) in the search index" % totals
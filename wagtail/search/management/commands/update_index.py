@@ -1,14 +1,79 @@
 import collections
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 
+from django.apps import apps
 from django.conf import settings
-from django.core.management.base import BaseCommand
+from django.core.exceptions import FieldDoesNotExist
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
+from django.db.models import Q
 
+from wagtail.management.utils import init_worker, map_in_workers, parse_since, pk_ranges
 from wagtail.search.backends import get_search_backend
 from wagtail.search.index import get_indexed_models
 
 DEFAULT_CHUNK_SIZE = 1000
 
+# Fields that --since compares against, where the model has them
+SINCE_FIELDS = ["latest_revision_created_at", "last_published_at"]
+
+
+def filter_since(queryset, since):
+    """
+    Restrict the queryset to objects that have been edited or published since the given
+    datetime. Models without any of the SINCE_FIELDS are not filtered.
+    """
+    condition = Q()
+    for field_name in SINCE_FIELDS:
+        try:
+            queryset.model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            continue
+        condition |= Q(**{field_name + "__gte": since})
+    return queryset.filter(condition)
+
+
+def get_index_by_name(backend, index_name, model):
+    """
+    Return the index of the given backend with the given name, which may be the new index
+    created by an atomic rebuild.
+    """
+    if hasattr(backend, "index_class"):
+        # Elasticsearch backends, which name each index
+        return backend.index_class(backend, index_name)
+    else:
+        # The database backends, which only have one index
+        return backend.get_index_for_model(model)
+
+
+def index_pk_range(index, model, first_pk, last_pk, since=None):
+    """
+    Add the indexed objects of the model with primary keys between first_pk and last_pk
+    (inclusive) to the index, and return the number of objects added.
+    """
+    queryset = model.get_indexed_objects().filter(pk__gte=first_pk, pk__lte=last_pk)
+    if since is not None:
+        queryset = filter_since(queryset, since)
+    items = list(queryset)
+    index.add_items(model, items)
+    return len(items)
+
+
+def index_pk_range_in_worker(
+    backend_name, index_name, model_label, first_pk, last_pk, since=None
+):
+    """
+    As index_pk_range, but identifying the backend, index and model by name so that
+    it can be run in a worker process.
+    """
+    backend = get_search_backend(backend_name)
+    model = apps.get_model(model_label)
+    index = get_index_by_name(backend, index_name, model)
+    return index_pk_range(index, model, first_pk, last_pk, since)
+
 
 def group_models_by_index(backend, models):
     """
@@ -60,7 +125,14 @@ class Command(BaseCommand):
             self.stdout.write(*args, **kwargs)
 
     def update_backend(
-        self, backend_name, schema_only=False, chunk_size=DEFAULT_CHUNK_SIZE
+        self,
+        backend_name,
+        schema_only=False,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        workers=1,
+        checkpoint=None,
+        resume=False,
+        since=None,
     ):
         self.write("Updating backend: " + backend_name)
 
@@ -70,18 +142,49 @@ class Command(BaseCommand):
             self.write("Backend '%s' doesn't require rebuilding" % backend_name)
             return
 
+        if (workers > 1 or checkpoint) and self.rebuild_is_transactional(backend):
+            raise CommandError(
+                "Backend '%s' rebuilds its index within a single database transaction "
+                "(ATOMIC_REBUILD), which can't be shared with worker processes or "
+                "resumed. Disable ATOMIC_REBUILD to use --workers or --checkpoint."
+                % backend_name
+            )
+
         models_grouped_by_index = group_models_by_index(
             backend, get_indexed_models()
         ).items()
         if not models_grouped_by_index:
             self.write(backend_name + ": No indices to rebuild")
 
-        for index, models in models_grouped_by_index:
-            self.write(backend_name + ": Rebuilding index %s" % index.name)
+        progress = self.read_checkpoint(checkpoint).get(backend_name, {})
 
-            # Start rebuild
-            rebuilder = backend.rebuilder_class(index)
-            index = rebuilder.start()
+        for index, models in models_grouped_by_index:
+            # Progress is recorded under the name of the live index, as the index
+            # being rebuilt may have a temporary name
+            index_key = index.name
+            index_progress = progress.get(index_key) if resume else None
+
+            if since is not None:
+                # Incremental update of the live index
+                self.write(backend_name + ": Updating index %s" % index.name)
+                rebuilder = None
+                index_progress = None
+            elif index_progress:
+                self.write(backend_name + ": Resuming rebuild of index %s" % index.name)
+                rebuilder = backend.rebuilder_class(index)
+                # Continue adding to the index created by the interrupted rebuild
+                rebuilder.index = get_index_by_name(
+                    backend, index_progress["index"], models[0]
+                )
+                index = rebuilder.index
+            else:
+                self.write(backend_name + ": Rebuilding index %s" % index.name)
+
+                # Start rebuild
+                rebuilder = backend.rebuilder_class(index)
+                index = rebuilder.start()
+                index_progress = {"index": index.name, "models": {}}
+                progress[index_key] = index_progress
 
             # Add models
             for model in models:
@@ -98,23 +201,126 @@ class Command(BaseCommand):
                         ending="",
                     )
 
-                    # Add items (chunk_size at a time)
-                    for chunk in self.print_iter_progress(
-                        self.queryset_chunks(
-                            model.get_indexed_objects().order_by("pk"), chunk_size
+                    if workers > 1 or checkpoint or since is not None:
+                        object_count += self.index_model_in_pk_ranges(
+                            backend_name,
+                            index,
+                            model,
+                            chunk_size,
+                            workers,
+                            since,
+                            index_progress,
+                            lambda: self.write_checkpoint(
+                                checkpoint, backend_name, progress
+                            ),
                         )
-                    ):
-                        index.add_items(model, chunk)
-                        object_count += len(chunk)
+                    else:
+                        # Add items (chunk_size at a time)
+                        for chunk in self.print_iter_progress(
+                            self.queryset_chunks(
+                                model.get_indexed_objects().order_by("pk"), chunk_size
+                            )
+                        ):
+                            index.add_items(model, chunk)
+                            object_count += len(chunk)
 
                     self.print_newline()
 
             # Finish rebuild
-            rebuilder.finish()
+            if rebuilder is not None:
+                rebuilder.finish()
+
+            if checkpoint and since is None:
+                # This index is complete, so a later run should start it afresh
+                progress.pop(index_key, None)
+                self.write_checkpoint(checkpoint, backend_name, progress)
 
             self.write(backend_name + ": indexed %d objects" % object_count)
             self.print_newline()
 
+    def rebuild_is_transactional(self, backend):
+        # The database backends implement ATOMIC_REBUILD by rebuilding the index
+        # within a transaction
+        if hasattr(backend, "index_class"):
+            return False
+        atomic_rebuilder_class = getattr(backend, "atomic_rebuilder_class", None)
+        return backend.rebuilder_class is atomic_rebuilder_class
+
+    def index_model_in_pk_ranges(
+        self,
+        backend_name,
+        index,
+        model,
+        chunk_size,
+        workers,
+        since,
+        index_progress,
+        save_progress,
+    ):
+        """
+        Add the model's objects to the index in chunks of consecutive primary keys,
+        in worker processes if workers > 1, recording the last primary key of each
+        completed chunk in index_progress (when not None) and calling save_progress.
+        """
+        queryset = model.get_indexed_objects()
+        if since is not None:
+            queryset = filter_since(queryset, since)
+
+        model_label = model._meta.label
+        models_progress = index_progress["models"] if index_progress else {}
+        if model_label in models_progress:
+            queryset = queryset.filter(pk__gt=models_progress[model_label])
+
+        ranges = pk_ranges(queryset, chunk_size)
+
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=init_worker)
+            results = map_in_workers(
+                executor,
+                index_pk_range_in_worker,
+                [backend_name] * len(ranges),
+                [index.name] * len(ranges),
+                [model_label] * len(ranges),
+                [first for first, last in ranges],
+                [last for first, last in ranges],
+                [since] * len(ranges),
+            )
+        else:
+            executor = None
+            results = (
+                index_pk_range(index, model, first, last, since)
+                for first, last in ranges
+            )
+
+        object_count = 0
+        try:
+            # Results arrive in the same order as the ranges, so once a range is
+            # done, every object up to its last primary key has been indexed
+            for (first, last), count in self.print_iter_progress(zip(ranges, results)):
+                object_count += count
+                if index_progress is not None:
+                    models_progress[model_label] = last
+                    save_progress()
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return object_count
+
+    def read_checkpoint(self, checkpoint):
+        if checkpoint and os.path.exists(checkpoint):
+            with open(checkpoint) as f:
+                return json.load(f)
+        return {}
+
+    def write_checkpoint(self, checkpoint, backend_name, progress):
+        if not checkpoint:
+            return
+        data = self.read_checkpoint(checkpoint)
+        data[backend_name] = progress
+        with open(checkpoint, "w") as f:
+            json.dump(data, f, cls=DjangoJSONEncoder)
+
     def add_arguments(self, parser):
         parser.add_argument(
             "--backend",
@@ -138,10 +344,37 @@ class Command(BaseCommand):
             type=int,
             help="Set number of records to be fetched at once for inserting into the index",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of worker processes to index objects with (default: 1)",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="Path of a file to record the progress of the rebuild in, for use with --resume",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue an interrupted rebuild from the progress recorded in the --checkpoint file",
+        )
+        parser.add_argument(
+            "--since",
+            help=(
+                "Only index objects edited or published on or after this date / datetime "
+                "(ISO 8601), updating the existing index rather than rebuilding it"
+            ),
+        )
 
     def handle(self, **options):
         self.verbosity = options["verbosity"]
 
+        if options["resume"] and not options["checkpoint"]:
+            raise CommandError("--resume requires a --checkpoint file")
+
+        since = parse_since(options["since"]) if options["since"] else None
+
         # Get list of backends to index
         if options["backend_name"]:
             # index only the passed backend
@@ -159,6 +392,10 @@ class Command(BaseCommand):
                 backend_name,
                 schema_only=options.get("schema_only", False),
                 chunk_size=options.get("chunk_size"),
+                workers=options["workers"],
+                checkpoint=options["checkpoint"],
+                resume=options["resume"],
+                since=since,
             )
 
     def print_newline(self):
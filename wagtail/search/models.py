@@ -282,3 +282,26 @@ class IndexEntry(AbstractIndexEntry):
         """
 
         abstract = False
+
+
+class PendingIndexUpdate(models.Model):
+    """
+    An object that has been saved or deleted with ``WAGTAILSEARCH_AUTO_UPDATE_MODE`` set to
+    ``"queue"``, and is yet to be updated in the search index by the
+    ``process_search_index_queue`` management command.
+    """
+
+    content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, related_name="+"
+    )
+    # We do not use an IntegerField since primary keys are not always integers.
+    object_id = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    wagtail_reference_index_ignore = True
+
+    class Meta:
+        unique_together = ("content_type", "object_id")
+
+    def __str__(self):
+        return "%s: %s" % (self.content_type.name, self.object_id)
@@ -0,0 +1,134 @@
+"""
+Batched search index updates, used in place of indexing each object as it is saved when
+the ``WAGTAILSEARCH_AUTO_UPDATE_MODE`` setting is ``"on_commit"`` or ``"queue"``.
+
+Objects that are saved or deleted within a transaction are collected into an
+``IndexUpdateBatch``, which removes duplicates and is run when the transaction is
+committed (or immediately, outside of a transaction). In ``"on_commit"`` mode the
+batch updates the search backends straight away; in ``"queue"`` mode it is written to
+the ``PendingIndexUpdate`` table, to be processed by the ``process_search_index_queue``
+management command.
+"""
+import logging
+from collections import defaultdict
+
+from django.conf import settings
+
+from wagtail.search.backends import get_search_backends_with_name
+from wagtail.search.index import class_is_indexed
+from wagtail.utils.transactions import OnCommitBatch
+
+logger = logging.getLogger("wagtail.search.index")
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def get_auto_update_mode():
+    return getattr(settings, "WAGTAILSEARCH_AUTO_UPDATE_MODE", "immediate")
+
+
+class IndexUpdateBatch(OnCommitBatch):
+    """
+    A set of ``(model, pk)`` pairs of objects that have changed within a transaction.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Used as an ordered set
+        self.objects = {}
+
+    def add(self, model, pk):
+        self.objects[(model, pk)] = None
+
+    def run(self):
+        if get_auto_update_mode() == "queue":
+            enqueue_index_updates(self.objects)
+        else:
+            update_index_for_objects(self.objects)
+
+
+def add_to_batch(model, pk, using=None):
+    """
+    Record that the object of the given model and pk needs to be reindexed (or removed from
+    the index, if it no longer exists) once the current transaction is committed.
+    """
+    IndexUpdateBatch.add_to_current(model, pk, using=using)
+
+
+def enqueue_index_updates(objects):
+    from django.contrib.contenttypes.models import ContentType
+
+    from wagtail.search.models import PendingIndexUpdate
+
+    PendingIndexUpdate.objects.bulk_create(
+        [
+            PendingIndexUpdate(
+                content_type=ContentType.objects.get_for_model(model),
+                object_id=str(pk),
+            )
+            for model, pk in objects
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def update_index_for_objects(objects, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Bring the search index up to date for the given ``(model, pk)`` pairs. Objects that
+    still exist are reindexed, in batches of up to ``batch_size`` objects per model,
+    and objects that no longer exist are removed from the index.
+    """
+    pks_by_model = defaultdict(list)
+    for model, pk in objects:
+        pks_by_model[model].append(pk)
+
+    for model, pks in pks_by_model.items():
+        for i in range(0, len(pks), batch_size):
+            _update_index_for_model(model, pks[i : i + batch_size])
+
+
+def _update_index_for_model(model, pks):
+    existing_objects = {
+        obj.pk: obj for obj in model._default_manager.filter(pk__in=pks)
+    }
+
+    # Find the most specific instance of each object that exists, which is the one that
+    # is indexed (see Indexed.get_indexed_instance)
+    indexed_pks_by_model = defaultdict(list)
+    for obj in existing_objects.values():
+        indexed_instance = obj.get_indexed_instance()
+        if indexed_instance is not None:
+            indexed_pks_by_model[type(indexed_instance)].append(indexed_instance.pk)
+
+    objects_to_add = []
+    for indexed_model, indexed_pks in indexed_pks_by_model.items():
+        if class_is_indexed(indexed_model):
+            objects_to_add.append(
+                (
+                    indexed_model,
+                    list(
+                        indexed_model.get_indexed_objects().filter(pk__in=indexed_pks)
+                    ),
+                )
+            )
+
+    objects_to_delete = [model(pk=pk) for pk in pks if pk not in existing_objects]
+
+    for backend_name, backend in get_search_backends_with_name(with_auto_update=True):
+        try:
+            for indexed_model, obj_list in objects_to_add:
+                if obj_list:
+                    backend.add_bulk(indexed_model, obj_list)
+
+            for obj in objects_to_delete:
+                backend.delete(obj)
+        except Exception:
+            logger.exception(
+                "Exception raised while updating %s objects in the '%s' search backend",
+                model._meta.label,
+                backend_name,
+            )
+
+            # See the comments in wagtail.search.index.insert_or_update_object
+            if not backend.catch_indexing_errors:
+                raise
@@ -1,9 +1,16 @@
 from django.db.models.signals import post_delete, post_save
 
 from wagtail.search import index
+from wagtail.search.queue import add_to_batch, get_auto_update_mode
 
 
-def post_save_signal_handler(instance, update_fields=None, **kwargs):
+def post_save_signal_handler(instance, update_fields=None, using=None, **kwargs):
+    if get_auto_update_mode() != "immediate":
+        # The instance is fetched again when the batch is processed, so there is no
+        # need to handle update_fields here
+        add_to_batch(type(instance), instance.pk, using=using)
+        return
+
     if update_fields is not None:
         # fetch a fresh copy of instance from the database to ensure
         # that we're not indexing any of the unsaved data contained in
@@ -13,7 +20,13 @@ def post_save_signal_handler(instance, update_fields=None, **kwargs):
     index.insert_or_update_object(instance)
 
 
-def post_delete_signal_handler(instance, **kwargs):
+def post_delete_signal_handler(instance, using=None, **kwargs):
+    if get_auto_update_mode() != "immediate":
+        indexed_instance = index.get_indexed_instance(instance, check_exists=False)
+        if indexed_instance:
+            add_to_batch(type(indexed_instance), indexed_instance.pk, using=using)
+        return
+
     index.remove_object(instance)
 
 
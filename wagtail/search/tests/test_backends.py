@@ -1,4 +1,7 @@
 # coding: utf-8
+import json
+import os
+import tempfile
 import unittest
 from collections import OrderedDict
 from datetime import date
@@ -925,6 +928,63 @@ class BackendTests(WagtailTestUtils):
         )
         self.assertFalse(stdout.read())
 
+    def test_update_index_with_checkpoint(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint = os.path.join(tmpdir, "checkpoint.json")
+            management.call_command(
+                "update_index",
+                backend_name=self.backend_name,
+                checkpoint=checkpoint,
+                chunk_size=2,
+                stdout=StringIO(),
+            )
+
+            # Completed indexes are removed from the checkpoint
+            if os.path.exists(checkpoint):
+                with open(checkpoint) as f:
+                    self.assertEqual(json.load(f).get(self.backend_name, {}), {})
+
+            # Resuming from a checkpoint with no progress rebuilds the index
+            management.call_command(
+                "update_index",
+                backend_name=self.backend_name,
+                checkpoint=checkpoint,
+                resume=True,
+                stdout=StringIO(),
+            )
+
+        results = self.backend.search("JavaScript", models.Book)
+        self.assertEqual(results.count(), 2)
+
+    def test_update_index_since(self):
+        management.call_command(
+            "update_index",
+            backend_name=self.backend_name,
+            since="2000-01-01",
+            stdout=StringIO(),
+        )
+
+        results = self.backend.search("JavaScript", models.Book)
+        self.assertEqual(results.count(), 2)
+
+    def test_update_index_resume_requires_checkpoint(self):
+        with self.assertRaises(management.CommandError):
+            management.call_command(
+                "update_index",
+                backend_name=self.backend_name,
+                resume=True,
+                stdout=StringIO(),
+            )
+
+    def test_update_index_invalid_since(self):
+        with self.assertRaises(management.CommandError):
+            management.call_command(
+                "update_index",
+                backend_name=self.backend_name,
+                since="last tuesday",
+                stdout=StringIO(),
+            )
+
 
 @override_settings(
     WAGTAILSEARCH_BACKENDS={"default": {"BACKEND": "wagtail.search.backends.database"}}
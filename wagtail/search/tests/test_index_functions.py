@@ -1,10 +1,14 @@
 from datetime import date
+from io import StringIO
 from unittest import mock
 
+from django.core import management
+from django.db import transaction
 from django.test import TestCase, override_settings
 
 from wagtail.models import Page
 from wagtail.search import index
+from wagtail.search.models import PendingIndexUpdate
 from wagtail.test.search import models
 from wagtail.test.testapp.models import SimplePage
 from wagtail.test.utils import WagtailTestUtils
@@ -224,3 +228,127 @@ class TestSignalHandlersSearchDisabled(TestCase, WagtailTestUtils):
 
         self.assertEqual(backend().add.call_count, 0)
         self.assertIsNone(backend().add.call_args)
+
+
+@mock.patch("wagtail.search.tests.DummySearchBackend", create=True)
+@override_settings(
+    WAGTAILSEARCH_BACKENDS={
+        "default": {"BACKEND": "wagtail.search.tests.DummySearchBackend"}
+    },
+    WAGTAILSEARCH_AUTO_UPDATE_MODE="on_commit",
+)
+class TestBatchedSignalHandlers(WagtailTestUtils, TestCase):
+    fixtures = ["search"]
+
+    def test_index_on_commit(self, backend):
+        backend().reset_mock()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            obj = models.Book.objects.create(
+                title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
+            )
+            obj.title = "Updated test"
+            obj.save()
+            obj.title = "Updated test again"
+            obj.save(update_fields=["title"])
+
+            self.assertFalse(backend().add_bulk.called)
+
+        self.assertFalse(backend().add.called)
+        self.assertEqual(backend().add_bulk.call_count, 1)
+        model, obj_list = backend().add_bulk.call_args[0]
+        self.assertEqual(model, models.Book)
+        self.assertEqual(obj_list, [obj])
+        self.assertEqual(obj_list[0].title, "Updated test again")
+
+    def test_converts_to_specific_class(self, backend):
+        novel = models.Novel.objects.get(id=1)
+        backend().reset_mock()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            novel.book_ptr.save()
+
+        model, obj_list = backend().add_bulk.call_args[0]
+        self.assertEqual(model, models.Novel)
+        self.assertEqual(obj_list, [novel])
+
+    def test_remove_on_commit(self, backend):
+        with self.captureOnCommitCallbacks(execute=True):
+            obj = models.Book.objects.create(
+                title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
+            )
+        pk = obj.pk
+        backend().reset_mock()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            obj.delete()
+
+        self.assertFalse(backend().add_bulk.called)
+        self.assertEqual(backend().delete.call_count, 1)
+        deleted = backend().delete.call_args[0][0]
+        self.assertIsInstance(deleted, models.Book)
+        self.assertEqual(deleted.pk, pk)
+
+    def test_rolled_back_changes_are_not_indexed(self, backend):
+        backend().reset_mock()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    models.Book.objects.create(
+                        title="Test",
+                        publication_date=date(2017, 10, 18),
+                        number_of_pages=100,
+                    )
+                    raise ValueError
+            except ValueError:
+                pass
+
+        self.assertFalse(backend().add_bulk.called)
+
+
+@mock.patch("wagtail.search.tests.DummySearchBackend", create=True)
+@override_settings(
+    WAGTAILSEARCH_BACKENDS={
+        "default": {"BACKEND": "wagtail.search.tests.DummySearchBackend"}
+    },
+    WAGTAILSEARCH_AUTO_UPDATE_MODE="queue",
+)
+class TestIndexQueue(WagtailTestUtils, TestCase):
+    def test_queue_and_process(self, backend):
+        backend().reset_mock()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            obj = models.Book.objects.create(
+                title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
+            )
+            obj.title = "Updated test"
+            obj.save()
+
+        self.assertFalse(backend().add_bulk.called)
+        self.assertEqual(PendingIndexUpdate.objects.count(), 1)
+
+        management.call_command(
+            "process_search_index_queue", stdout=StringIO(), verbosity=0
+        )
+
+        self.assertFalse(PendingIndexUpdate.objects.exists())
+        model, obj_list = backend().add_bulk.call_args[0]
+        self.assertEqual(model, models.Book)
+        self.assertEqual(obj_list, [obj])
+
+    def test_failed_updates_are_requeued(self, backend):
+        with self.captureOnCommitCallbacks(execute=True):
+            models.Book.objects.create(
+                title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
+            )
+
+        backend().add_bulk.side_effect = ValueError
+        backend().catch_indexing_errors = False
+
+        with self.assertRaises(ValueError):
+            management.call_command(
+                "process_search_index_queue", stdout=StringIO(), verbosity=0
+            )
+
+        self.assertEqual(PendingIndexUpdate.objects.count(), 1)
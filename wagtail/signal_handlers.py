@@ -2,8 +2,11 @@ import logging
 from contextlib import contextmanager
 
 from asgiref.local import Local
+from django.conf import settings
+from django.contrib.auth.models import Group
 from django.db import transaction
 from django.db.models.signals import (
+    m2m_changed,
     post_delete,
     post_migrate,
     post_save,
@@ -12,8 +15,23 @@ from django.db.models.signals import (
 )
 from modelcluster.fields import ParentalKey
 
+from wagtail import routing_index
 from wagtail.coreutils import get_locales_display_names
-from wagtail.models import Locale, Page, ReferenceIndex, Site
+from wagtail.models import (
+    GroupPagePermission,
+    Locale,
+    Page,
+    ReferenceIndex,
+    Site,
+    clear_page_permission_lookups,
+)
+from wagtail.models.reference_index import get_reference_index_update_mode
+from wagtail.signals import (
+    page_published,
+    page_slug_changed,
+    page_unpublished,
+    post_page_move,
+)
 
 logger = logging.getLogger("wagtail")
 
@@ -21,10 +39,25 @@ logger = logging.getLogger("wagtail")
 # Clear the wagtail_site_root_paths from the cache whenever Site records are updated.
 def post_save_site_signal_handler(instance, update_fields=None, **kwargs):
     Site.clear_site_root_paths_cache()
+    Site.clear_site_cache()
+    if routing_index.routing_index_enabled():
+        routing_index.clear()
 
 
 def post_delete_site_signal_handler(instance, **kwargs):
     Site.clear_site_root_paths_cache()
+    Site.clear_site_cache()
+    if routing_index.routing_index_enabled():
+        routing_index.clear()
+
+
+# The site cache holds a copy of each site's root page, so refresh it when one changes
+def clear_site_cache_on_root_page_change(instance, **kwargs):
+    if (
+        getattr(settings, "WAGTAIL_SITE_CACHE_ENABLED", False)
+        and instance.is_site_root()
+    ):
+        Site.clear_site_cache()
 
 
 def pre_delete_page_unpublish(sender, instance, **kwargs):
@@ -38,10 +71,31 @@ def post_delete_page_log_deletion(sender, instance, **kwargs):
     logger.info('Page deleted: "%s" id=%d', instance.title, instance.id)
 
 
+# Keep the page routing index in step with changes to the page tree
+def update_routing_index_on_page_change(instance, **kwargs):
+    if routing_index.routing_index_enabled():
+        routing_index.remove_page(instance)
+
+
+def clear_routing_index_on_page_move(**kwargs):
+    if routing_index.routing_index_enabled():
+        routing_index.clear()
+
+
 def reset_locales_display_names_cache(sender, instance, **kwargs):
     get_locales_display_names.cache_clear()
 
 
+# Page permission lookups store the paths of the pages that permissions are given on
+def clear_page_permission_lookups_signal_handler(**kwargs):
+    clear_page_permission_lookups()
+
+
+def clear_page_permission_lookups_on_group_change(instance, model, **kwargs):
+    if isinstance(instance, Group) or issubclass(model, Group):
+        clear_page_permission_lookups()
+
+
 reference_index_auto_update_disabled = Local()
 
 
@@ -87,8 +141,11 @@ def update_reference_index_on_save(instance, **kwargs):
             return
 
     if ReferenceIndex.model_is_indexable(type(instance)):
-        with transaction.atomic():
-            ReferenceIndex.create_or_update_for_object(instance)
+        if get_reference_index_update_mode() == "queue":
+            ReferenceIndex.queue_update_for_object(instance)
+        else:
+            with transaction.atomic():
+                ReferenceIndex.create_or_update_for_object(instance)
 
 
 def remove_reference_index_on_delete(instance, **kwargs):
@@ -116,9 +173,29 @@ def register_signal_handlers():
     pre_delete.connect(pre_delete_page_unpublish, sender=Page)
     post_delete.connect(post_delete_page_log_deletion, sender=Page)
 
+    page_published.connect(clear_site_cache_on_root_page_change)
+    page_unpublished.connect(clear_site_cache_on_root_page_change)
+    page_slug_changed.connect(clear_site_cache_on_root_page_change)
+    post_page_move.connect(clear_site_cache_on_root_page_change)
+
+    page_published.connect(update_routing_index_on_page_change)
+    page_unpublished.connect(update_routing_index_on_page_change)
+    post_delete.connect(update_routing_index_on_page_change, sender=Page)
+    page_slug_changed.connect(clear_routing_index_on_page_move)
+    post_page_move.connect(clear_routing_index_on_page_move)
+
     post_save.connect(reset_locales_display_names_cache, sender=Locale)
     post_delete.connect(reset_locales_display_names_cache, sender=Locale)
 
+    post_save.connect(
+        clear_page_permission_lookups_signal_handler, sender=GroupPagePermission
+    )
+    post_delete.connect(
+        clear_page_permission_lookups_signal_handler, sender=GroupPagePermission
+    )
+    post_page_move.connect(clear_page_permission_lookups_signal_handler)
+    m2m_changed.connect(clear_page_permission_lookups_on_group_change)
+
     # Reference index signal handlers
     connect_reference_index_signal_handlers()
 
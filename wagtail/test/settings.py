@@ -136,6 +136,7 @@ INSTALLED_APPS = [
     "wagtail.contrib.table_block",
     "wagtail.contrib.forms",
     "wagtail.contrib.typed_table_block",
+    "wagtail.contrib.sitemaps",
     "wagtail.search",
     "wagtail.embeds",
     "wagtail.images",
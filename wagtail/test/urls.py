@@ -40,6 +40,12 @@ urlpatterns = [
         },
     ),
     path("sitemap-<str:section>.xml", sitemaps_views.sitemap, name="sitemap"),
+    path("sitemap-files/sitemap.xml", sitemaps_views.serve_sitemap_file),
+    path(
+        "sitemap-files/sitemap-<int:shard>.xml",
+        sitemaps_views.serve_sitemap_file,
+        name="wagtailsitemaps_shard",
+    ),
     path("testapp/", include(testapp_urls)),
     path("fallback/", lambda: HttpResponse("ok"), name="fallback"),
 ]
@@ -0,0 +1,49 @@
+import json
+
+from django.test import TestCase
+
+from wagtail import blocks
+from wagtail.fields import StreamField
+from wagtail.images.blocks import ImageChooserBlock
+from wagtail.images.models import Image
+from wagtail.images.tests.utils import get_test_image_file
+from wagtail.test.benchmark import Benchmark
+
+
+class BenchStreamFieldFirstBlocks(Benchmark, TestCase):
+    """
+    Loads a stream of 1000 blocks and accesses the first few of them, as a listing
+    showing the start of each page's body would.
+    """
+
+    lazy_decode = False
+
+    def setUp(self):
+        image = Image.objects.create(title="Test image", file=get_test_image_file())
+
+        self.field = StreamField(
+            [
+                ("paragraph", blocks.RichTextBlock()),
+                ("image", ImageChooserBlock()),
+            ],
+            use_json_field=True,
+            lazy_decode=self.lazy_decode,
+        )
+        self.raw_text = json.dumps(
+            [
+                {"type": "paragraph", "value": "<p>Paragraph %d</p>" % i, "id": str(i)}
+                if i % 2
+                else {"type": "image", "value": image.id, "id": str(i)}
+                for i in range(1000)
+            ]
+        )
+
+    def bench(self):
+        value = self.field.to_python(self.raw_text)
+
+        for child in value[:5]:
+            self.assertIsNotNone(child.value)
+
+
+class BenchStreamFieldFirstBlocksWithLazyDecode(BenchStreamFieldFirstBlocks):
+    lazy_decode = True
@@ -5,14 +5,16 @@ import copy
 import json
 import unittest
 from decimal import Decimal
+from unittest import mock
 
 # non-standard import name for gettext_lazy, to prevent strings from being picked up for translation
 from django import forms
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
 from django.forms.utils import ErrorList
 from django.template.loader import render_to_string
-from django.test import SimpleTestCase, TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.utils.safestring import SafeData, mark_safe
 from django.utils.translation import gettext_lazy as _
 
@@ -50,6 +52,14 @@ class ContextCharBlock(blocks.CharBlock):
         return super(blocks.CharBlock, self).get_context(value, parent_context)
 
 
+class CountingCharBlock(blocks.CharBlock):
+    render_count = 0
+
+    def get_context(self, value, parent_context=None):
+        CountingCharBlock.render_count += 1
+        return super().get_context(value, parent_context=parent_context)
+
+
 class TestFieldBlock(WagtailTestUtils, SimpleTestCase):
     def test_charfield_render(self):
         block = blocks.CharBlock()
@@ -5514,3 +5524,126 @@ class TestValidationErrorAsJsonData(TestCase):
                 ],
             },
         )
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class TestBlockRenderCache(SimpleTestCase):
+    block_class = CountingCharBlock
+
+    def setUp(self):
+        CountingCharBlock.render_count = 0
+
+    def tearDown(self):
+        cache.clear()
+
+    @property
+    def render_count(self):
+        return CountingCharBlock.render_count
+
+    def test_not_cached_by_default(self):
+        block = self.block_class(template="tests/blocks/heading_block.html")
+        block.render("Hello")
+        block.render("Hello")
+        self.assertEqual(self.render_count, 2)
+        self.assertIsNone(block.get_render_cache_key("Hello"))
+
+    def test_cached_render(self):
+        block = self.block_class(template="tests/blocks/heading_block.html", cache=True)
+        self.assertEqual(block.render("Hello"), "<h1>Hello</h1>")
+        html = block.render("Hello")
+        self.assertEqual(html, "<h1>Hello</h1>")
+        self.assertIsInstance(html, SafeData)
+        self.assertEqual(self.render_count, 1)
+
+        # A different value gets a new cache key
+        self.assertEqual(block.render("Goodbye"), "<h1>Goodbye</h1>")
+        self.assertEqual(self.render_count, 2)
+
+    def test_cached_render_basic_remains_unsafe(self):
+        block = blocks.CharBlock(cache=True)
+        block.render("<b>Hello</b>")
+        html = block.render("<b>Hello</b>")
+        self.assertEqual(html, "<b>Hello</b>")
+        self.assertNotIsInstance(html, SafeData)
+
+    def test_definition_change_invalidates(self):
+        block = self.block_class(template="tests/blocks/heading_block.html", cache=True)
+        other_block = self.block_class(
+            template="tests/blocks/heading_block.html",
+            cache=True,
+            help_text="Changed",
+        )
+        self.assertNotEqual(block.definition_hash, other_block.definition_hash)
+        self.assertEqual(
+            block.definition_hash,
+            self.block_class(
+                template="tests/blocks/heading_block.html", cache=True
+            ).definition_hash,
+        )
+
+    def test_unserializable_block_not_cached(self):
+        # Lambdas can't be serialized into the block's definition hash
+        block = self.block_class(
+            template="tests/blocks/heading_block.html",
+            cache=True,
+            validators=[lambda value: None],
+        )
+        self.assertIsNone(block.definition_hash)
+        self.assertIsNone(block.get_render_cache_key("Hello"))
+
+        self.assertEqual(block.render("Hello"), "<h1>Hello</h1>")
+        self.assertEqual(block.render("Hello"), "<h1>Hello</h1>")
+        self.assertEqual(self.render_count, 2)
+
+    def test_cache_vary_on(self):
+        block = self.block_class(
+            template="tests/blocks/heading_block.html",
+            cache=True,
+            cache_vary_on=["language", "request.user.username"],
+        )
+        request = mock.Mock()
+        request.user.username = "admin"
+
+        self.assertEqual(
+            block.render("Hello", context={"language": "fr", "request": request}),
+            '<h1 lang="fr">Hello</h1>',
+        )
+        block.render("Hello", context={"language": "fr", "request": request})
+        self.assertEqual(self.render_count, 1)
+
+        self.assertEqual(
+            block.render("Hello", context={"language": "de", "request": request}),
+            '<h1 lang="de">Hello</h1>',
+        )
+        self.assertEqual(self.render_count, 2)
+
+        request.user.username = "editor"
+        block.render("Hello", context={"language": "de", "request": request})
+        self.assertEqual(self.render_count, 3)
+
+    def test_cached_child_in_stream(self):
+        stream_block = blocks.StreamBlock(
+            [
+                (
+                    "heading",
+                    self.block_class(
+                        template="tests/blocks/heading_block.html", cache=True
+                    ),
+                ),
+                ("paragraph", blocks.CharBlock()),
+            ]
+        )
+        value = stream_block.to_python(
+            [
+                {"type": "heading", "value": "Hello", "id": "1"},
+                {"type": "paragraph", "value": "World", "id": "2"},
+            ]
+        )
+        stream_block.render(value)
+        html = stream_block.render(value)
+
+        self.assertIn("<h1>Hello</h1>", html)
+        self.assertIn("World", html)
+        self.assertEqual(self.render_count, 1)
@@ -13,6 +13,7 @@ from django.test.client import RequestFactory
 from django.utils import timezone, translation
 from freezegun import freeze_time
 
+from wagtail import routing_index
 from wagtail.actions.copy_for_translation import ParentNotTranslatedError
 from wagtail.coreutils import get_dummy_request
 from wagtail.locks import BasicLock, ScheduledForPublishLock, WorkflowLock
@@ -835,6 +836,110 @@ class TestServeView(TestCase):
         self.assertContains(response, "bad googlebot no cookie")
 
 
+@override_settings(WAGTAIL_ROUTING_INDEX=True)
+class TestServeViewWithRoutingIndex(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        Site.clear_site_root_paths_cache()
+        routing_index.clear()
+        self.site = Site.objects.select_related("root_page").get(is_default_site=True)
+        self.about_us_page = Page.objects.get(url_path="/home/about-us/")
+        self.team_page = self.about_us_page.add_child(
+            instance=SimplePage(title="Team", slug="team", content="The team")
+        )
+
+    def lookup(self, *path_components):
+        return routing_index.lookup(
+            self.site, self.site.root_page, list(path_components)
+        )
+
+    def test_serve_populates_index(self):
+        self.assertIsNone(self.lookup("about-us", "team"))
+
+        response = self.client.get("/about-us/team/")
+        self.assertEqual(response.status_code, 200)
+
+        page = self.lookup("about-us", "team")
+        self.assertEqual(page, self.team_page)
+        self.assertIsInstance(page, SimplePage)
+
+    def test_serve_from_index(self):
+        self.client.get("/about-us/team/")
+
+        # one cache lookup and a single query for the specific page
+        with self.assertNumQueries(2):
+            page = self.lookup("about-us", "team")
+        self.assertEqual(page, self.team_page)
+
+        response = self.client.get("/about-us/team/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["self"], self.team_page)
+        self.assertContains(response, "<h2>Simple page</h2>")
+
+    def test_unknown_page_returns_404(self):
+        response = self.client.get("/about-us/nobody/")
+        self.assertEqual(response.status_code, 404)
+        self.assertIsNone(self.lookup("about-us", "nobody"))
+
+    def test_unpublish_removes_entry(self):
+        self.client.get("/about-us/team/")
+        self.team_page.unpublish()
+
+        self.assertIsNone(self.lookup("about-us", "team"))
+        response = self.client.get("/about-us/team/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_move_clears_index(self):
+        self.client.get("/about-us/team/")
+        self.team_page.move(Page.objects.get(url_path="/home/secret-plans/"))
+
+        self.assertIsNone(self.lookup("about-us", "team"))
+        response = self.client.get("/about-us/team/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_publishing_other_page_keeps_index(self):
+        self.client.get("/about-us/team/")
+        self.about_us_page.specific.save_revision().publish()
+
+        self.assertEqual(self.lookup("about-us", "team"), self.team_page)
+
+    def test_deleting_site_clears_index(self):
+        self.client.get("/about-us/team/")
+        Site.objects.create(
+            hostname="other.example.com", root_page=self.about_us_page
+        ).delete()
+
+        self.assertIsNone(self.lookup("about-us", "team"))
+
+    def test_delete_removes_entry(self):
+        self.client.get("/about-us/team/")
+        self.team_page.delete()
+
+        self.assertIsNone(self.lookup("about-us", "team"))
+        response = self.client.get("/about-us/team/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_stale_entry_is_ignored(self):
+        self.client.get("/about-us/team/")
+        # bypass signals, so that the index still holds the old entry
+        SimplePage.objects.filter(id=self.team_page.id).update(live=False)
+
+        self.assertIsNone(self.lookup("about-us", "team"))
+        response = self.client.get("/about-us/team/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_page_below_custom_route_not_indexed(self):
+        # EventIndex overrides route(), so its children are not added to the index
+        response = self.client.get("/events/christmas/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(self.lookup("events", "christmas"))
+
+        response = self.client.get("/events/christmas/")
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "<h1>Christmas</h1>")
+
+
 class TestMovePage(TestCase):
     fixtures = ["test.json"]
 
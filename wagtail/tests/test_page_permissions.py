@@ -10,6 +10,7 @@ from wagtail.models import (
     GroupPagePermission,
     Locale,
     Page,
+    PagePermissionLookup,
     UserPagePermissionsProxy,
     Workflow,
     WorkflowTask,
@@ -827,6 +828,78 @@ class TestPagePermission(TestCase):
         self.assertFalse(editor_perms.can_lock())
         self.assertFalse(editor_perms.can_unlock())
 
+    def test_page_permission_checks_use_one_query(self):
+        event_moderator = get_user_model().objects.get(
+            email="eventmoderator@example.com"
+        )
+        pages = list(Page.objects.all())
+        events_page = Page.objects.get(url_path="/home/events/")
+
+        with self.assertNumQueries(1):
+            for page in pages:
+                # The permissions are fetched once for the user, even with several
+                # UserPagePermissionsProxy objects
+                page_perms = UserPagePermissionsProxy(event_moderator).for_page(page)
+                self.assertEqual(
+                    page_perms.can_publish(),
+                    page.path.startswith(events_page.path) and page.depth > 1,
+                )
+
+    def test_page_permission_lookup_updated_when_permissions_change(self):
+        event_moderator = get_user_model().objects.get(
+            email="eventmoderator@example.com"
+        )
+        about_us_page = Page.objects.get(url_path="/home/about-us/")
+
+        user_perms = UserPagePermissionsProxy(event_moderator)
+        self.assertFalse(user_perms.for_page(about_us_page).can_publish())
+
+        GroupPagePermission.objects.create(
+            group=Group.objects.get(name="Event moderators"),
+            page=about_us_page,
+            permission_type="publish",
+        )
+
+        user_perms = UserPagePermissionsProxy(event_moderator)
+        self.assertTrue(user_perms.for_page(about_us_page).can_publish())
+        self.assertTrue(
+            user_perms.publishable_pages().filter(id=about_us_page.id).exists()
+        )
+
+        event_moderator.groups.clear()
+
+        user_perms = UserPagePermissionsProxy(event_moderator)
+        self.assertFalse(user_perms.for_page(about_us_page).can_publish())
+        self.assertFalse(user_perms.publishable_pages().exists())
+
+    def test_page_permission_lookup(self):
+        lookup = PagePermissionLookup(
+            [
+                ("00010001", "edit"),
+                ("000100010001", "edit"),
+                ("000100010001", "publish"),
+                ("000100020003", "edit"),
+                ("000100020003", "add"),
+            ]
+        )
+
+        self.assertEqual(lookup.get_permissions("0001"), set())
+        self.assertEqual(lookup.get_permissions("00010001"), {"edit"})
+        self.assertEqual(
+            lookup.get_permissions("0001000100010004"), {"edit", "publish"}
+        )
+        self.assertEqual(lookup.get_permissions("00010002"), set())
+
+        # Pages within other pages with the same permission are left out
+        self.assertEqual(lookup.get_root_paths("edit"), ["00010001", "000100020003"])
+        self.assertEqual(
+            lookup.get_root_paths("add", "publish"), ["000100010001", "000100020003"]
+        )
+        self.assertEqual(lookup.get_root_paths("lock"), [])
+
+        self.assertEqual(lookup.get_ancestor_paths(), {"0001", "00010001", "00010002"})
+        self.assertEqual(lookup.get_common_ancestor_path(), "0001")
+
 
 class TestPagePermissionTesterCanCopyTo(TestCase):
     """Tests PagePermissionTester.can_copy_to()"""
@@ -2,14 +2,14 @@ from io import StringIO
 
 from django.contrib.contenttypes.models import ContentType
 from django.core import management
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from wagtail.blocks import StreamValue, StructValue
 from wagtail.documents import get_document_model
 from wagtail.documents.tests.utils import get_test_document_file
 from wagtail.images import get_image_model
 from wagtail.images.tests.utils import get_test_image_file
-from wagtail.models import Page, ReferenceIndex
+from wagtail.models import Page, PendingReferenceIndexUpdate, ReferenceIndex
 from wagtail.rich_text import RichText
 from wagtail.test.testapp.models import (
     Advert,
@@ -231,6 +231,69 @@ class TestCreateOrUpdateForObject(TestCase):
         refs = ReferenceIndex.get_references_to(content_type)
         self.assertEqual(refs.count(), 0)
 
+    def test_create_or_update_for_objects(self):
+        other_event_page = EventPage(
+            title="Other event page",
+            slug="other-event-page",
+            location="the moon",
+            audience="public",
+            cost="free",
+            date_from="2001-01-01",
+            feed_image=self.test_image_2,
+        )
+        self.root_page.add_child(instance=other_event_page)
+        ReferenceIndex.objects.all().delete()
+
+        ReferenceIndex.create_or_update_for_objects([self.event_page, other_event_page])
+
+        self.assertSetEqual(
+            set(
+                ReferenceIndex.get_references_for_object(self.event_page).values_list(
+                    "to_content_type", "to_object_id", "model_path", "content_path"
+                )
+            ),
+            self.expected_references,
+        )
+        self.assertSetEqual(
+            set(
+                ReferenceIndex.get_references_for_object(other_event_page).values_list(
+                    "to_content_type", "to_object_id", "model_path", "content_path"
+                )
+            ),
+            {
+                (
+                    self.image_content_type.id,
+                    str(self.test_image_2.pk),
+                    "feed_image",
+                    "feed_image",
+                ),
+            },
+        )
+
+    def test_rebuild_references_index_removes_stale_references(self):
+        stale_reference = ReferenceIndex.objects.create(
+            base_content_type=ReferenceIndex._get_base_content_type(self.event_page),
+            content_type=ContentType.objects.get_for_model(self.event_page),
+            object_id="999999",  # Page doesn't exist
+            to_content_type=self.image_content_type,
+            to_object_id=self.test_image_1.pk,
+            model_path="feed_image",
+            content_path="feed_image",
+            content_path_hash=ReferenceIndex._get_content_path_hash("feed_image"),
+        )
+
+        management.call_command("rebuild_references_index", stdout=StringIO())
+
+        self.assertFalse(ReferenceIndex.objects.filter(id=stale_reference.id).exists())
+        self.assertSetEqual(
+            set(
+                ReferenceIndex.get_references_for_object(self.event_page).values_list(
+                    "to_content_type", "to_object_id", "model_path", "content_path"
+                )
+            ),
+            self.expected_references,
+        )
+
     def test_rebuild_references_index_no_verbosity(self):
         stdout = StringIO()
         management.call_command(
@@ -241,6 +304,83 @@ class TestCreateOrUpdateForObject(TestCase):
         self.assertFalse(stdout.read())
 
 
+@override_settings(WAGTAIL_REFERENCE_INDEX_UPDATE_MODE="queue")
+class TestReferenceIndexQueue(TestCase):
+    def setUp(self):
+        self.image = get_image_model().objects.create(
+            title="Test image",
+            file=get_test_image_file(),
+        )
+        self.event_page = EventPage(
+            title="Event page",
+            slug="event-page",
+            location="the moon",
+            audience="public",
+            cost="free",
+            date_from="2001-01-01",
+        )
+        Page.objects.get(id=2).add_child(instance=self.event_page)
+        PendingReferenceIndexUpdate.objects.all().delete()
+
+    def test_save_queues_update(self):
+        self.event_page.feed_image = self.image
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event_page.save()
+            self.event_page.save()
+
+        # The references haven't been recorded yet, and the page is only queued once
+        self.assertEqual(ReferenceIndex.get_references_to(self.image).count(), 0)
+        self.assertEqual(
+            PendingReferenceIndexUpdate.objects.filter(
+                content_type=ContentType.objects.get_for_model(EventPage),
+                object_id=str(self.event_page.pk),
+            ).count(),
+            1,
+        )
+        self.assertTrue(ReferenceIndex.has_pending_updates())
+
+        management.call_command(
+            "process_reference_index_queue", verbosity=0, stdout=StringIO()
+        )
+
+        self.assertEqual(ReferenceIndex.get_references_to(self.image).count(), 1)
+        self.assertFalse(ReferenceIndex.has_pending_updates())
+
+    def test_has_pending_updates_for_object(self):
+        self.event_page.feed_image = self.image
+        ReferenceIndex.create_or_update_for_object(self.event_page)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event_page.save()
+
+        # Event pages are known to reference images, but not pages
+        self.assertTrue(ReferenceIndex.has_pending_updates(self.image))
+        self.assertFalse(ReferenceIndex.has_pending_updates(Page.objects.get(id=2)))
+
+        management.call_command(
+            "process_reference_index_queue", verbosity=0, stdout=StringIO()
+        )
+
+        self.assertFalse(ReferenceIndex.has_pending_updates(self.image))
+
+    def test_process_queue_for_deleted_object(self):
+        self.event_page.feed_image = self.image
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event_page.save()
+
+        ReferenceIndex.create_or_update_for_object(self.event_page)
+        self.event_page.delete()
+
+        management.call_command(
+            "process_reference_index_queue", verbosity=0, stdout=StringIO()
+        )
+
+        self.assertEqual(ReferenceIndex.get_references_to(self.image).count(), 0)
+        self.assertFalse(ReferenceIndex.has_pending_updates())
+
+
 class TestDescribeOnDelete(TestCase):
     fixtures = ["test.json"]
 
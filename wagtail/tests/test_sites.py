@@ -3,6 +3,7 @@ from django.test import TestCase, override_settings
 
 from wagtail.coreutils import get_dummy_request
 from wagtail.models import Page, Site
+from wagtail.models.sites import site_cache
 
 
 class TestSiteNaturalKey(TestCase):
@@ -152,6 +153,82 @@ class TestFindSiteForRequest(TestCase):
         self.assertEqual(Site.find_for_request(request), self.default_site)
 
 
+@override_settings(
+    WAGTAIL_SITE_CACHE_ENABLED=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class TestFindSiteForRequestWithSiteCache(TestFindSiteForRequest):
+    def setUp(self):
+        super().setUp()
+        Site.clear_site_cache()
+
+    def get_request(self, hostname="example.com", port=80):
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": hostname, "SERVER_PORT": port})
+        return request
+
+    def test_no_queries_after_warm_up(self):
+        Site.find_for_request(self.get_request())
+
+        with self.assertNumQueries(0):
+            site = Site.find_for_request(self.get_request())
+            self.assertEqual(site, self.site)
+            self.assertEqual(site.root_page.id, 2)
+
+            site = Site.find_for_request(self.get_request("unknown.com"))
+            self.assertEqual(site, self.default_site)
+
+    def test_returns_copies(self):
+        site = Site.find_for_request(self.get_request())
+        site.root_page.title = "Changed"
+
+        site = Site.find_for_request(self.get_request())
+        self.assertNotEqual(site.root_page.title, "Changed")
+
+    def test_root_page_attributes_not_shared(self):
+        site = Site.find_for_request(self.get_request())
+        site.root_page.specific.title = "Changed"
+
+        site = Site.find_for_request(self.get_request())
+        self.assertNotIn("specific", site.root_page.__dict__)
+
+    @override_settings(ALLOWED_HOSTS=["*"])
+    def test_only_exact_matches_remembered(self):
+        for number in range(10):
+            site = Site.find_for_request(self.get_request("unknown%d.com" % number))
+            self.assertEqual(site, self.default_site)
+        Site.find_for_request(self.get_request(port=8080))
+        Site.find_for_request(self.get_request())
+
+        self.assertEqual(list(site_cache.matches), [("example.com", 80)])
+
+    def test_invalidated_on_site_save(self):
+        self.assertEqual(Site.find_for_request(self.get_request(port=8080)), self.site)
+
+        other_site = Site.objects.create(
+            hostname="example.com", port=8080, root_page=Page.objects.get(pk=2)
+        )
+        self.assertEqual(Site.find_for_request(self.get_request(port=8080)), other_site)
+
+    def test_invalidated_on_site_delete(self):
+        self.assertEqual(Site.find_for_request(self.get_request()), self.site)
+
+        self.site.delete()
+        self.assertEqual(Site.find_for_request(self.get_request()), self.default_site)
+
+    def test_invalidated_by_other_process(self):
+        Site.find_for_request(self.get_request())
+
+        # Simulate another process changing the sites, by updating the database
+        # and the shared version key without touching this process's state
+        Site.objects.filter(id=self.site.id).update(hostname="other.com")
+        version = site_cache.version
+        site_cache.invalidate()
+        site_cache.version = version
+
+        self.assertEqual(Site.find_for_request(self.get_request()), self.default_site)
+
+
 class TestDefaultSite(TestCase):
     def test_create_default_site(self):
         Site.objects.all().delete()
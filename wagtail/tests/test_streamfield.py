@@ -178,6 +178,93 @@ class TestLazyStreamField(TestCase):
                 instance.save()
 
 
+class TestLazyDecodeStreamField(TestCase):
+    def setUp(self):
+        self.field = StreamField(
+            [
+                ("heading", blocks.CharBlock()),
+                ("text", blocks.CharBlock()),
+                ("list", blocks.ListBlock(blocks.CharBlock())),
+            ],
+            use_json_field=True,
+            lazy_decode=True,
+        )
+        self.raw_text = json.dumps(
+            [
+                {"type": "heading", "value": "A [tricky] {heading}", "id": "1"},
+                {"type": "list", "value": ["foo", "bar"], "id": "2"},
+                {"type": "text", "value": "baz", "id": "3"},
+                {"type": "unknown", "value": "qux", "id": "4"},
+                {"type": "text", "value": "quux", "id": "5"},
+            ]
+        )
+
+    def test_prefetch_limit(self):
+        value = self.field.to_python(self.raw_text)
+        self.assertEqual(value.prefetch_limit, StreamField.lazy_prefetch_limit)
+        value.prefetch_limit = 1
+
+        self.assertEqual(len(value), 4)
+        self.assertEqual(value[2].value, "baz")
+        self.assertIsNone(value._bound_blocks[3])
+        self.assertEqual(value[3].value, "quux")
+        self.assertIsNone(value._bound_blocks[0])
+        self.assertEqual(list(value[1].value), ["foo", "bar"])
+        self.assertEqual(
+            [child.block_type for child in value], ["heading", "list", "text", "text"]
+        )
+
+    def test_unpacked_value(self):
+        value = self.field.to_python(json.loads(self.raw_text))
+        self.assertEqual(value.prefetch_limit, StreamField.lazy_prefetch_limit)
+
+    def test_no_prefetch_limit_by_default(self):
+        field = StreamField([("text", blocks.CharBlock())], use_json_field=True)
+        value = field.to_python(self.raw_text)
+        self.assertIsNone(value.prefetch_limit)
+
+    def test_blocks_by_name(self):
+        value = self.field.to_python(self.raw_text)
+        self.assertEqual(
+            [child.value for child in value.blocks_by_name("text")], ["baz", "quux"]
+        )
+        self.assertIsNone(value._bound_blocks[0])
+
+    def test_raw_data(self):
+        value = self.field.to_python(self.raw_text)
+        value.raw_data[2]["value"] = "changed"
+        self.assertEqual(value[2].value, "changed")
+
+    def test_get_prep_value(self):
+        value = self.field.to_python(self.raw_text)
+        value[0].value = "Changed heading"
+        self.assertEqual(
+            json.loads(self.field.get_prep_value(value)),
+            [
+                {"type": "heading", "value": "Changed heading", "id": "1"},
+                {"type": "list", "value": ["foo", "bar"], "id": "2"},
+                {"type": "text", "value": "baz", "id": "3"},
+                {"type": "text", "value": "quux", "id": "5"},
+            ],
+        )
+
+    def test_equality(self):
+        self.assertEqual(
+            self.field.to_python(self.raw_text), self.field.to_python(self.raw_text)
+        )
+        self.assertNotEqual(
+            self.field.to_python(self.raw_text),
+            self.field.to_python(self.raw_text.replace("baz", "changed")),
+        )
+
+    def test_non_stream_values(self):
+        self.assertEqual(len(self.field.to_python("[]")), 0)
+        self.assertEqual(len(self.field.to_python("null")), 0)
+        value = self.field.to_python("<p>Not JSON</p>")
+        self.assertEqual(len(value), 0)
+        self.assertEqual(value.raw_text, "<p>Not JSON</p>")
+
+
 class TestSystemCheck(TestCase):
     def tearDown(self):
         # unregister InvalidStreamModel from the overall model registry
@@ -20,6 +20,7 @@ from wagtail.models import (
     PAGE_PERMISSION_TYPES,
     GroupPagePermission,
     Page,
+    clear_page_permission_lookups,
 )
 
 User = get_user_model()
@@ -400,6 +401,8 @@ class BaseGroupPagePermissionFormSet(forms.BaseFormSet):
                 for (page, permission_type) in permissions_to_add
             ]
         )
+        # bulk_create doesn't send post_save signals
+        clear_page_permission_lookups()
 
     def as_admin_panel(self):
         return render_to_string(
@@ -0,0 +1,72 @@
+import threading
+import weakref
+
+from django.db import transaction
+
+# The batches that are waiting to run, keyed by batch class, database alias and the
+# savepoints that they were registered within. These are weak references, so that
+# batches are forgotten as soon as Django discards their callbacks, when they run or are
+# rolled back
+_pending_batches = threading.local()
+
+
+class OnCommitBatch:
+    """
+    Base class for collecting the changes made within a transaction, to be handled
+    together once it is committed (or immediately, outside of a transaction). A batch
+    is registered as an on_commit callback, so that it is discarded along with the
+    transaction (or savepoint) if it is rolled back.
+
+    Subclasses implement ``add()``, which records a change, and ``run()``, which
+    handles the changes that have been recorded.
+    """
+
+    def __init__(self):
+        self.done = False
+
+    def add(self, *args, **kwargs):
+        raise NotImplementedError
+
+    def run(self):
+        raise NotImplementedError
+
+    def __call__(self):
+        self.done = True
+        self.run()
+
+    @classmethod
+    def get_current(cls, using=None):
+        """
+        Return the batch of this class registered with the current savepoint (or
+        transaction) on the given database connection, or None if there isn't one.
+        """
+        connection = transaction.get_connection(using)
+        batches = getattr(_pending_batches, "batches", None)
+        if batches is None:
+            return None
+
+        batch = batches.get((cls, connection.alias, tuple(connection.savepoint_ids)))
+        if batch is not None and not batch.done:
+            return batch
+
+    @classmethod
+    def add_to_current(cls, *args, using=None, **kwargs):
+        """
+        Add a change to the current batch of this class, registering a new batch with
+        the current savepoint (or transaction) if there isn't one.
+        """
+        batch = cls.get_current(using)
+        if batch is not None:
+            batch.add(*args, **kwargs)
+            return
+
+        connection = transaction.get_connection(using)
+        batch = cls()
+        batch.add(*args, **kwargs)
+        if not hasattr(_pending_batches, "batches"):
+            _pending_batches.batches = weakref.WeakValueDictionary()
+        _pending_batches.batches[
+            (cls, connection.alias, tuple(connection.savepoint_ids))
+        ] = batch
+        # Outside of a transaction, this runs the batch immediately
+        transaction.on_commit(batch, using=using)
@@ -4,7 +4,7 @@ from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
 from django.utils.http import url_has_allowed_host_and_scheme
 
-from wagtail import hooks
+from wagtail import hooks, routing_index
 from wagtail.forms import PasswordViewRestrictionForm
 from wagtail.models import Page, PageViewRestriction, Site
 
@@ -16,9 +16,18 @@ def serve(request, path):
         raise Http404
 
     path_components = [component for component in path.split("/") if component]
-    page, args, kwargs = site.root_page.localized.specific.route(
-        request, path_components
-    )
+    root_page = site.root_page.localized
+
+    if routing_index.routing_index_enabled():
+        page = routing_index.lookup(site, root_page, path_components)
+        if page is not None:
+            args, kwargs = [], {}
+        else:
+            route_result = root_page.specific.route(request, path_components)
+            routing_index.record(site, root_page, route_result)
+            page, args, kwargs = route_result
+    else:
+        page, args, kwargs = root_page.specific.route(request, path_components)
 
     for fn in hooks.get_hooks("before_serve_page"):
         result = fn(page, request, args, kwargs)